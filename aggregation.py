@@ -0,0 +1,107 @@
+# 버그/QA 번호별 집계 관련
+
+import logging
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# 집계 함수: 'join'은 정렬된 고유 값을 ', '로 연결, 그 외는 pandas groupby 집계 함수
+AGGREGATE_FUNCS = ("count", "nunique", "min", "max", "first", "last", "join")
+JOIN_SEPARATOR = ', '
+
+
+@dataclass
+class Aggregate:
+    """column 값을 ID별로 func 집계하여 name 컬럼으로 출력"""
+    name: str
+    column: str
+    func: str
+
+    def __post_init__(self):
+        if self.func not in AGGREGATE_FUNCS:
+            raise ValueError(f"未対応の集計関数です: {self.func}")
+
+
+def aggregate_from_config(spec: dict) -> Aggregate:
+    """
+    설정값 하나로 집계 생성.
+    예: {"name": "初回実施日", "column": "実施日", "func": "min"}
+    """
+    return Aggregate(**spec)
+
+
+def build_aggregates(config, extra_key, reserved=()) -> list:
+    """
+    기본 집계(件数, 試験名 목록) + 설정(extra_key)에 추가된 집계.
+    잘못된 설정이나 출력 컬럼명이 기존 컬럼(reserved)과 겹치는 설정은 경고 후 무시
+    """
+    test_name_col = config["test_name_column"]
+    aggregates = [
+        Aggregate('件数', config["test_id_column"], "count"),
+        Aggregate(test_name_col, test_name_col, "join"),
+    ]
+    names = {aggregate.name for aggregate in aggregates} | set(reserved)
+    for spec in config.get(extra_key) or []:
+        try:
+            aggregate = aggregate_from_config(spec)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"集計の設定が不正なため無視します: {spec} ({str(e)})")
+            continue
+        if aggregate.name in names:
+            logger.warning(f"集計の出力カラム名が重複しているため無視します: {aggregate.name}")
+            continue
+        names.add(aggregate.name)
+        aggregates.append(aggregate)
+    return aggregates
+
+
+def aggregate_by_key(df: pd.DataFrame, key, aggregates) -> pd.DataFrame:
+    """
+    key 컬럼 값별로 모든 집계를 한 번의 그룹화(factorize)로 계산.
+    key가 빈 행은 제외하고, 결과는 key 오름차순. 컬럼은 [key] + 각 집계의 name.
+    """
+    columns = [key] + [aggregate.name for aggregate in aggregates]
+    missing = [col for col in [key] + [aggregate.column for aggregate in aggregates] if col not in df.columns]
+    if missing:
+        raise KeyError(missing[0])
+
+    keyed = df[df[key].notna()]
+    if keyed.empty:
+        return pd.DataFrame(columns=columns)
+
+    codes, uniques = pd.factorize(keyed[key], sort=True)
+    if isinstance(uniques.dtype, pd.CategoricalDtype):
+        # 집계 결과의 ID는 category가 아닌 원래 값 타입으로 반환
+        uniques = uniques.astype(uniques.categories.dtype)
+    num_groups = len(uniques)
+    grouped = keyed.groupby(codes, sort=True)
+
+    result = {key: uniques}
+    for aggregate in aggregates:
+        if aggregate.func == "join":
+            result[aggregate.name] = _join_unique(codes, keyed[aggregate.column], num_groups)
+        else:
+            values = grouped[aggregate.column].agg(aggregate.func)
+            result[aggregate.name] = values.reindex(range(num_groups)).to_numpy()
+    return pd.DataFrame(result, columns=columns)
+
+
+def _join_unique(codes, values: pd.Series, num_groups) -> list:
+    """그룹별 ', '.join(sorted(set(값.dropna().astype(str)))) 와 같은 결과 (값이 없으면 '')"""
+    present = values.notna().to_numpy()
+    pairs = pd.DataFrame({
+        'code': codes[present],
+        'value': values[present].astype(str).to_numpy(),
+    }).drop_duplicates().sort_values(['code', 'value'], kind='stable')
+
+    joined = [''] * num_groups
+    if pairs.empty:
+        return joined
+    group_codes = pairs['code'].to_numpy()
+    boundaries = np.flatnonzero(np.diff(group_codes)) + 1
+    starts = np.concatenate(([0], boundaries))
+    for code, chunk in zip(group_codes[starts], np.split(pairs['value'].to_numpy(), boundaries)):
+        joined[code] = JOIN_SEPARATOR.join(chunk)
+    return joined
@@ -0,0 +1,294 @@
+# 집계/납품 작업 성능 측정 (end-to-end 벤치마크)
+#
+# 사용 예 (리포지토리 루트에서 실행):
+#   python benchmarks/run_benchmarks.py                                  # 기본 크기로 측정, benchmarks/results/ 에 JSON 출력
+#   python benchmarks/run_benchmarks.py --sizes 10x1000 50x5000 --repeat 3 --output before.json
+#   python benchmarks/run_benchmarks.py --output after.json --baseline before.json
+#
+# 크기는 "파일 수x행 수" 형식. 생성한 데이터는 --corpus-dir 에 크기별로 보관하여 재사용한다.
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import platform
+import argparse
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, "test_data"))
+
+import pandas as pd
+from config import DEFAULT_CONFIG
+from data_collector import DataCollector
+from result_index import ResultIndex
+from result_cache import clear_shared_caches
+from delivery_helper import DeliveryHelper, DELIVERY_TRANSFORMS
+from test_data_generator import generate_corpus
+
+DEFAULT_SIZES = ["3x50", "20x1000", "50x5000"]
+
+# 직전 측정이 채운 캐시(공유 캐시·파싱 캐시)를 그대로 사용하는 단계. 나머지 집계 단계는 모두 캐시를 비운 뒤 측정(cold)
+WARM_STAGES = ("collect_warm",)
+
+
+def parse_size(size):
+    """'20x1000' -> (20, 1000)"""
+    files, rows = size.lower().split("x")
+    return int(files), int(rows)
+
+
+def _timed(timings, stage, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    timings[stage] = time.perf_counter() - start
+    return result
+
+
+def _cold_config(config, work_dir, name):
+    """파싱 캐시를 사용하는 설정이면 비어 있는 임시 폴더를 사용하도록 바꾼 설정 반환"""
+    if not config.get("parse_cache_dir"):
+        return config
+    return dict(config, parse_cache_dir=os.path.join(work_dir, name))
+
+
+def run_collector_stages(folder, config):
+    """
+    DataCollector 단계별 소요 시간(초) 측정.
+    반복 측정이 앞선 측정의 캐시를 재사용하지 않도록, 프로세스 공유 캐시(버그/QA 리스트 등)를 비우고
+    파싱 캐시는 빈 임시 폴더를 사용한 상태(cold)에서 측정한다. collect_warm 만 직전 collect_total 이
+    채운 캐시를 그대로 사용한 시간(warm). OS의 파일 캐시는 비우지 않는다.
+    """
+    timings = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        stage_config = _cold_config(config, work_dir, "stages")
+        clear_shared_caches()
+        collector = DataCollector(folder, stage_config)
+
+        def scan():
+            excel_files = collector._get_excel_files()
+            return excel_files + collector._get_external_files(excel_files)
+
+        excel_files = _timed(timings, "scan", scan)
+        merged_data = _timed(timings, "read", collector._collect_excel_data, excel_files)
+        collector.merged_df = _timed(timings, "merge", collector._merge_data, merged_data)
+        collector.merged_df = _timed(timings, "compact", collector._compact_merged_data, collector.merged_df)
+        _timed(timings, "summary", collector._create_summary_dataframe)
+        _timed(timings, "validation", collector._validate)
+        _timed(timings, "bug_table", collector._create_bug_table)
+        _timed(timings, "qa_table", collector._create_qa_table)
+
+        def ok_tables():
+            ok_table = collector._create_ok_table(collector._create_result_cube())
+            collector._compute_cumulative_ok(ok_table)
+            collector._compute_daily_ok(ok_table)
+
+        _timed(timings, "ok_tables", ok_tables)
+        _timed(timings, "index", ResultIndex, collector.merged_df, stage_config)
+
+        # 지연 계산되는 표까지 모두 계산한 시간 (위 단계들이 채운 캐시도 비운 뒤 측정)
+        total_config = _cold_config(config, work_dir, "total")
+        clear_shared_caches()
+        _timed(timings, "collect_total", lambda: DataCollector(folder, total_config).collect_data().materialize())
+        _timed(timings, "collect_warm", lambda: DataCollector(folder, total_config).collect_data().materialize())
+    clear_shared_caches()
+    return timings
+
+
+def run_delivery_stages(folder, config=None):
+    """
+    DeliveryHelper 작업별 소요 시간(초) 측정 (원본 보호를 위해 복사본에서 실행).
+    작업별로 따로 실행한 시간과, 파일마다 한 번 열어 모든 작업을 적용한 시간(single_pass),
+    그것을 CPU 코어 수만큼의 프로세스로 병렬 처리한 시간(parallel)을 측정
+    """
+    timings = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        target = os.path.join(work_dir, "delivery")
+        shutil.copytree(folder, target)
+        helper = DeliveryHelper(target, config)
+        start = time.perf_counter()
+        _timed(timings, "fill_blank", helper.fill_blank_cells_in_range)
+        _timed(timings, "align", helper.align_cells_left_top)
+        _timed(timings, "font", helper.set_font_to_meiryo)
+        _timed(timings, "zoom", helper.set_zoom_to_100)
+        timings["delivery_total"] = time.perf_counter() - start
+
+        single_target = os.path.join(work_dir, "delivery_single")
+        shutil.copytree(folder, single_target)
+        _timed(timings, "single_pass", DeliveryHelper(single_target, config).run, list(DELIVERY_TRANSFORMS))
+
+        parallel_target = os.path.join(work_dir, "delivery_parallel")
+        shutil.copytree(folder, parallel_target)
+        parallel_config = dict(config or DEFAULT_CONFIG, delivery_workers=0)
+        _timed(timings, "parallel", DeliveryHelper(parallel_target, parallel_config).run, list(DELIVERY_TRANSFORMS))
+    return timings
+
+
+def _summarize(runs):
+    """반복 측정 결과를 단계별 min/median으로 정리"""
+    stages = {}
+    for stage in runs[0]:
+        values = [run[stage] for run in runs]
+        stages[stage] = {"min": min(values), "median": statistics.median(values), "runs": values}
+    return stages
+
+
+def prepare_corpus(corpus_dir, files, rows, extra_columns, invalid_rate, missing_rate, regenerate=False):
+    """크기별 데이터 폴더 준비 (이미 있으면 재사용)"""
+    folder = os.path.join(corpus_dir, f"f{files}_r{rows}_c{extra_columns}_i{invalid_rate}_m{missing_rate}")
+    if os.path.exists(folder) and not regenerate:
+        return folder
+    shutil.rmtree(folder, ignore_errors=True)
+    generate_corpus(
+        output_dir=folder,
+        files=files,
+        rows=rows,
+        extra_columns=extra_columns,
+        invalid_rate=invalid_rate,
+        missing_rate=missing_rate,
+        num_bugs=max(30, files * rows // 50),
+        num_qas=max(40, files * rows // 50),
+        seed=0,
+        engine="xlsxwriter"
+    )
+    return folder
+
+
+def run_suite(sizes, corpus_dir, repeat=1, extra_columns=5, invalid_rate=0.01, missing_rate=0.1,
+              config_overrides=None, include_delivery=True, regenerate=False):
+    """모든 크기에 대해 측정하고 결과(dict)를 반환"""
+    config = dict(DEFAULT_CONFIG, parse_cache_dir="")
+    config.update(config_overrides or {})
+    results = []
+    for size in sizes:
+        files, rows = parse_size(size)
+        folder = prepare_corpus(corpus_dir, files, rows, extra_columns, invalid_rate, missing_rate, regenerate)
+        print(f"[{size}] 集計を計測中...", file=sys.stderr)
+        collector_runs = [run_collector_stages(folder, config) for _ in range(repeat)]
+        entry = {
+            "size": size,
+            "files": files,
+            "rows": rows,
+            "extra_columns": extra_columns,
+            "collector": _summarize(collector_runs),
+        }
+        for stage, stats in entry["collector"].items():
+            stats["cache"] = "warm" if stage in WARM_STAGES else "cold"
+        if include_delivery:
+            print(f"[{size}] 納品作業を計測中...", file=sys.stderr)
+            entry["delivery"] = _summarize([run_delivery_stages(folder, config) for _ in range(repeat)])
+        results.append(entry)
+    return {"meta": _environment(config, repeat), "results": results}
+
+
+def _environment(config, repeat):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "warm_stages": list(WARM_STAGES),
+        "config": {key: config.get(key) for key in ["ingest_workers", "excel_engine", "projected_read", "parse_cache_dir"]},
+    }
+
+
+def compare(current, baseline):
+    """기준 결과와 비교한 표(DataFrame) 반환. ratio < 1 이면 빨라진 것"""
+    def flatten(report):
+        rows = {}
+        for entry in report["results"]:
+            for group in ("collector", "delivery"):
+                for stage, stats in entry.get(group, {}).items():
+                    rows[(entry["size"], group, stage)] = stats["min"]
+        return rows
+
+    current_rows, baseline_rows = flatten(current), flatten(baseline)
+    records = []
+    for key, seconds in current_rows.items():
+        if key in baseline_rows:
+            base = baseline_rows[key]
+            records.append({
+                "size": key[0], "group": key[1], "stage": key[2],
+                "baseline": round(base, 4), "current": round(seconds, 4),
+                "ratio": round(seconds / base, 2) if base else None,
+            })
+    return pd.DataFrame(records)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="集計・納品作業の処理時間を計測し、JSONで出力します。")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="計測する規模 (ファイル数x行数)")
+    parser.add_argument("--repeat", type=int, default=1, help="各規模の繰り返し回数")
+    parser.add_argument("--extra-columns", type=int, default=5, help="集計に使わない追加列の数")
+    parser.add_argument("--invalid-rate", type=float, default=0.01, help="不正な試験結果の割合")
+    parser.add_argument("--missing-rate", type=float, default=0.1, help="番号未入力の割合")
+    parser.add_argument("--workers", type=int, help="ingest_workers の値")
+    parser.add_argument("--engine", choices=["openpyxl", "xml"], help="excel_engine の値")
+    parser.add_argument("--skip-delivery", action="store_true", help="納品作業の計測を省略")
+    parser.add_argument("--corpus-dir", default=os.path.join(tempfile.gettempdir(), "tmt_bench_corpus"), help="生成データの保存先")
+    parser.add_argument("--regenerate", action="store_true", help="生成データを作り直す")
+    parser.add_argument("--output", help="結果JSONの出力先 (既定: benchmarks/results/bench_<日時>.json)")
+    parser.add_argument("--baseline", help="比較する基準結果JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # DeliveryHelper는 현재 폴더의 config.json을 읽으므로 루트에서 실행
+    os.chdir(ROOT_DIR)
+    # 파일별 읽기 완료 등의 로그는 측정 출력에서 제외
+    logging.getLogger().setLevel(logging.ERROR)
+
+    overrides = {}
+    if args.workers is not None:
+        overrides["ingest_workers"] = args.workers
+    if args.engine:
+        overrides["excel_engine"] = args.engine
+    report = run_suite(
+        args.sizes,
+        args.corpus_dir,
+        repeat=args.repeat,
+        extra_columns=args.extra_columns,
+        invalid_rate=args.invalid_rate,
+        missing_rate=args.missing_rate,
+        config_overrides=overrides,
+        include_delivery=not args.skip_delivery,
+        regenerate=args.regenerate,
+    )
+
+    output = args.output or os.path.join(ROOT_DIR, "benchmarks", "results", f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"計測結果: {os.path.abspath(output)}")
+
+    for entry in report["results"]:
+        timings = {stage: stats["min"] for group in ("collector", "delivery") for stage, stats in entry.get(group, {}).items()}
+        print(f"[{entry['size']}] " + ", ".join(
+            f"{stage}={seconds:.3f}s" + (" (warm)" if stage in WARM_STAGES else "") for stage, seconds in timings.items()
+        ))
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(compare(report, baseline).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
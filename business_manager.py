@@ -1,5 +1,9 @@
+import os
 from data_collector import DataCollector, DataTestResult
 from delivery_helper import DeliveryHelper
+from folder_watcher import FolderWatcher
+from result_cache import get_shared_result_cache
+from reporter import StreamlitReporter
 from folder_selector import select_folder
 from config import save_config
 
@@ -9,24 +13,88 @@ class BusinessManager:
     def __init__(self, config):
         self.config = config
     
-    def collect_data(self, selected_folder_path) -> DataTestResult:
-        """데이터 수집 및 처리"""
-        data_collector = DataCollector(
+    def create_collector(self, selected_folder_path) -> DataCollector:
+        """설정값으로 DataCollector 생성"""
+        return DataCollector(
             selected_folder_path,
             self.config,
             bug_list_folder=self.config.get("bug_list_folder", ""),
-            qa_list_folder=self.config.get("qa_list_folder", "")
+            qa_list_folder=self.config.get("qa_list_folder", ""),
+            reporter=StreamlitReporter()
+        )
+    
+    def collect_data(self, selected_folder_path) -> DataTestResult:
+        """데이터 수집 및 처리"""
+        return self.create_collector(selected_folder_path).collect_data()
+    
+    def load_collector(self, selected_folder_path) -> DataCollector:
+        """
+        공유 결과 캐시를 통해 데이터 수집.
+        같은 폴더 내용과 설정이면 다른 세션/재실행의 수집 결과를 재사용하고,
+        동시에 요청된 같은 폴더의 수집은 하나만 실행된다.
+        캐시에는 어느 세션도 갱신하지 않는 원본을 두고, 세션에는 원본의 사본(fork)을 반환한다.
+        """
+        data_collector = self.create_collector(selected_folder_path)
+        if not selected_folder_path or not os.path.isdir(selected_folder_path):
+            # 오류 메시지를 요청한 세션에 표시하기 위해 캐시하지 않음
+            data_collector.collect_data()
+            return data_collector
+
+        result_cache = self._result_cache()
+        fingerprint = data_collector.fingerprint()
+        computed = []
+
+        def compute():
+            # 캐시 키(지문) 계산 시의 폴더 검색 결과를 수집에 그대로 사용
+            data_collector.collect_data(reuse_scan=True)
+            # 나중에 계산되는 표(지연 필드)도 메모리 예산에 포함되도록 계산될 때마다 크기를 다시 잰다
+            data_collector.test_result.add_compute_listener(lambda result, name: result_cache.resize(fingerprint))
+            computed.append(True)
+            return data_collector
+
+        forked = result_cache.get_or_compute(fingerprint, compute).fork(reporter=data_collector.reporter)
+        if not computed:
+            # 다른 세션/이전 실행이 수집한 결과: 이 세션의 화면과 로그에도 검증 결과(번호 미입력 등)를 알림
+            forked.report_findings()
+        return forked
+
+    def _result_cache(self):
+        return get_shared_result_cache(
+            max_entries=int(self.config.get("result_cache_max_entries", 4)),
+            max_bytes=int(self.config.get("result_cache_max_mb", 1024)) * 1024 ** 2,
+            sizeof=lambda collector: collector.memory_usage()
         )
-        return data_collector.collect_data()
-    
-    def process_delivery(self, selected_folder_path):
-        """납품 작업 처리"""
-        delivery_helper = DeliveryHelper(selected_folder_path)
-        delivery_helper.fill_blank_cells_in_range()
-        delivery_helper.align_cells_left_top()
-        delivery_helper.set_font_to_meiryo()
-        delivery_helper.set_zoom_to_100()
-        return True
+    
+    def start_watch(self, data_collector) -> FolderWatcher:
+        """수집 대상 폴더(시험 폴더, 버그/QA 리스트 폴더) 감시 시작"""
+        watcher = FolderWatcher([
+            data_collector.selected_folder_path,
+            data_collector.bug_list_folder,
+            data_collector.qa_list_folder
+        ])
+        watcher.start()
+        return watcher
+    
+    def refresh_data(self, data_collector, watcher) -> DataTestResult:
+        """
+        감시 중 변경된 파일만 다시 읽어 결과 갱신 (세션의 사본만 갱신).
+        폴더 내용이 바뀌었으므로 이전 지문의 공유 캐시 항목은 제거한다
+        """
+        changed_paths = watcher.drain_changes()
+        if not changed_paths:
+            return data_collector.test_result
+        previous = data_collector.test_result.fingerprint if data_collector.test_result is not None else ""
+        test_result = data_collector.refresh(changed_paths)
+        if previous and test_result.fingerprint != previous:
+            self._result_cache().invalidate(previous)
+        return test_result
+    
+    def process_delivery(self, selected_folder_path, on_result=None):
+        """납품 작업 처리 (파일별 결과 목록 반환)"""
+        # 파일마다 한 번 열어 설정된 작업(空白埋め, 整列, フォント, 拡大比率)을 모두 적용
+        # delivery_workers가 2 이상이면 파일을 프로세스 풀에서 병렬 처리, 결과는 on_result로 하나씩 전달
+        delivery_helper = DeliveryHelper(selected_folder_path, self.config)
+        return delivery_helper.run(on_result=on_result)
     
     def select_folder(self):
         """폴더 선택"""
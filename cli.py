@@ -0,0 +1,92 @@
+# 헤드리스 일괄 집계 (Streamlit 없이 cron / CI에서 실행)
+#
+# 사용 예:
+#   python cli.py D:\test_data --output result.xlsx
+#   python cli.py --parquet-dir out\ --workers 4
+#   python cli.py --csv-dir out\   (Excel の最大行数を超える大きなデータ向け)
+#
+# 종료 코드: 0 = 정상, 1 = 검증 실패(부적절한 시험 결과, 번호 미입력 등), 2 = 수집 실패
+
+import argparse
+import multiprocessing
+import os
+import sys
+from datetime import datetime
+from config import load_config
+from data_collector import DataCollector
+from reporter import ConsoleReporter
+from result_exporter import write_result_workbook, write_result_parquet, write_result_csv
+from validation import FINDING_RULE
+
+EXIT_OK = 0
+EXIT_VALIDATION_FAILED = 1
+EXIT_COLLECTION_FAILED = 2
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="試験表を集計し、結果をExcel/Parquet/CSVで出力します。")
+    parser.add_argument("folder", nargs="?", help="試験表フォルダー (省略時は設定の selected_folder_path)")
+    parser.add_argument("--bug-list-folder", help="内部バグリストのフォルダー (省略時は設定値)")
+    parser.add_argument("--qa-list-folder", help="内部QAリストのフォルダー (省略時は設定値)")
+    parser.add_argument("--output", help="結果Excelファイルの出力先")
+    parser.add_argument("--parquet-dir", help="結果をシート別Parquetファイルで出力するフォルダー")
+    parser.add_argument("--csv-dir", help="結果をシート別CSVファイルで出力するフォルダー")
+    parser.add_argument("--workers", type=int, help="並列読み込みのプロセス数 (設定値 ingest_workers を上書き)")
+    parser.add_argument("--no-cache", action="store_true", help="パースキャッシュを使用しない")
+    return parser.parse_args(argv)
+
+
+def run(argv=None, stream=None):
+    """일괄 집계 실행 후 종료 코드 반환"""
+    args = parse_args(argv)
+    stream = stream if stream is not None else sys.stdout
+    config, _ = load_config()
+    config = dict(config)
+    if args.workers is not None:
+        config["ingest_workers"] = args.workers
+    if args.no_cache:
+        config["parse_cache_dir"] = ""
+
+    reporter = ConsoleReporter()
+    data_collector = DataCollector(
+        args.folder or config.get("selected_folder_path", ""),
+        config,
+        bug_list_folder=args.bug_list_folder or config.get("bug_list_folder", ""),
+        qa_list_folder=args.qa_list_folder or config.get("qa_list_folder", ""),
+        reporter=reporter
+    )
+    test_result = data_collector.collect_data()
+    if test_result.summary_df.empty:
+        print("集計できるデータがありませんでした。", file=stream)
+        return EXIT_COLLECTION_FAILED
+
+    # 결과 출력 (출력처가 지정되지 않으면 현재 폴더에 엑셀 파일 출력)
+    output = args.output
+    if not output and not args.parquet_dir and not args.csv_dir:
+        output = f"result_{datetime.today().strftime('%Y%m%d_%H%M')}.xlsx"
+    if output:
+        write_result_workbook(test_result, output)
+        print(f"Excel出力: {os.path.abspath(output)}", file=stream)
+    if args.parquet_dir:
+        for file_path in write_result_parquet(test_result, args.parquet_dir):
+            print(f"Parquet出力: {os.path.abspath(file_path)}", file=stream)
+    if args.csv_dir:
+        for file_path in write_result_csv(test_result, args.csv_dir):
+            print(f"CSV出力: {os.path.abspath(file_path)}", file=stream)
+
+    total_row = test_result.summary_df.iloc[-1]
+    print(f"試験表: {len(test_result.summary_df) - 1}件, 総項目数: {int(total_row['総項目数'])}, 進捗率: {total_row['進捗率(%)']}%", file=stream)
+
+    # 규칙별 검증 실패 건수 (설정으로 추가한 규칙 포함)
+    rule_counts = test_result.findings[FINDING_RULE].value_counts(sort=False)
+    for rule_name, count in rule_counts.items():
+        print(f"{rule_name}: {count}件", file=stream)
+    if not test_result.findings.empty or reporter.error_count:
+        return EXIT_VALIDATION_FAILED
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    # 실행 파일(PyInstaller)로 빌드한 경우 파일 읽기 프로세스 풀의 워커 처리
+    multiprocessing.freeze_support()
+    sys.exit(run())
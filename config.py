@@ -21,7 +21,30 @@ DEFAULT_CONFIG = {
     "qa_regex": "内部QA#(\\d+)",
     "bug_regex": "内部バグ#(\\d+)",
     "bug_file_columns": ["No", "ステータス", "概要", "JIRA#"],
-    "qa_file_columns": ["No", "コメント", "質問者", "回答", "ステータス"]
+    "qa_file_columns": ["No", "コメント", "質問者", "回答", "ステータス"],
+    "ingest_workers": 1,
+    "parse_cache_dir": ".tmt_cache",
+    "watch_interval_seconds": 5,
+    "result_cache_max_entries": 4,
+    "result_cache_max_mb": 1024,
+    "projected_read": True,
+    "excel_engine": "openpyxl",
+    "file_name_column": "ファイル名",
+    "validation_rules": [],
+    "bug_extra_aggregates": [],
+    "qa_extra_aggregates": [],
+    "compact_schema": True,
+    "display_sections": ["summary", "detail", "bug_table", "qa_table", "charts", "export"],
+    "export_cache_max_entries": 4,
+    "export_cache_max_mb": 256,
+    "ok_velocity_window": 7,
+    "external_list_cache_max_entries": 8,
+    "external_list_cache_max_mb": 256,
+    "scan_include": ["*.xlsx"],
+    "scan_exclude": ["*backup*/", "*バックアップ*/"],
+    "delivery_transforms": ["fill_blank", "align", "font", "zoom"],
+    "delivery_workers": 1,
+    "diagnostics_trace_memory": False
 }
 
 
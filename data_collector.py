@@ -1,52 +1,43 @@
 import os
 import re
+import copy
+import time
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
 from datetime import datetime
-import streamlit as st
-from table_creator import BugTableCreator, QATableCreator
-from dataclasses import dataclass
-from typing import Protocol
+from table_creator import BugTableCreator, QATableCreator, index_by_no
+from parse_cache import ParseCache, config_hash
+from reporter import LoggingReporter
+from dir_scanner import DirectoryScanner
+from result_cache import get_shared_cache
+from excel_reader import read_sheet, SheetNotFoundError
+from diagnostics import Diagnostics
+from frame_schema import compact_frame
+from result_index import ResultIndex
+from result_cube import build_result_cube, ok_counts
+from ok_calculator import OKCalculator, BaseOKCalculator, CumulativeOKCalculator, DailyOKCalculator, WeeklyBurnUpCalculator, MovingAverageVelocityCalculator
+from validation import Validator, build_rules, empty_findings, FINDING_RULE, FINDING_FILE, FINDING_TEST_ID, FINDING_VALUE, RULE_INVALID_RESULT, RULE_QA_NO_MISSING, RULE_BUG_NO_MISSING
+from dataclasses import dataclass, field, fields, MISSING
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s]: %(levelname)s - %(filename)s\n Line:%(lineno)d: %(message)s')
 logger = logging.getLogger(__name__)
 
-class OKCalculator(Protocol):
-    """OK 계산 전략 인터페이스"""
-    def calculate(self, df: pd.DataFrame, config: dict) -> pd.DataFrame:
-        """데이터프레임을 받아 계산된 결과를 반환"""
-        pass
-
-class BaseOKCalculator:
-    """기본 OK 계산 클래스"""
-    def _prepare_data(self, df: pd.DataFrame, config: dict) -> pd.DataFrame:
-        """공통 데이터 전처리"""
-        if df.empty:
-            return pd.DataFrame()
-        df = df.copy()
-        return df
-
-class CumulativeOKCalculator(BaseOKCalculator, OKCalculator):
-    """누적 OK 계산 전략"""
-    def calculate(self, df: pd.DataFrame, config: dict) -> pd.DataFrame:
-        df = self._prepare_data(df, config)
-        if df.empty:
-            return df
-        df['OK_cumulative'] = df['OK'].cumsum()
-        return df[[config["date_column"], 'OK_cumulative']]
-
-class DailyOKCalculator(BaseOKCalculator, OKCalculator):
-    """일별 OK 계산 전략"""
-    def calculate(self, df: pd.DataFrame, config: dict) -> pd.DataFrame:
-        df = self._prepare_data(df, config)
-        if df.empty:
-            return df
-        return df[[config["date_column"], 'OK']]
+# 버그/QA 리스트의 읽기 결과에 영향을 주는 설정 키 (리스트 캐시 키에 포함)
+EXTERNAL_LIST_CONFIG_KEYS = ["bug_file_name", "qa_file_name", "bug_file_columns", "qa_file_columns", "projected_read", "excel_engine"]
 
 @dataclass
 class DataTestResult:
-    """테스트 결과를 담는 데이터 클래스"""
+    """
+    테스트 결과를 담는 데이터 클래스.
+    lazy()로 생성하면 builders에 지정된 필드는 처음 접근할 때 계산되어 저장(메모이즈)된다.
+    화면에 표시하지 않는 표(버그/QA 테이블 등)는 계산하지 않는다.
+    """
     summary_df: pd.DataFrame
     merged_df: pd.DataFrame
     bug_table: pd.DataFrame
@@ -54,10 +45,168 @@ class DataTestResult:
     ok_table: pd.DataFrame
     cumulative_ok_df: pd.DataFrame
     daily_ok_df: pd.DataFrame
+    # 검증 결과 (ファイル名, 行番号, テストID, ルール, 値)
+    findings: pd.DataFrame = field(default_factory=empty_findings)
+    # 수집 처리의 단계별/파일별 소요 시간
+    diagnostics: Optional[Diagnostics] = None
+    # 정규식과 일치하지 않아 버그/QA 목록과 연결하지 못한 ID (種別, ID, 件数, 試験名)
+    unmatched_ids: pd.DataFrame = field(default_factory=pd.DataFrame)
+    # 날짜 × 시험 결과 건수 (OK 테이블, 날짜별 시험 결과 일람, 그래프의 공통 입력)
+    result_cube: pd.DataFrame = field(default_factory=pd.DataFrame)
+    # 주별 번업 (주 시작일, OK, OK_cumulative)과 이동 평균 속도 (날짜, OK_velocity)
+    weekly_ok_df: pd.DataFrame = field(default_factory=pd.DataFrame)
+    ok_velocity_df: pd.DataFrame = field(default_factory=pd.DataFrame)
+    # 결과를 만든 폴더 내용과 설정값의 지문 (출력 캐시 키 등, 빈 값이면 알 수 없음)
+    fingerprint: str = ""
+    # 상세 보기용 행 인덱스 (버그/QA 번호, 시험 결과, 파일 → merged_df 행 위치)
+    # (지연 필드는 클래스 속성으로 기본값이 남지 않도록 default_factory 사용)
+    row_index: Optional[ResultIndex] = field(default_factory=lambda: None)
+
+    @classmethod
+    def lazy(cls, builders, **values):
+        """
+        지연 계산 결과 생성.
+        builders: {필드명: 결과 객체를 받아 값을 반환하는 함수}. 다른 필드가 필요하면 결과 객체에서 읽는다.
+        values: 바로 저장할 필드 값 (builders에도 values에도 없는 필드는 기본값)
+        """
+        shadowed = [name for name in builders if hasattr(cls, name)]
+        if shadowed:
+            raise TypeError(f"クラス属性の既定値がある項目は遅延計算できません: {shadowed}")
+        result = cls.__new__(cls)
+        for result_field in fields(cls):
+            if result_field.name in values:
+                value = values[result_field.name]
+            elif result_field.name in builders:
+                continue
+            elif result_field.default_factory is not MISSING:
+                value = result_field.default_factory()
+            else:
+                value = result_field.default
+            setattr(result, result_field.name, value)
+        result._builders = dict(builders)
+        result._lock = threading.RLock()
+        result._compute_listeners = []
+        return result
+
+    def __getattr__(self, name):
+        # 일반 속성 조회에 실패했을 때(= 아직 계산하지 않은 지연 필드)만 호출된다
+        builders = self.__dict__.get('_builders') or {}
+        if name not in builders:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        with self.__dict__['_lock']:
+            if name in self.__dict__:  # 다른 스레드가 먼저 계산한 경우
+                return self.__dict__[name]
+            value = builders[name](self)
+            # 계산 중에 replace_with()로 내용이 바뀌었다면 이전 데이터의 값은 저장하지 않는다
+            stored = self.__dict__.get('_builders') is builders
+            if stored:
+                self.__dict__[name] = value
+        if stored:
+            for listener in list(self.__dict__.get('_compute_listeners') or []):
+                listener(self, name)
+        return value
+
+    def add_compute_listener(self, listener):
+        """지연 필드가 계산되어 저장될 때마다 listener(결과, 필드명)를 호출 (캐시의 크기 재계산 등)"""
+        self.__dict__.setdefault('_compute_listeners', []).append(listener)
+
+    def view(self):
+        """
+        이 결과를 읽기 전용으로 공유하는 새 결과 객체.
+        계산된 필드는 같은 값을 참조하고, 아직 계산하지 않은 지연 필드는 이 결과에서 계산(메모이즈)하여 공유한다.
+        새 객체에 replace_with()/rebind()를 호출해도 이 결과는 바뀌지 않는다.
+        """
+        lock = self.__dict__.get('_lock') or threading.RLock()
+        with lock:
+            values = {result_field.name: self.__dict__[result_field.name]
+                      for result_field in fields(self) if result_field.name in self.__dict__}
+            pending = [name for name in (self.__dict__.get('_builders') or {}) if name not in self.__dict__]
+        return DataTestResult.lazy(
+            builders={name: (lambda result, name=name: getattr(self, name)) for name in pending},
+            **values
+        )
+
+    def is_computed(self, name):
+        """필드 값이 이미 있는지 (지연 필드가 아니거나 계산이 끝났으면 True)"""
+        return name in self.__dict__
+
+    def materialize(self):
+        """모든 지연 필드를 계산 (엑셀 출력 등 전체가 필요한 경우)"""
+        for result_field in fields(self):
+            getattr(self, result_field.name)
+        return self
+
+    def invalidate(self, *names):
+        """
+        계산된 지연 필드를 버려 다음 접근 시 다시 계산하게 한다 (이름을 지정하지 않으면 전체).
+        결과를 계산할 때 사용한 데이터가 바뀐 경우 호출한다.
+        """
+        builders = self.__dict__.get('_builders') or {}
+        for name in names or list(builders):
+            if name in builders:
+                self.__dict__.pop(name, None)
+
+    def rebind(self, builders):
+        """
+        지정한 필드만 새 builders로 다시 계산하도록 교체 (계산된 다른 필드의 값은 유지).
+        결과의 일부(버그/QA 리스트와의 조인 등)만 입력이 바뀐 경우 호출한다.
+        """
+        lock = self.__dict__.get('_lock') or threading.RLock()
+        with lock:
+            new_builders = dict(self.__dict__.get('_builders') or {})
+            new_builders.update(builders)
+            for name in builders:
+                self.__dict__.pop(name, None)
+            self.__dict__['_builders'] = new_builders
+            self.__dict__['_lock'] = lock
+
+    def replace_with(self, other):
+        """other의 내용(계산 전 지연 필드 포함)으로 교체 (세션에 저장된 참조는 그대로 유지)"""
+        lock = self.__dict__.get('_lock') or threading.RLock()
+        with lock:
+            self.__dict__.clear()
+            self.__dict__.update(other.__dict__)
+            self.__dict__['_lock'] = lock
+
+@dataclass
+class ExcelReadResult:
+    """엑셀 파일 하나의 읽기 결과 (프로세스 풀에서 반환용)"""
+    file_path: str
+    df: Optional[pd.DataFrame]
+    file_stat: Optional[tuple] = None  # 읽기 직전의 (mtime_ns, size)
+    elapsed: float = 0.0  # 읽기 및 전처리 소요 시간(초)
+
+def _read_excel_isolated(config, file_path, reporter=None) -> ExcelReadResult:
+    """
+    프로세스 풀 워커 함수.
+    독립된 DataCollector로 파일 하나를 읽어 반환.
+    """
+    try:
+        stat = os.stat(file_path)
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_stat = None
+    collector = DataCollector(os.path.dirname(file_path), config, reporter=reporter)
+    start = time.perf_counter()
+    df = collector._read_and_preprocess_excel(file_path)
+    return ExcelReadResult(
+        file_path=file_path,
+        df=df,
+        file_stat=file_stat,
+        elapsed=time.perf_counter() - start
+    )
+
+def _read_result_bytes(read_result):
+    """리스트 캐시 항목의 메모리 사용량 추정 (bytes)"""
+    if read_result.df is None:
+        return 0
+    return int(read_result.df.memory_usage(index=True, deep=True).sum())
 
 class DataCollector:
-    def __init__(self, selected_folder_path, config, bug_list_folder=None, qa_list_folder=None):
+    def __init__(self, selected_folder_path, config, bug_list_folder=None, qa_list_folder=None, reporter=None):
         self.config = config
+        # 사용자 알림 출력 (Streamlit 화면, 콘솔 등). 지정되지 않으면 로그로만 출력
+        self.reporter = reporter if reporter is not None else LoggingReporter()
         self.selected_folder_path = selected_folder_path
         # bug_list_folder와 qa_list_folder가 지정되지 않으면 selected_folder_path 사용
         self.bug_list_folder = bug_list_folder if bug_list_folder else selected_folder_path
@@ -68,64 +217,274 @@ class DataCollector:
         self.results = []
         self.summaries = []
         self.merged_df = pd.DataFrame()  # "統合" 시트에 대한 병합 DataFrame
-        # 에러 및 경고 메시지 저장용
+        self.source_rows = None  # merged_df 각 행의 원본 엑셀 행 번호
+        # 검증 결과 (findings) 및 규칙별 목록 (findings에서 생성)
+        self.findings = empty_findings()
+        self.unmatched_ids = {}    # 버그/QA 별 형식 불일치 ID
         self.invalid_results = []  # 부적절한 시험 결과
         self.qa_without_no = []    # QA 번호 누락
         self.bug_without_no = []   # 버그 번호 누락
-
-    def collect_data(self) -> DataTestResult:
-        """데이터 수집 및 처리 파이프라인 실행"""
+        # 증분 갱신(폴더 감시)용 파일별 읽기 결과와 최근 결과
+        self.read_results = {}
+        self.test_result = None
+        # 동시 갱신 방지용 (폴더 감시의 갱신과 화면 재실행이 겹치는 경우)
+        self._refresh_lock = threading.Lock()
+        # 최근 수집/갱신의 진단 정보
+        self.diagnostics = self._new_diagnostics("collect")
+        # 폴더 검색 결과 공유 (지문 계산, 시험표 목록, 버그/QA 리스트 검색이 같은 검색 결과를 사용)
+        self.scanner = DirectoryScanner.from_config(config)
+        # OK 계산 전략 (상태를 보관하여 갱신 시 바뀐 날짜만 다시 계산)
+        self.ok_calculators = self._new_ok_calculators()
+
+    @staticmethod
+    def _new_ok_calculators():
+        return {
+            'cumulative': CumulativeOKCalculator(),
+            'daily': DailyOKCalculator(),
+            'weekly': WeeklyBurnUpCalculator(),
+            'velocity': MovingAverageVelocityCalculator(),
+        }
+
+    def _clone_ok_calculators(self):
+        """현재 OK 계산 상태를 이어받는 계산기 사본 (상태를 보관하지 않는 계산 전략은 그대로 공유)"""
+        return {
+            name: calculator.clone() if isinstance(calculator, BaseOKCalculator) else calculator
+            for name, calculator in self.ok_calculators.items()
+        }
+
+    def _snapshot(self, adopt_ok_state=True):
+        """
+        지연 계산용 사본 (현재 수집 상태를 고정).
+        OK 계산 상태는 복제하여 이전 결과의 사본과 공유하지 않는다.
+        adopt_ok_state=True면 이후 갱신이 새 사본의 상태에서 이어서 계산하도록, 수집기도 새 사본의 계산기를 사용한다
+        """
+        snapshot = copy.copy(self)
+        snapshot.unmatched_ids = {}
+        snapshot.ok_calculators = self._clone_ok_calculators()
+        if adopt_ok_state:
+            self.ok_calculators = snapshot.ok_calculators
+        return snapshot
+
+    def collect_data(self, reuse_scan=False) -> DataTestResult:
+        """
+        데이터 수집 및 처리 파이프라인 실행.
+        reuse_scan=True면 직전 fingerprint() 호출의 폴더 검색 결과를 그대로 사용 (결과 캐시 키 계산 직후 수집하는 경우)
+        """
         # 폴더 경로 유효성 검사
         if not self.selected_folder_path or not os.path.exists(self.selected_folder_path):
             logger.error("フォルダーが選択されていないか、無効なパスです。")
             # UI에는 간결한 메시지 또는 상태 표시
-            st.error("선택된 폴더가 유효하지 않습니다. CLI 로그를 확인하세요.")
-            return DataTestResult(
-                summary_df=pd.DataFrame(),
-                merged_df=pd.DataFrame(),
-                bug_table=pd.DataFrame(),
-                qa_table=pd.DataFrame(),
-                ok_table=pd.DataFrame(),
-                cumulative_ok_df=pd.DataFrame(),
-                daily_ok_df=pd.DataFrame()
-            )
+            self.reporter.error("선택된 폴더가 유효하지 않습니다. CLI 로그를 확인하세요.")
+            self.test_result = self._empty_result()
+            return self.test_result
             
-        # 1. 데이터 수집
+        self.diagnostics = self._new_diagnostics("collect")
+        # 읽기 전에 지문을 계산 (읽는 중에 파일이 바뀌면 다음 지문과 달라지도록)
+        with self.diagnostics.stage("scan"):
+            fingerprint = self._fingerprint_from_scan() if reuse_scan and self._has_scanned() else self.fingerprint()
+
+        # 1. 데이터 수집 (지문 계산 시의 검색 결과 사용)
         excel_files = self._get_excel_files()
         
         # 엑셀 파일이 없는 경우 에러 메시지 표시
         if not excel_files:
             logger.error("指定されたフォルダーにExcelファイルが見つかりません。")
-            st.error("지정된 폴더에 Excel 파일이 없습니다. CLI 로그를 확인하세요.")
-            return DataTestResult(
-                summary_df=pd.DataFrame(),
-                merged_df=pd.DataFrame(),
-                bug_table=pd.DataFrame(),
-                qa_table=pd.DataFrame(),
-                ok_table=pd.DataFrame(),
-                cumulative_ok_df=pd.DataFrame(),
-                daily_ok_df=pd.DataFrame()
-            )
+            self.reporter.error("지정된 폴더에 Excel 파일이 없습니다. CLI 로그를 확인하세요.")
+            self.test_result = self._empty_result()
+            return self.test_result
             
-        merged_data = self._collect_excel_data(excel_files)
+        # 시험 폴더 밖(bug_list_folder, qa_list_folder)에 있는 버그/QA 리스트 추가
+        with self.diagnostics.stage("scan_external"):
+            excel_files += self._get_external_files(excel_files)
+
+        with self.diagnostics.stage("read"):
+            merged_data = self._collect_excel_data(excel_files)
         
         # 2. 데이터 병합
-        self.merged_df = self._merge_data(merged_data)
+        with self.diagnostics.stage("merge"):
+            self.merged_df = self._merge_data(merged_data)
+        with self.diagnostics.stage("compact"):
+            self.merged_df = self._compact_merged_data(self.merged_df)
         
         # 3. 데이터 처리
-        return self._process_data()
+        self.test_result = self._process_data()
+        self.test_result.diagnostics = self.diagnostics.finish()
+        self.test_result.fingerprint = fingerprint
+        return self.test_result
+
+    def _new_diagnostics(self, pipeline):
+        return Diagnostics(pipeline, trace_memory=bool(self.config.get("diagnostics_trace_memory", False)))
+
+    def _empty_result(self) -> DataTestResult:
+        """수집할 데이터가 없을 때의 빈 결과"""
+        return DataTestResult(
+            summary_df=pd.DataFrame(),
+            merged_df=pd.DataFrame(),
+            bug_table=pd.DataFrame(),
+            qa_table=pd.DataFrame(),
+            ok_table=pd.DataFrame(),
+            cumulative_ok_df=pd.DataFrame(),
+            daily_ok_df=pd.DataFrame()
+        )
+
+    def refresh(self, changed_paths) -> DataTestResult:
+        """
+        변경된 파일만 다시 읽어 현재 DataTestResult를 갱신 (폴더 감시 모드용).
+        삭제된 파일은 결과에서 제외되며, 기존 DataTestResult 객체를 그대로 갱신하여 반환.
+        """
+        with self._refresh_lock:
+            return self._refresh(changed_paths)
+
+    def _refresh(self, changed_paths) -> DataTestResult:
+        if self.test_result is None:
+            return self.collect_data()
+
+        external_names = [self.config["bug_file_name"], self.config["qa_file_name"]]
+        selected_root = os.path.abspath(self.selected_folder_path).rstrip(os.sep) + os.sep
+        roots = [self.selected_folder_path, self.bug_list_folder, self.qa_list_folder]
+        targets = set()
+        for path in changed_paths:
+            file_name = os.path.basename(path)
+            # 잠금 파일, 검색 대상 외(제외 패턴과 일치하는 백업 폴더 등)의 파일은 무시
+            if not self.scanner.accepts(path, roots):
+                continue
+            # 시험 폴더 내부 파일 또는 버그/QA 리스트만 대상
+            if os.path.abspath(path).startswith(selected_root) or file_name in external_names:
+                targets.add(path)
+        if not targets:
+            return self.test_result
+
+        # 경로 표기를 기존 키와 맞춘다
+        known_paths = {os.path.abspath(path): path for path in self.read_results}
+        targets = {known_paths.get(os.path.abspath(path), path) for path in targets}
+
+        self.diagnostics = self._new_diagnostics("refresh")
+        fingerprint = self.fingerprint()
+        removed = sorted(path for path in targets if not os.path.exists(path))
+        updated = sorted(path for path in targets if os.path.exists(path))
+        for path in removed:
+            self.read_results.pop(path, None)
+        with self.diagnostics.stage("read"):
+            for read_result in self._read_excel_files(updated):
+                self.read_results[read_result.file_path] = read_result
+        logger.info(f"変更されたファイルを再集計しました (更新: {len(updated)}件, 削除: {len(removed)}件)")
+
+        # 버그/QA 리스트만 바뀐 경우: 시험표 병합/검증 결과는 그대로 두고 조인(버그/QA 테이블)만 다시 계산
+        if all(self._is_external_list(path) for path in targets):
+            return self._rejoin_external_lists(fingerprint)
+
+        # 누적 상태 초기화 후 전체 파일 결과로 다시 조립 (재파싱 없음)
+        self.summaries = []
+        with self.diagnostics.stage("merge"):
+            merged_data = self._assemble_excel_data(
+                [self.read_results[path] for path in sorted(self.read_results)]
+            )
+            self.merged_df = self._merge_data(merged_data)
+        with self.diagnostics.stage("compact"):
+            self.merged_df = self._compact_merged_data(self.merged_df)
+        new_result = self._process_data()
+        new_result.diagnostics = self.diagnostics.finish()
+        new_result.fingerprint = fingerprint
+
+        # 기존 객체를 그대로 갱신 (세션에 저장된 참조 유지, 이전 데이터로 계산된 표는 버려진다)
+        self.test_result.replace_with(new_result)
+        return self.test_result
+
+    def _rejoin_external_lists(self, fingerprint):
+        """현재 읽기 결과의 버그/QA 리스트로 버그/QA 테이블만 다시 계산하도록 결과를 갱신"""
+        self.bug_data = self.qa_data = None
+        for read_result in self.read_results.values():
+            file_name = os.path.basename(read_result.file_path)
+            if file_name == self.config["bug_file_name"]:
+                self.bug_data = read_result.df
+            elif file_name == self.config["qa_file_name"]:
+                self.qa_data = read_result.df
+
+        # OK 표는 다시 계산하지 않으므로, 수집기는 현재 결과의 OK 표를 계산하는 계산기를 계속 사용
+        snapshot = self._snapshot(adopt_ok_state=False)
+        lazy = snapshot._lazy
+        self.test_result.rebind({
+            'bug_table': lazy("bug_table", snapshot._create_bug_table),
+            'qa_table': lazy("qa_table", snapshot._create_qa_table),
+            'unmatched_ids': lazy("unmatched_ids", lambda bug_table, qa_table: snapshot._combine_unmatched_ids(), 'bug_table', 'qa_table'),
+        })
+        self.test_result.diagnostics = self.diagnostics.finish()
+        self.test_result.fingerprint = fingerprint
+        return self.test_result
+
+    def fork(self, reporter=None) -> "DataCollector":
+        """
+        세션별 사본 생성 (공유 결과 캐시의 원본은 갱신하지 않고, 각 세션은 사본을 갱신한다).
+        파일별 읽기 결과와 병합 데이터(변경하지 않는 DataFrame)는 공유하고, 갱신으로 바뀌는 상태
+        (읽기 결과 목록, 폴더 검색 결과, OK 계산 상태, 결과 객체)는 사본마다 따로 가진다.
+        결과 객체는 원본 결과를 공유하는 view로, 아직 계산하지 않은 표는 원본에서 한 번만 계산된다.
+        reporter를 지정하면 사본의 알림은 그 Reporter(사본을 받는 세션의 화면 등)로 출력한다.
+        """
+        forked = copy.copy(self)
+        if reporter is not None:
+            forked.reporter = reporter
+        forked.read_results = dict(self.read_results)
+        forked.summaries = list(self.summaries)
+        forked.unmatched_ids = dict(self.unmatched_ids)
+        forked.scanner = DirectoryScanner.from_config(self.config)
+        forked.ok_calculators = self._clone_ok_calculators()
+        forked._refresh_lock = threading.Lock()
+        forked.test_result = self.test_result.view() if self.test_result is not None else None
+        return forked
+
+    def fingerprint(self):
+        """
+        폴더 내용(경로, mtime, size)과 설정값으로 결과 캐시 키 생성.
+        폴더를 새로 검색하며, 검색 결과는 이어지는 수집(시험표 목록, 버그/QA 리스트 검색)에서 재사용된다.
+        """
+        self.scanner.clear()
+        return self._fingerprint_from_scan()
+
+    def _scan_folders(self):
+        return sorted({self.selected_folder_path, self.bug_list_folder, self.qa_list_folder})
+
+    def _has_scanned(self):
+        return all(self.scanner.has_scanned(folder) for folder in self._scan_folders())
+
+    def _fingerprint_from_scan(self):
+        entries = []
+        for folder in self._scan_folders():
+            entries += [(scanned.path, scanned.mtime_ns, scanned.size) for scanned in self.scanner.scan(folder).files]
+        digest = hashlib.sha1(config_hash(self.config, keys=sorted(self.config)).encode("utf-8"))
+        for path, mtime_ns, size in sorted(entries):
+            digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def memory_usage(self):
+        """보유 중인 DataFrame들의 메모리 사용량 추정 (bytes)"""
+        frames = [self.merged_df]
+        frames += [read_result.df for read_result in self.read_results.values() if read_result.df is not None]
+        if self.test_result is not None:
+            # 아직 계산하지 않은 지연 필드는 계산하지 않고 제외
+            frames += [getattr(self.test_result, result_field.name) for result_field in fields(DataTestResult)
+                       if self.test_result.is_computed(result_field.name)]
+        total = sum(df.memory_usage(index=True, deep=True).sum() for df in frames if isinstance(df, pd.DataFrame))
+        if self.test_result is not None and self.test_result.is_computed('row_index') and self.test_result.row_index is not None:
+            total += self.test_result.row_index.nbytes
+        return int(total)
 
     def _collect_excel_data(self, excel_files):
         """엑셀 파일에서 데이터 수집"""
+        read_results = self._read_excel_files(excel_files, prune_root=self.selected_folder_path)
+        self.read_results = {read_result.file_path: read_result for read_result in read_results}
+        return self._assemble_excel_data(read_results)
+
+    def _assemble_excel_data(self, read_results):
+        """파일별 읽기 결과를 순서대로 모아 요약/검증 결과를 반영하고 시험표 데이터 리스트를 반환"""
         test_data = []  # 시험표 데이터
         bug_data = None  # 내부 버그리스트
         qa_data = None  # 내부 QA리스트
         success_count = 0
         
-        for file_path in excel_files:
+        for read_result in read_results:
+            file_path, df = read_result.file_path, read_result.df
             try:
                 file_name = os.path.basename(file_path)
-                df = self._read_and_preprocess_excel(file_path)
                 if df is None:
                     continue
                 
@@ -154,61 +513,237 @@ class DataCollector:
                 
         if success_count == 0:
             logger.error("有効なExcelファイルが見つかりませんでした。")
-            st.error("유효한 Excel 파일을 찾지 못했습니다. CLI 로그를 확인하세요.")
+            self.reporter.error("유효한 Excel 파일을 찾지 못했습니다. CLI 로그를 확인하세요.")
             
         # 시험표 데이터만 병합하여 반환
         self.bug_data = bug_data
         self.qa_data = qa_data
         return test_data
 
+    def _read_excel_files(self, excel_files, prune_root=None):
+        """
+        엑셀 파일들을 읽어 ExcelReadResult 리스트를 excel_files 순서대로 반환.
+        파싱 캐시에 유효한 결과가 있는 파일은 다시 읽지 않는다.
+        버그/QA 리스트는 파일 자체의 (mtime, size)로 공유 리스트 캐시에 보관하여, 리스트가 바뀐 경우에만 다시 읽는다.
+        ingest_workers가 2 이상이면 프로세스 풀로 병렬 처리한다.
+        prune_root가 지정되면 그 폴더 아래에서 excel_files에 없는(삭제된) 파일의 캐시를 정리한다.
+        """
+        parse_cache = self._open_parse_cache()
+        read_results = {}
+        for file_path in excel_files:
+            if self._is_external_list(file_path):
+                read_results[file_path] = self._read_external_list(file_path, parse_cache)
+
+        read_results.update(self._read_uncached_files(
+            [file_path for file_path in excel_files if file_path not in read_results], parse_cache
+        ))
+
+        if parse_cache is not None and prune_root:
+            parse_cache.prune(excel_files, root=prune_root)
+
+        return [read_results[file_path] for file_path in excel_files]
+
+    def _read_uncached_files(self, excel_files, parse_cache):
+        """파싱 캐시(있으면) 또는 파싱으로 파일들을 읽어 {경로: ExcelReadResult} 반환"""
+        read_results = {}
+        if parse_cache is not None:
+            for file_path in excel_files:
+                start = time.perf_counter()
+                cached_df = parse_cache.get(file_path)
+                if cached_df is not None:
+                    cached = ExcelReadResult(file_path=file_path, df=cached_df)
+                    read_results[file_path] = cached
+                    self._record_file(cached, time.perf_counter() - start, "cache")
+            if read_results:
+                logger.info(f"パースキャッシュから {len(read_results)}/{len(excel_files)} 件のファイルを読み込みました。")
+
+        pending_files = [file_path for file_path in excel_files if file_path not in read_results]
+        for read_result in self._parse_excel_files(pending_files):
+            read_results[read_result.file_path] = read_result
+            self._record_file(read_result, read_result.elapsed, "parse")
+            if parse_cache is not None and read_result.df is not None:
+                parse_cache.put(read_result.file_path, read_result.df, stat=read_result.file_stat)
+        return read_results
+
+    def _is_external_list(self, file_path):
+        return os.path.basename(file_path) in (self.config["bug_file_name"], self.config["qa_file_name"])
+
+    def _read_external_list(self, file_path, parse_cache):
+        """
+        버그/QA 리스트 읽기 ('No' 인덱스로 전처리된 결과).
+        (경로, mtime, size, 관련 설정값)별로 프로세스 전체에서 공유하는 리스트 캐시를 사용하여,
+        시험표만 바뀐 재수집/갱신에서는 리스트를 다시 읽지 않는다.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self._read_uncached_files([file_path], parse_cache)[file_path]
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+               config_hash(self.config, keys=EXTERNAL_LIST_CONFIG_KEYS))
+        list_cache = get_shared_cache(
+            "external_list",
+            max_entries=int(self.config.get("external_list_cache_max_entries", 8)),
+            max_bytes=int(self.config.get("external_list_cache_max_mb", 256)) * 1024 ** 2,
+            sizeof=_read_result_bytes
+        )
+        loaded = []
+        start = time.perf_counter()
+        read_result = list_cache.get_or_compute(
+            key, lambda: loaded.append(file_path) or self._read_uncached_files([file_path], parse_cache)[file_path]
+        )
+        if not loaded:
+            self._record_file(read_result, time.perf_counter() - start, "list_cache")
+        return read_result
+
+    def _record_file(self, read_result, seconds, source):
+        rows = len(read_result.df) if read_result.df is not None else 0
+        self.diagnostics.record_file(read_result.file_path, seconds, rows, source)
+
+    def _parse_excel_files(self, excel_files):
+        """엑셀 파일들을 실제로 파싱하여 ExcelReadResult 리스트를 반환 (순서 유지)"""
+        workers = self._get_worker_count(len(excel_files))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(
+                        _read_excel_isolated,
+                        [self.config] * len(excel_files),
+                        excel_files
+                    ))
+            except Exception as e:
+                logger.error(f"並列読み込み中にエラーが発生しました。逐次読み込みに切り替えます: {str(e)}")
+
+        return [_read_excel_isolated(self.config, file_path, reporter=self.reporter) for file_path in excel_files]
+
+    def _open_parse_cache(self):
+        """설정값(parse_cache_dir)이 지정된 경우 파싱 캐시를 연다 (빈 값이면 캐시 사용 안 함)"""
+        cache_dir = self.config.get("parse_cache_dir")
+        if not cache_dir:
+            return None
+        try:
+            return ParseCache(cache_dir, self.config)
+        except OSError as e:
+            logger.warning(f"パースキャッシュを開けませんでした。キャッシュなしで処理します: {str(e)}")
+            return None
+
+    def _get_worker_count(self, file_count):
+        """설정값(ingest_workers)에서 병렬 읽기 프로세스 수 결정 (0 이하는 CPU 코어 수)"""
+        try:
+            workers = int(self.config.get("ingest_workers", 1))
+        except (TypeError, ValueError):
+            logger.warning(f"ingest_workers の設定値が不正です: {self.config.get('ingest_workers')}。逐次読み込みで処理します。")
+            workers = 1
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return max(1, min(workers, file_count))
+
     def _merge_data(self, merged_data):
-        """수집된 데이터 병합"""
+        """수집된 데이터 병합 (각 행의 원본 엑셀 행 번호는 source_rows에 보관)"""
         if merged_data:
+            # 시트의 1행은 헤더이므로 DataFrame index + 2가 엑셀 행 번호
+            self.source_rows = np.concatenate([df.index.to_numpy() + 2 for df in merged_data])
             return pd.concat(merged_data, ignore_index=True)
+        self.source_rows = None
         return pd.DataFrame()
 
-    def _process_data(self) -> DataTestResult:
-        """수집된 데이터 처리"""
-        summary_df = self._create_summary_dataframe()
-        bug_table = self._create_bug_table()
-        qa_table = self._create_qa_table()
-        ok_table = self._create_ok_table()
-        cumulative_ok_df = self._compute_cumulative_ok(ok_table)
-        daily_ok_df = self._compute_daily_ok(ok_table)
-
-        # 문제가 있는 항목들을 데이터프레임으로 표시
-        if self.invalid_results:
-            logger.warning("不正な試験結果一覧：")
-            invalid_df = pd.DataFrame(self.invalid_results)
-            invalid_df.columns = ['ファイル名', 'テストID', '結果']
-            logger.warning(f"부적절한 시험 결과:\n{invalid_df.to_string()}")
-            # UI에는 요약 정보 또는 알림만 표시
-            st.warning(f"{len(self.invalid_results)}건의 부적절한 시험 결과가 있습니다. CLI 로그를 확인하세요.")
-
-        if self.qa_without_no:
-            logger.warning("QA番号未入力項目一覧：")
-            qa_df = pd.DataFrame(self.qa_without_no)
-            qa_df.columns = ['ファイル名', 'テストID']
-            logger.warning(f"QA 번호 미입력 항목:\n{qa_df.to_string()}")
-            st.warning(f"{len(self.qa_without_no)}건의 QA 번호 미입력 항목이 있습니다. CLI 로그를 확인하세요.")
-
-        if self.bug_without_no:
-            logger.warning("バグ番号未入力項目一覧：")
-            bug_df = pd.DataFrame(self.bug_without_no)
-            bug_df.columns = ['ファイル名', 'テストID']
-            logger.warning(f"버그 번호 미입력 항목:\n{bug_df.to_string()}")
-            st.warning(f"{len(self.bug_without_no)}건의 버그 번호 미입력 항목이 있습니다. CLI 로그를 확인하세요.")
+    def _compact_merged_data(self, merged_df):
+        """설정값(compact_schema)이 켜져 있으면 메모리 절약형 타입으로 변환하고, 컬럼별 메모리를 진단 정보에 기록"""
+        if self.config.get("compact_schema", True) and "result_column" in self.config:
+            merged_df = compact_frame(merged_df, self.config)
+        self.diagnostics.record_memory("merged_df", merged_df)
+        return merged_df
+
+    def _validate(self):
+        """병합된 시험표 데이터 전체에 검증 규칙 적용"""
+        validator = Validator(build_rules(self.config, self.categories))
+        row_numbers = self.source_rows if self.source_rows is not None and len(self.source_rows) == len(self.merged_df) else None
+        return validator.validate(
+            self.merged_df,
+            self.config.get("file_name_column", "ファイル名"),
+            self.config["test_id_column"],
+            row_numbers=row_numbers
+        )
 
-        return DataTestResult(
-            summary_df=summary_df,
+    def _report_findings(self, findings):
+        """검증 결과를 규칙별 건수로 알리고, 로그에는 앞부분만 출력"""
+        log_limit = 20
+        for rule_name, rule_findings in findings.groupby(FINDING_RULE, sort=False):
+            count = len(rule_findings)
+            per_file = rule_findings[FINDING_FILE].value_counts(sort=False)
+            logger.warning(
+                f"検証結果 {rule_name}: {count}件 ({len(per_file)}ファイル)\n"
+                f"{rule_findings.head(log_limit).to_string(index=False)}"
+                + (f"\n... 他 {count - log_limit}件" if count > log_limit else "")
+            )
+            self.reporter.warning(f"{rule_name}: {count}건의 항목이 있습니다. CLI 로그를 확인하세요.")
+
+    def report_findings(self):
+        """
+        현재 검증 결과를 다시 알림.
+        공유 결과 캐시에서 받은 수집 결과는 다른 세션(또는 이전 실행)에서 검증되었으므로,
+        결과를 받은 세션의 로그와 화면에도 같은 내용이 남도록 연결할 때 호출한다.
+        """
+        self._report_findings(self.findings)
+
+    def _process_data(self) -> DataTestResult:
+        """
+        수집된 데이터 처리.
+        검증은 바로 수행하고(경고 알림, CLI 종료 코드에 필요), 나머지 표는 처음 접근할 때 계산한다.
+        """
+        # 검증 규칙 적용 (문제가 있는 항목은 규칙별 건수만 알림)
+        with self.diagnostics.stage("validation"):
+            self.findings = self._validate()
+            self._set_legacy_findings(self.findings)
+        self._report_findings(self.findings)
+
+        # 지연 계산은 현재 수집 상태를 고정한 사본으로 수행 (이후 refresh로 바뀌는 상태의 영향을 받지 않음)
+        snapshot = self._snapshot()
+        lazy = snapshot._lazy
+        return DataTestResult.lazy(
+            builders={
+                'summary_df': lazy("summary", snapshot._create_summary_dataframe),
+                'bug_table': lazy("bug_table", snapshot._create_bug_table),
+                'qa_table': lazy("qa_table", snapshot._create_qa_table),
+                # 형식 불일치 ID는 버그/QA 테이블 생성 시 수집된다
+                'unmatched_ids': lazy("unmatched_ids", lambda bug_table, qa_table: snapshot._combine_unmatched_ids(), 'bug_table', 'qa_table'),
+                'result_cube': lazy("result_cube", snapshot._create_result_cube),
+                'ok_table': lazy("ok_table", snapshot._create_ok_table, 'result_cube'),
+                'cumulative_ok_df': lazy("cumulative_ok", snapshot._compute_cumulative_ok, 'ok_table'),
+                'daily_ok_df': lazy("daily_ok", snapshot._compute_daily_ok, 'ok_table'),
+                'weekly_ok_df': lazy("weekly_ok", snapshot._compute_weekly_ok, 'ok_table'),
+                'ok_velocity_df': lazy("ok_velocity", snapshot._compute_ok_velocity, 'ok_table'),
+                'row_index': lazy("index", lambda merged_df: ResultIndex(merged_df, snapshot.config), 'merged_df'),
+            },
             merged_df=self.merged_df,
-            bug_table=bug_table,
-            qa_table=qa_table,
-            ok_table=ok_table,
-            cumulative_ok_df=cumulative_ok_df,
-            daily_ok_df=daily_ok_df
+            findings=self.findings,
+            diagnostics=self.diagnostics
         )
 
+    def _lazy(self, stage_name, build, *dependencies):
+        """
+        지연 필드 계산 함수 생성.
+        dependencies로 지정한 필드를 먼저 계산(또는 저장된 값 사용)한 뒤 build에 인자로 넘기고,
+        build 자체의 소요 시간만 진단 정보의 단계로 기록한다.
+        """
+        def builder(result):
+            inputs = [getattr(result, name) for name in dependencies]
+            with self.diagnostics.stage(stage_name):
+                return build(*inputs)
+        return builder
+
+    def _set_legacy_findings(self, findings):
+        """기본 규칙의 검증 결과를 기존 목록 형식(invalid_results 등)으로 변환"""
+        def records(rule_name, with_value):
+            rows = findings[findings[FINDING_RULE] == rule_name]
+            result = {'file_name': rows[FINDING_FILE].tolist(), 'test_id': rows[FINDING_TEST_ID].tolist()}
+            if with_value:
+                result['result'] = rows[FINDING_VALUE].tolist()
+            return pd.DataFrame(result).to_dict('records')
+
+        self.invalid_results = records(RULE_INVALID_RESULT, True)
+        self.qa_without_no = records(RULE_QA_NO_MISSING, False)
+        self.bug_without_no = records(RULE_BUG_NO_MISSING, False)
+
     def _read_and_preprocess_excel(self, file_path):
         """
         엑셀 파일 읽기 및 전처리.
@@ -221,20 +756,19 @@ class DataCollector:
         """
         try:
             config = self.config
-            excel_file = pd.ExcelFile(file_path)
             file_name = os.path.basename(file_path)
             is_external_list = file_name in [config["bug_file_name"], config["qa_file_name"]]
             sheet_name = "一覧" if is_external_list else config["sheet_name"]
 
-            # 1. 시트 존재 확인
-            if sheet_name not in excel_file.sheet_names:
+            # 1~2. 시트 존재 확인, 데이터 로드 및 컬럼 공백 제거 (파일은 한 번만 연다)
+            # projected_read가 켜져 있으면 설정된 컬럼만 읽는다
+            usecols = self._get_read_columns(is_external_list, file_name) if config.get("projected_read", True) else None
+            try:
+                df = read_sheet(file_path, sheet_name, usecols=usecols, engine=config.get("excel_engine", "openpyxl"))
+            except SheetNotFoundError:
                 logger.warning(f"'{file_name}'に'{sheet_name}'シートが存在しません。")
                 return None
 
-            # 2. 데이터 로드 및 컬럼 공백 제거
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=0, engine='openpyxl')
-            df.columns = df.columns.str.strip()
-
             # 3. 필수 컬럼 존재 확인
             required_columns = []
             if is_external_list:
@@ -283,6 +817,8 @@ class DataCollector:
                      logger.warning(f"'{file_name}'の 'No'カラムに数値でない、または空の値が含まれる行を削除しました。")
                 if not df.empty:
                      df['No'] = df['No'].astype(int) # 정수형으로 변환
+                # 테이블 생성 시 번호로 조인할 수 있도록 'No' 인덱스로 보관
+                df = index_by_no(df)
             else:
                 # 시험표 처리
                 date_col = config["date_column"] # 이미 존재 확인됨
@@ -292,49 +828,9 @@ class DataCollector:
                 if len(df) < initial_rows:
                     logger.warning(f"'{file_name}'の '{date_col}'カラムに日付でない、または空の値が含まれる行を削除しました。")
 
-                # 시험 결과 유효성 검사 (기존 로직 유지, result_col 사용)
-                result_col = config["result_column"]
-                invalid_results = df[~df[result_col].isin(self.categories) & df[result_col].notna()]
-                if not invalid_results.empty:
-                    test_id_col = config["test_id_column"]
-                    for idx, row in invalid_results.iterrows():
-                        self.invalid_results.append({
-                            'file_name': file_name,
-                            'test_id': row[test_id_col],
-                            'result': row[result_col]
-                        })
-                    st.warning(f"'{file_name}'に不正な試験結果({invalid_results[result_col].unique()})が含まれています。CLI 로그に 상세 정보が 기록됩니다.") # UI 메시지 변경
-                    logger.warning(f"'{file_name}'에 포함된 부적절한 시험 결과: {invalid_results[[config['test_id_column'], result_col]].to_dict('records')}")
-
-                # QA/Bug 번호 누락 검사 (기존 로직 유지, 각 컬럼 사용)
-                qa_no_col = config["qa_no_column"]
-                test_id_col = config["test_id_column"]
-                qa_without_no = df[
-                    (df[result_col] == 'QA') &
-                    (df[qa_no_col].isna() | (df[qa_no_col] == ''))
-                ]
-                if not qa_without_no.empty:
-                    for idx, row in qa_without_no.iterrows():
-                        self.qa_without_no.append({
-                            'file_name': file_name,
-                            'test_id': row[test_id_col]
-                        })
-                    st.warning(f"'{file_name}'에 QA 번호가 누락된 항목이 있습니다. CLI 로그에 상세 정보가 기록됩니다.") # UI 메시지 변경
-                    logger.warning(f"'{file_name}'에 QA 번호 누락: {qa_without_no[[config['test_id_column']]].to_dict('records')}")
-
-                bug_no_col = config["bug_no_column"]
-                bug_without_no = df[
-                    (df[result_col].isin(['NG', 'BK'])) &
-                    (df[bug_no_col].isna() | (df[bug_no_col] == ''))
-                ]
-                if not bug_without_no.empty:
-                    for idx, row in bug_without_no.iterrows():
-                        self.bug_without_no.append({
-                            'file_name': file_name,
-                            'test_id': row[test_id_col]
-                        })
-                    st.warning(f"'{file_name}'에 버그 번호가 누락된 항목이 있습니다. CLI 로그에 상세 정보가 기록됩니다.") # UI 메시지 변경
-                    logger.warning(f"'{file_name}'에 버그 번호 누락: {bug_without_no[[config['test_id_column']]].to_dict('records')}")
+                # 검증(부적절한 시험 결과, 번호 미입력 등)은 병합 후 Validator에서 일괄 수행
+                # 파일명 컬럼 추가 (병합 후 검증 결과, 파일별 집계에 사용)
+                df[config.get("file_name_column", "ファイル名")] = file_name
 
             # 5. 정제된 데이터프레임 반환
             return df
@@ -343,6 +839,15 @@ class DataCollector:
             logger.error(f"'{os.path.basename(file_path)}' ({sheet_name}シート) の読み込み・前処理中にエラーが発生しました: {str(e)}")
             return None
 
+    def _get_read_columns(self, is_external_list, file_name):
+        """읽을 컬럼 목록 (외부 목록: No + 설정된 컬럼, 시험표: 설정된 6개 컬럼)"""
+        config = self.config
+        if is_external_list:
+            list_type = "bug" if file_name == config["bug_file_name"] else "qa"
+            return ['No'] + config.get(f"{list_type}_file_columns", [])
+        column_keys = ["test_id_column", "result_column", "date_column", "bug_no_column", "qa_no_column", "test_name_column"]
+        return [config[key] for key in column_keys if config.get(key)]
+
     # '試験結果' 컬럼의 값을 config["result_column"]로 처리하여 카테고리별 개수를 계산
     def _count_test_results(self, df):
         result_counts = df[self.config["result_column"]].value_counts()
@@ -367,7 +872,7 @@ class DataCollector:
 
         return summary_df
 
-    # 특정 파일(버그, QA 리스트)을 지정된 폴더에서 검색하여 경로 반환 (config 활용)
+    # 특정 파일(버그, QA 리스트)을 지정된 폴더에서 검색하여 경로 반환 (config 활용, 공유된 검색 결과 사용)
     def _find_external_file(self, target_file):
         if target_file == self.config["bug_file_name"]:
             search_folder = self.bug_list_folder
@@ -376,86 +881,93 @@ class DataCollector:
         else:
             search_folder = self.selected_folder_path
 
-        for root, _, files in os.walk(search_folder):
-            for file in files:
-                if file == target_file:
-                    return os.path.join(root, file)
-        return None
+        scanned = self.scanner.scan(search_folder).find(target_file)
+        return scanned.path if scanned else None
+
+    # 시험 폴더에 없는 버그/QA 리스트를 각 지정 폴더에서 찾아 반환
+    def _get_external_files(self, excel_files):
+        found_names = {os.path.basename(path) for path in excel_files}
+        external_files = []
+        for target_file in [self.config["bug_file_name"], self.config["qa_file_name"]]:
+            if target_file in found_names:
+                continue
+            file_path = self._find_external_file(target_file)
+            if file_path:
+                external_files.append(file_path)
+        return external_files
 
     def _create_bug_table(self):
         """버그 테이블 생성"""
         # 시험표에서 NG, BK인 항목만 필터링
         filtered_df = self.merged_df[self.merged_df[self.config["result_column"]].isin(['NG', 'BK'])]
-        creator = BugTableCreator(self.config, filtered_df, self._find_external_file)
+        creator = BugTableCreator(self.config, filtered_df, self._find_external_file, reporter=self.reporter)
         creator.bug_data = self.bug_data  # 내부 버그리스트 데이터 전달
-        return creator.create_table()
+        bug_table = creator.create_table()
+        self.unmatched_ids['バグ'] = creator.unmatched_ids
+        return bug_table
 
     def _create_qa_table(self):
         """QA 테이블 생성"""
         # 시험표에서 QA인 항목만 필터링
         filtered_df = self.merged_df[self.merged_df[self.config["result_column"]] == 'QA']
-        creator = QATableCreator(self.config, filtered_df, self._find_external_file)
+        creator = QATableCreator(self.config, filtered_df, self._find_external_file, reporter=self.reporter)
         creator.qa_data = self.qa_data  # 내부 QA리스트 데이터 전달
-        return creator.create_table()
-
-    def _create_ok_table(self):
+        qa_table = creator.create_table()
+        self.unmatched_ids['QA'] = creator.unmatched_ids
+        return qa_table
+
+    def _combine_unmatched_ids(self):
+        """버그/QA 별 형식 불일치 ID를 하나의 표로 합친다"""
+        id_columns = {'バグ': self.config["bug_no_column"], 'QA': self.config["qa_no_column"]}
+        frames = []
+        for kind, df in self.unmatched_ids.items():
+            if df.empty:
+                continue
+            df = df.rename(columns={id_columns[kind]: 'ID'})
+            df.insert(0, '種別', kind)
+            frames.append(df)
+        if not frames:
+            return pd.DataFrame(columns=['種別', 'ID', '件数', self.config["test_name_column"]])
+        return pd.concat(frames, ignore_index=True)
+
+    def _create_result_cube(self):
         """
-        'OK' 결과를 날짜별로 집계한 테이블 생성.
+        날짜별/시험 결과별 항목 수 큐브 생성 (수집 1회당 한 번만 계산).
         입력 merged_df는 이미 전처리되었다고 가정 (날짜 컬럼 유효, NaT 없음).
         """
         config = self.config
-        date_col = config["date_column"]
-        result_col = config["result_column"]
-        test_id_col = config["test_id_column"]
-        final_cols = [date_col, 'OK'] # 최종 반환할 컬럼
-
-        # 입력 데이터프레임 및 필수 컬럼 존재 확인
-        # date_col은 전처리 단계에서 확인됨
-        if self.merged_df.empty or result_col not in self.merged_df.columns or test_id_col not in self.merged_df.columns:
-            # 필수 컬럼 없으면 집계 불가
-            if result_col not in self.merged_df.columns: logger.error(f"OK 테이블 생성 불가: '{result_col}' 컬럼이 없습니다.")
-            if test_id_col not in self.merged_df.columns: logger.error(f"OK 테이블 생성 불가: '{test_id_col}' 컬럼이 없습니다.")
-            return pd.DataFrame(columns=final_cols)
-
-        # pivot_table 생성 (오류 가능성 낮음)
-        try:
-            pivot_table = self.merged_df.pivot_table(
-                index=date_col,
-                columns=result_col,
-                values=test_id_col,
-                aggfunc='count',
-                fill_value=0
-            )
-        except Exception as e: # 예상치 못한 오류 처리
-             logger.error(f"OK テーブル作成中に予期せぬエラーが発生しました: {e}")
-             return pd.DataFrame(columns=final_cols)
-
-        # 'OK' 컬럼이 없는 경우 처리
-        if 'OK' not in pivot_table.columns:
-            pivot_table['OK'] = 0
+        return build_result_cube(self.merged_df, config["date_column"], config["result_column"], config["test_id_column"])
 
-        # 필요한 컬럼('OK')만 선택하고 인덱스(날짜)를 컬럼으로 변환
-        ok_df = pivot_table[['OK']].reset_index()
-
-        return ok_df
+    def _create_ok_table(self, result_cube):
+        """날짜×결과 큐브에서 'OK' 건수만 추출한 테이블 생성 [날짜, OK]"""
+        return ok_counts(result_cube, self.config["date_column"])
 
     def _compute_ok(self, ok_table: pd.DataFrame, calculator: OKCalculator) -> pd.DataFrame:
-        """OK 계산을 수행하는 메서드"""
+        """
+        OK 계산을 수행하는 메서드.
+        상태를 보관하는 계산 전략은 이전 계산 이후 바뀐 날짜만 반영한다 (갱신 시 전체 재계산 없음)
+        """
+        if isinstance(calculator, BaseOKCalculator):
+            return calculator.sync(ok_table, self.config)
         return calculator.calculate(ok_table, self.config)
 
     def _compute_cumulative_ok(self, ok_table: pd.DataFrame) -> pd.DataFrame:
         """누적 OK 테이블 계산"""
-        return self._compute_ok(ok_table, CumulativeOKCalculator())
+        return self._compute_ok(ok_table, self.ok_calculators['cumulative'])
 
     def _compute_daily_ok(self, ok_table: pd.DataFrame) -> pd.DataFrame:
         """일별 OK 테이블 계산"""
-        return self._compute_ok(ok_table, DailyOKCalculator())
+        return self._compute_ok(ok_table, self.ok_calculators['daily'])
+
+    def _compute_weekly_ok(self, ok_table: pd.DataFrame) -> pd.DataFrame:
+        """주별 번업 테이블 계산"""
+        return self._compute_ok(ok_table, self.ok_calculators['weekly'])
+
+    def _compute_ok_velocity(self, ok_table: pd.DataFrame) -> pd.DataFrame:
+        """이동 평균 속도 테이블 계산"""
+        return self._compute_ok(ok_table, self.ok_calculators['velocity'])
 
-    # 지정된 폴더에서 .xlsx 파일을 검색하여 리스트로 반환
+    # 지정된 폴더에서 .xlsx 파일을 검색하여 리스트로 반환 (결과 재현성을 위해 경로순 정렬)
+    # 잠금 파일(~$*.xlsx)과 제외 패턴(scan_exclude)에 일치하는 파일/폴더는 제외
     def _get_excel_files(self):
-        excel_files = []
-        for root, _, files in os.walk(self.selected_folder_path):
-            for file in files:
-                if file.endswith(".xlsx"):
-                    excel_files.append(os.path.join(root, file))
-        return excel_files
+        return self.scanner.scan(self.selected_folder_path).paths()
@@ -1,95 +1,113 @@
 # 納品作業関連
 
 import os
+import logging
 import streamlit as st
-import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import Font, Alignment
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from config import load_config
+from dir_scanner import DirectoryScanner
+# 변환 처리는 Streamlit을 읽지 않는 delivery_transforms에 있고, 기존 이름으로도 사용할 수 있도록 다시 공개
+from delivery_transforms import (
+    DELIVERY_TRANSFORMS,
+    XML_PATCH_TRANSFORMS,
+    DeliveryFileResult,
+    DELIVERY_FONT,
+    DELIVERY_ALIGNMENT,
+    fill_blank_cells,
+    apply_shared_style,
+    align_cells_left_top,
+    set_font_to_meiryo,
+    set_zoom_to_100,
+    apply_transforms,
+    process_workbook,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class DeliveryHelper:
-    def __init__(self, folder_path):
+    def __init__(self, folder_path, config=None):
         self.folder_path = folder_path
-        self.config, _ = load_config()  # 설정 파일 불러오기
+        if config is None:
+            config, _ = load_config()  # 설정 파일 불러오기
+        self.config = config
         self.sheet_name = self.config.get("sheet_name", "試験表")  # 기본값 fallback
+        # 대상 파일 목록은 한 번만 검색하여 모든 작업에서 공유 (잠금 파일, 제외 패턴의 백업 폴더 등은 제외)
+        self.scanner = DirectoryScanner.from_config(self.config)
+
+    def _excel_files(self):
+        """작업 대상 엑셀 파일 경로 목록 (경로순)"""
+        return self.scanner.scan(self.folder_path).paths()
+
+    def selected_transforms(self):
+        """설정값(delivery_transforms)에서 적용할 단계 (빈 값이면 전체)"""
+        selected = self.config.get("delivery_transforms") or list(DELIVERY_TRANSFORMS)
+        unknown = [transform for transform in selected if transform not in DELIVERY_TRANSFORMS]
+        if unknown:
+            st.warning(f"不明な納品作業が指定されているため無視します: {', '.join(unknown)}")
+        return [transform for transform in DELIVERY_TRANSFORMS if transform in selected]
+
+    def run(self, transforms=None, on_result=None):
+        """
+        납품 작업 실행. 파일마다 워크북을 한 번만 열고, 선택된 단계를 모두 적용한 뒤 한 번만 저장한다.
+        - transforms: 적용할 단계 (지정하지 않으면 설정값의 단계)
+        - on_result: 파일 하나가 끝날 때마다 (결과, 완료 수, 전체 수)로 호출 (지정하지 않으면 화면에 한 줄씩 출력)
+        delivery_workers가 2 이상이면 프로세스 풀로 병렬 처리한다. 파일 순서대로 결과 목록을 반환
+        """
+        transforms = self.selected_transforms() if transforms is None else transforms
+        excel_files = self._excel_files()
+        on_result = on_result or self._write_result
+        results = {}
+        for result in self._process_files(excel_files, transforms):
+            results[result.file_path] = result
+            on_result(result, len(results), len(excel_files))
+        return [results[file_path] for file_path in excel_files]
+
+    def _process_files(self, excel_files, transforms):
+        """파일별 결과를 끝난 순서대로 반환 (병렬 처리에 실패하면 남은 파일은 순서대로 처리)"""
+        pending = list(excel_files)
+        workers = self._get_worker_count(len(excel_files))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(process_workbook, file_path, self.sheet_name, transforms) for file_path in excel_files]
+                    for future in as_completed(futures):
+                        result = future.result()
+                        pending.remove(result.file_path)
+                        yield result
+                return
+            except Exception as e:
+                logger.error(f"並列処理中にエラーが発生しました。逐次処理に切り替えます: {str(e)}")
+        for file_path in pending:
+            yield process_workbook(file_path, self.sheet_name, transforms)
+
+    def _get_worker_count(self, file_count):
+        """설정값(delivery_workers)에서 병렬 처리 프로세스 수 결정 (0 이하는 CPU 코어 수)"""
+        try:
+            workers = int(self.config.get("delivery_workers", 1))
+        except (TypeError, ValueError):
+            logger.warning(f"delivery_workers の設定値が不正です: {self.config.get('delivery_workers')}。逐次処理で実行します。")
+            workers = 1
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        return max(1, min(workers, file_count))
+
+    def _write_result(self, result, done, total):
+        """진행 표시가 지정되지 않았을 때의 파일별 출력"""
+        st.write(f"[{done}/{total}] {result.file_path}")
+        if result.ok:
+            st.write(f"Done: {result.message}" if result.message else "Done")
+        else:
+            st.error(f"Error processing {result.file_path}: {result.message}")
 
     def set_font_to_meiryo(self):
-        for root, _, files in os.walk(self.folder_path):
-            for file in files:
-                if file.endswith(".xlsx"):
-                    file_path = os.path.join(root, file)
-                    st.write(f"フォントを変更中...: {file_path}")
-                    try:
-                        workbook = load_workbook(file_path)
-                        for sheet in workbook.worksheets:
-                            for row in sheet.iter_rows():
-                                for cell in row:
-                                    cell.font = Font(name='メイリオ')
-                        workbook.save(file_path)
-                        workbook.close()
-                        st.write("Done")
-                    except Exception as e:
-                        st.error(f"Error setting font in {file_path}: {e}")
+        return self.run(["font"])
 
     def align_cells_left_top(self):
-        for root, _, files in os.walk(self.folder_path):
-            for file in files:
-                if file.endswith(".xlsx"):
-                    file_path = os.path.join(root, file)
-                    st.write(f"左上に整列中...: {file_path}")
-                    try:
-                        workbook = load_workbook(file_path)
-                        if self.sheet_name in workbook.sheetnames:
-                            sheet = workbook[self.sheet_name]
-                            for row in sheet.iter_rows():
-                                for cell in row:
-                                    if cell.value is not None:
-                                        cell.alignment = Alignment(horizontal='left', vertical='top')
-                            st.write(f"'{self.sheet_name}' シート整列完了: {file_path}")
-                        else:
-                            st.write(f"'{self.sheet_name}' シートが存在しません: {file_path}")
-                        workbook.save(file_path)
-                        workbook.close()
-                    except Exception as e:
-                        st.error(f"Error aligning cells in {file_path}: {e}")
+        return self.run(["align"])
 
     def fill_blank_cells_in_range(self):
-        for root, _, files in os.walk(self.folder_path):
-            for file in files:
-                if file.endswith(".xlsx"):
-                    file_path = os.path.join(root, file)
-                    st.write(f"処理中: {file_path}")
-                    try:
-                        workbook = load_workbook(file_path)
-                        if self.sheet_name in workbook.sheetnames:
-                            sheet = workbook[self.sheet_name]
-                            data = sheet.values
-                            rows = list(data)
-                            df = pd.DataFrame(rows).dropna(how='all', axis=0).dropna(how='all', axis=1)
-                            df = df.fillna('-')
-                            for row_idx, row in enumerate(df.values, start=1):
-                                for col_idx, value in enumerate(row, start=1):
-                                    sheet.cell(row=row_idx, column=col_idx, value=value)
-                            workbook.save(file_path)
-                            workbook.close()
-                            st.write(f"'{self.sheet_name}' シート空白処理完了: {file_path}")
-                        else:
-                            st.write(f"'{self.sheet_name}' シートが存在しません: {file_path}")
-                    except Exception as e:
-                        st.error(f"Error processing {file_path}: {e}")
+        return self.run(["fill_blank"])
 
     def set_zoom_to_100(self):
-        for root, _, files in os.walk(self.folder_path):
-            for file in files:
-                if file.endswith(".xlsx"):
-                    file_path = os.path.join(root, file)
-                    st.write(f"拡大比率を調整中: {file_path}")
-                    try:
-                        workbook = load_workbook(file_path)
-                        for sheet in workbook.worksheets:
-                            sheet.sheet_view.zoomScale = 100
-                        workbook.save(file_path)
-                        workbook.close()
-                        st.write("Done")
-                    except Exception as e:
-                        st.error(f"Error setting zoom in {file_path}: {e}")
+        return self.run(["zoom"])
@@ -0,0 +1,203 @@
+# 납품 작업 변환 처리 관련 (Streamlit을 읽지 않는다: 프로세스 풀의 워커가 이 모듈만 읽어 작업한다)
+
+import time
+import openpyxl
+from dataclasses import dataclass
+from openpyxl import load_workbook
+from openpyxl.cell.cell import MergedCell
+from openpyxl.styles import Font, Alignment
+from openpyxl.styles.cell_style import StyleArray
+from xlsx_patcher import patch_xlsx, ZOOM_100
+
+# 납품 작업 단계 (적용 순서): 이름 → 표시명
+DELIVERY_TRANSFORMS = {
+    "fill_blank": "空白を'-'で埋める",
+    "align": "左上に整列",
+    "font": "フォントをメイリオに統一",
+    "zoom": "拡大比率を100%に設定",
+}
+# 워크북을 열지 않고 zip 안의 XML만 고쳐서 적용할 수 있는 단계 → 패치 목록
+XML_PATCH_TRANSFORMS = {
+    "zoom": (ZOOM_100,),
+}
+
+
+@dataclass
+class DeliveryFileResult:
+    """엑셀 파일 하나의 납품 작업 결과"""
+    file_path: str
+    ok: bool
+    message: str = ""
+    elapsed: float = 0.0
+
+
+# 내부 구조(시트의 셀 표, 셀의 스타일 번호)를 직접 다루는 방식을 확인한 openpyxl 버전 (그 외 버전은 공개 API로 처리)
+_VERIFIED_VERSIONS = ("3.0.", "3.1.")
+
+
+def _supports_cell_table(sheet):
+    """시트의 셀 표(좌표 → 셀)를 직접 읽을 수 있는지 (확인한 버전이고 내부 구조가 예상과 같을 때만)"""
+    return openpyxl.__version__.startswith(_VERIFIED_VERSIONS) and isinstance(getattr(sheet, "_cells", None), dict)
+
+
+def fill_blank_cells(sheet):
+    """
+    시트의 빈 셀을 '-'로 채운다 (값이 하나도 없는 행/열은 제외).
+    존재하는 셀을 한 번 훑어 값이 있는 행/열을 구하고, 그 교차 위치 중 빈 셀에만 원래 좌표 그대로 쓴다.
+    병합 셀의 나머지 영역은 건너뛴다. 확인하지 않은 openpyxl 버전에서는 공개 API로 사용 범위를 훑는다. 채운 셀 수를 반환
+    """
+    if not _supports_cell_table(sheet):
+        return _fill_blank_cells_in_used_range(sheet)
+
+    rows, columns = set(), set()
+    for (row, column), cell in sheet._cells.items():
+        if cell.value is not None:
+            rows.add(row)
+            columns.add(column)
+    columns = sorted(columns)
+    filled = 0
+    for row in sorted(rows):
+        for column in columns:
+            cell = sheet._cells.get((row, column))
+            if cell is None:
+                sheet.cell(row=row, column=column, value='-')
+            elif cell.value is None and not isinstance(cell, MergedCell):
+                cell.value = '-'
+            else:
+                continue
+            filled += 1
+    return filled
+
+
+def _fill_blank_cells_in_used_range(sheet):
+    """fill_blank_cells와 같은 결과를 공개 API(iter_rows)만으로 처리 (사용 범위의 빈 좌표에도 셀이 만들어진다)"""
+    rows, columns = set(), set()
+    for cells in sheet.iter_rows():
+        for cell in cells:
+            if cell.value is not None:
+                rows.add(cell.row)
+                columns.add(cell.column)
+    if not rows:
+        return 0
+    filled = 0
+    for cells in sheet.iter_rows(min_row=min(rows), max_row=max(rows), min_col=min(columns), max_col=max(columns)):
+        for cell in cells:
+            if (cell.row in rows and cell.column in columns
+                    and cell.value is None and not isinstance(cell, MergedCell)):
+                cell.value = '-'
+                filled += 1
+    return filled
+
+
+# 납품 작업에서 공유하는 스타일 (워크북 스타일 표에 한 번만 등록)
+DELIVERY_FONT = Font(name='メイリオ')
+DELIVERY_ALIGNMENT = Alignment(horizontal='left', vertical='top')
+# 스타일 종류 → (워크북의 스타일 표 속성, StyleArray의 번호 속성)
+_STYLE_TABLES = {
+    "font": ("_fonts", "fontId"),
+    "alignment": ("_alignments", "alignmentId"),
+}
+def _supports_style_ids(workbook):
+    """셀의 스타일 번호를 직접 바꿀 수 있는지 (확인한 버전이고 내부 구조가 예상과 같을 때만)"""
+    return (
+        openpyxl.__version__.startswith(_VERIFIED_VERSIONS)
+        and all(hasattr(workbook, table) for table, _ in _STYLE_TABLES.values())
+        and all(key in vars(StyleArray) for _, key in _STYLE_TABLES.values())
+    )
+
+
+def apply_shared_style(workbook, cells, **styles):
+    """
+    styles(font=..., alignment=...)를 워크북 스타일 표에 한 번 등록하고, 셀에는 스타일 번호만 바꿔 일괄 적용.
+    셀마다 Font/Alignment 객체를 만들지 않으며, 셀의 다른 서식(테두리, 채우기, 표시 형식)은 유지된다.
+    확인하지 않은 openpyxl 버전에서는 같은 스타일 객체를 공개 속성(cell.font 등)으로 설정한다. 적용한 셀 수를 반환
+    """
+    if not _supports_style_ids(workbook):
+        count = 0
+        for cell in cells:
+            for kind, style in styles.items():
+                setattr(cell, kind, style)
+            count += 1
+        return count
+
+    style_ids = {
+        _STYLE_TABLES[kind][1]: getattr(workbook, _STYLE_TABLES[kind][0]).add(style)
+        for kind, style in styles.items()
+    }
+    count = 0
+    for cell in cells:
+        if not cell._style:
+            cell._style = StyleArray()
+        for key, style_id in style_ids.items():
+            setattr(cell._style, key, style_id)
+        count += 1
+    return count
+
+
+def _used_range_cells(sheet):
+    """시트 사용 범위(1행 1열부터 최대 행/열까지)의 모든 셀 (빈 좌표의 셀도 포함)"""
+    return (cell for row in sheet.iter_rows() for cell in row)
+
+
+def align_cells_left_top(sheet):
+    """값이 있는 셀을 왼쪽 위로 정렬"""
+    cells = (cell for cell in _used_range_cells(sheet) if cell.value is not None)
+    apply_shared_style(sheet.parent, cells, alignment=DELIVERY_ALIGNMENT)
+
+
+def set_font_to_meiryo(workbook):
+    """모든 시트의 폰트를 메이리오로 변경 (사용 범위의 빈 셀 포함: 나중에 입력해도 메이리오로 표시)"""
+    for sheet in workbook.worksheets:
+        apply_shared_style(workbook, _used_range_cells(sheet), font=DELIVERY_FONT)
+
+
+def set_zoom_to_100(workbook):
+    """모든 시트의 확대 비율을 100%로 설정"""
+    for sheet in workbook.worksheets:
+        sheet.sheet_view.zoomScale = 100
+
+
+def apply_transforms(workbook, sheet_name, transforms) -> list:
+    """
+    열린 워크북에 납품 작업 단계를 DELIVERY_TRANSFORMS 순서대로 적용.
+    fill_blank, align은 sheet_name 시트만 대상 (시트가 없으면 건너뛴다). 처리 메시지 목록을 반환
+    """
+    messages = []
+    sheet = workbook[sheet_name] if sheet_name in workbook.sheetnames else None
+    for transform in DELIVERY_TRANSFORMS:
+        if transform not in transforms:
+            continue
+        if transform in ("fill_blank", "align"):
+            if sheet is None:
+                messages.append(f"'{sheet_name}' シートが存在しません（{DELIVERY_TRANSFORMS[transform]}をスキップ）")
+                continue
+            if transform == "fill_blank":
+                fill_blank_cells(sheet)
+            else:
+                align_cells_left_top(sheet)
+        elif transform == "font":
+            set_font_to_meiryo(workbook)
+        elif transform == "zoom":
+            set_zoom_to_100(workbook)
+    return messages
+
+
+def process_workbook(file_path, sheet_name, transforms) -> DeliveryFileResult:
+    """
+    워크북을 한 번 열어 선택된 단계를 모두 적용하고 한 번 저장.
+    XML 패치로 처리할 수 있는 단계(拡大比率 등)만 선택된 경우에는 워크북을 열지 않고 zip 안의 해당 XML만 고친다
+    """
+    start = time.perf_counter()
+    try:
+        if all(transform in XML_PATCH_TRANSFORMS for transform in transforms):
+            patch_xlsx(file_path, [patch for transform in transforms for patch in XML_PATCH_TRANSFORMS[transform]])
+            return DeliveryFileResult(file_path, True, "", time.perf_counter() - start)
+        workbook = load_workbook(file_path)
+        try:
+            messages = apply_transforms(workbook, sheet_name, transforms)
+            workbook.save(file_path)
+        finally:
+            workbook.close()
+        return DeliveryFileResult(file_path, True, " / ".join(messages), time.perf_counter() - start)
+    except Exception as e:
+        return DeliveryFileResult(file_path, False, str(e), time.perf_counter() - start)
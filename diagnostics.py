@@ -0,0 +1,179 @@
+# 처리 단계별/파일별 소요 시간 및 메모리 측정 관련
+
+import os
+import json
+import time
+import logging
+import weakref
+import threading
+import tracemalloc
+import pandas as pd
+from contextlib import contextmanager
+from frame_schema import column_memory
+
+logger = logging.getLogger(__name__)
+
+# tracemalloc은 프로세스 전체에 하나뿐이므로, 여러 세션(스레드)의 Diagnostics가 함께 쓰도록 참조 수로 관리
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False  # 이 모듈이 tracemalloc을 시작했는지 (외부에서 시작한 추적은 정지하지 않음)
+_active_stages = 0
+
+
+def _acquire_tracing():
+    """추적 사용 등록. 처음 사용하는 쪽이 tracemalloc을 시작한다"""
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_users += 1
+
+
+def _release_tracing():
+    """추적 사용 해제. 마지막 사용자가 해제할 때, 이 모듈이 시작한 추적만 정지한다"""
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_owned:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            _tracing_owned = False
+
+
+def _begin_stage():
+    """단계 시작. 다른 단계가 진행 중이 아니면 피크를 현재 사용량으로 초기화"""
+    global _active_stages
+    with _tracing_lock:
+        if _active_stages == 0 and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        _active_stages += 1
+
+
+def _end_stage():
+    """단계 종료. 피크 메모리(MB) 반환 (추적 중이 아니면 None)"""
+    global _active_stages
+    with _tracing_lock:
+        _active_stages -= 1
+        if tracemalloc.is_tracing():
+            return round(tracemalloc.get_traced_memory()[1] / 1024 ** 2, 1)
+        return None
+
+
+class Diagnostics:
+    """
+    파이프라인 한 번 실행의 진단 정보.
+    - 단계별 소요 시간과 피크 메모리 (trace_memory가 켜져 있을 때만, tracemalloc 기준)
+      피크는 프로세스 전체의 값이다. 다른 세션의 단계가 동시에 진행 중이면 피크를 초기화하지 않으므로,
+      그 단계의 메모리까지 포함한 (더 큰) 값이 기록된다
+    - 파일별 읽기 시간, 행 수, 읽기 방식 (parse: 엑셀 파싱, cache: 파싱 캐시)
+    - DataFrame(merged_df 등)의 컬럼별 메모리 사용량
+    finish() 시 JSON 형식의 로그로 출력한다.
+    """
+
+    def __init__(self, pipeline, trace_memory=False):
+        self.pipeline = pipeline
+        self.trace_memory = trace_memory
+        self.stages = []
+        self.files = []
+        self.memory = []
+        self._tracing = None  # finish()까지 유지하는 추적 사용 등록 (해제 함수)
+        self._finished = False
+
+    @contextmanager
+    def stage(self, name):
+        """with 블록 하나를 단계로 측정 (단계는 중첩하지 않는다)"""
+        release_after_stage = False
+        if self.trace_memory:
+            if self._finished:
+                # finish() 이후의 단계 (지연 계산된 표 등)는 그 단계 동안만 추적
+                _acquire_tracing()
+                release_after_stage = True
+            elif self._tracing is None:
+                # 첫 단계부터 finish()까지 추적 유지 (finish() 없이 버려져도 해제되도록)
+                _acquire_tracing()
+                self._tracing = weakref.finalize(self, _release_tracing)
+            _begin_stage()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak_mb = _end_stage() if self.trace_memory else None
+            if release_after_stage:
+                _release_tracing()
+            self.stages.append({"stage": name, "seconds": seconds, "peak_mb": peak_mb})
+            # finish() 이후의 단계 (지연 계산된 표 등)는 바로 로그로 출력
+            if self._finished:
+                self._log({"event": "stage", **self.stages[-1]})
+
+    def record_file(self, file_path, seconds, rows, source):
+        self.files.append({"file": file_path, "seconds": seconds, "rows": rows, "source": source})
+
+    def record_memory(self, frame_name, df):
+        """DataFrame의 컬럼별 타입과 메모리 사용량 기록"""
+        usage = column_memory(df)
+        self.memory.append({
+            "frame": frame_name,
+            "bytes": int(usage['bytes'].sum()),
+            "columns": usage.to_dict('records'),
+        })
+
+    @property
+    def total_seconds(self):
+        return sum(stage["seconds"] for stage in self.stages)
+
+    def slowest_file(self):
+        """가장 오래 걸린 파일 정보 (없으면 None)"""
+        return max(self.files, key=lambda entry: entry["seconds"], default=None)
+
+    def stage_frame(self) -> pd.DataFrame:
+        """화면 표시용 단계별 표"""
+        return pd.DataFrame({
+            'ステージ': [stage["stage"] for stage in self.stages],
+            '処理時間(秒)': [round(stage["seconds"], 3) for stage in self.stages],
+            'ピークメモリ(MB)': [stage["peak_mb"] for stage in self.stages],
+        })
+
+    def file_frame(self) -> pd.DataFrame:
+        """화면 표시용 파일별 표 (소요 시간 내림차순)"""
+        df = pd.DataFrame({
+            'ファイル名': [os.path.basename(entry["file"]) for entry in self.files],
+            '処理時間(秒)': [round(entry["seconds"], 3) for entry in self.files],
+            '行数': [entry["rows"] for entry in self.files],
+            '読み込み元': [entry["source"] for entry in self.files],
+        })
+        return df.sort_values('処理時間(秒)', ascending=False, kind='stable').reset_index(drop=True)
+
+    def memory_frame(self) -> pd.DataFrame:
+        """화면 표시용 컬럼별 메모리 표"""
+        rows = [
+            (entry["frame"], column["column"], column["dtype"], round(column["bytes"] / 1024 ** 2, 2))
+            for entry in self.memory for column in entry["columns"]
+        ]
+        return pd.DataFrame(rows, columns=['データ', 'カラム', '型', 'メモリ(MB)'])
+
+    def finish(self):
+        """측정 종료. 추적 사용을 해제하고 (마지막 사용자면 tracemalloc 정지), 결과를 JSON 로그로 출력"""
+        if self._finished:
+            return self
+        self._finished = True
+        if self._tracing is not None:
+            self._tracing()
+        for stage in self.stages:
+            self._log({"event": "stage", **stage})
+        for entry in self.files:
+            self._log({"event": "file", **entry})
+        for entry in self.memory:
+            self._log({
+                "event": "memory", "frame": entry["frame"], "bytes": entry["bytes"],
+                "columns": {column["column"]: int(column["bytes"]) for column in entry["columns"]},
+            })
+        self._log({"event": "total", "seconds": self.total_seconds, "files": len(self.files)})
+        return self
+
+    def _log(self, record):
+        record = {"pipeline": self.pipeline, **record}
+        if isinstance(record.get("seconds"), float):
+            record["seconds"] = round(record["seconds"], 4)
+        logger.info(json.dumps(record, ensure_ascii=False))
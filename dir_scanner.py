@@ -0,0 +1,197 @@
+# 폴더 검색 (대상 엑셀 파일 목록과 stat 정보) 관련
+
+import os
+import fnmatch
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 검색 대상
+DEFAULT_INCLUDE = ("*.xlsx",)
+# Excel 잠금 파일 (~$*.xlsx)
+LOCK_FILE_PREFIX = "~$"
+
+
+@dataclass(frozen=True)
+class ScannedFile:
+    """검색된 파일 하나 (검색 시점의 mtime, size)"""
+    path: str       # os.path.join(검색 폴더, ...) 형식의 경로 (os.walk와 같은 표기)
+    relpath: str    # 검색 폴더 기준 상대 경로 ('/' 구분)
+    mtime_ns: int
+    size: int
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    @property
+    def depth(self):
+        return self.relpath.count('/')
+
+
+@dataclass
+class ScanResult:
+    """폴더 하나의 검색 결과 (파일은 경로순)"""
+    root: str
+    files: list
+
+    def paths(self) -> list:
+        return [scanned.path for scanned in self.files]
+
+    def find(self, file_name) -> Optional[ScannedFile]:
+        """이름이 일치하는 파일 (여러 개면 가장 얕은 폴더, 같은 깊이면 경로순으로 첫 번째)"""
+        matches = [scanned for scanned in self.files if scanned.name == file_name]
+        return min(matches, key=lambda scanned: (scanned.depth, scanned.relpath)) if matches else None
+
+    def subfolder(self, folder) -> "ScanResult":
+        """하위 폴더 folder의 파일만 (folder 기준 상대 경로로)"""
+        prefix = os.path.relpath(folder, self.root).replace(os.sep, '/').rstrip('/') + '/'
+        files = [
+            ScannedFile(os.path.join(folder, *scanned.relpath[len(prefix):].split('/')),
+                        scanned.relpath[len(prefix):], scanned.mtime_ns, scanned.size)
+            for scanned in self.files if scanned.relpath.startswith(prefix)
+        ]
+        return ScanResult(folder, files)
+
+
+def scan_directory(root, include=DEFAULT_INCLUDE, exclude=()) -> ScanResult:
+    """
+    os.scandir로 폴더를 한 번 순회하여 대상 파일과 stat 정보를 수집.
+    - include: 대상 파일명 패턴 (glob)
+    - exclude: 제외 패턴. '/'가 없으면 폴더/파일 이름, 있으면 root 기준 상대 경로와 비교 (일치한 폴더는 하위도 제외)
+      '/'로 끝나는 패턴(예: '*backup*/')은 폴더에만 적용된다. 제외 패턴으로 건너뛴 대상 파일은 로그에 남긴다
+    - Excel 잠금 파일(~$*)은 항상 제외
+    패턴은 대소문자를 구분하지 않는다. 읽을 수 없는 폴더는 경고 후 건너뛴다.
+    """
+    include = [pattern.lower() for pattern in include]
+    exclude = [pattern.lower() for pattern in exclude]
+    files = []
+    pending = [(root, "")]
+    while pending:
+        folder, rel_folder = pending.pop()
+        try:
+            with os.scandir(folder) as entries:
+                entries = list(entries)
+        except OSError as e:
+            logger.warning(f"フォルダーを読み込めないため、スキップします: {folder} ({str(e)})")
+            continue
+        for entry in entries:
+            relpath = f"{rel_folder}{entry.name}"
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if _matches(entry.name, relpath, exclude, is_dir):
+                    if not is_dir and any(fnmatch.fnmatchcase(entry.name.lower(), pattern) for pattern in include):
+                        logger.info(f"除外パターンに一致するため、ファイルをスキップします: {os.path.join(folder, entry.name)}")
+                    continue
+                if is_dir:
+                    pending.append((os.path.join(folder, entry.name), relpath + '/'))
+                    continue
+                if entry.name.startswith(LOCK_FILE_PREFIX) or not entry.is_file():
+                    continue
+                if not any(fnmatch.fnmatchcase(entry.name.lower(), pattern) for pattern in include):
+                    continue
+                # Windows에서는 검색 시 받은 정보를 사용하므로 파일별 추가 조회가 없다
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append(ScannedFile(os.path.join(folder, entry.name), relpath, stat.st_mtime_ns, stat.st_size))
+    files.sort(key=lambda scanned: scanned.path)
+    return ScanResult(root, files)
+
+
+def _matches(name, relpath, patterns, is_dir):
+    """제외 패턴과 일치하는지 ('/'로 끝나는 패턴은 폴더만 대상)"""
+    name, relpath = name.lower(), relpath.lower()
+    for pattern in patterns:
+        if pattern.endswith('/'):
+            if not is_dir:
+                continue
+            pattern = pattern.rstrip('/')
+        if fnmatch.fnmatchcase(relpath if '/' in pattern else name, pattern):
+            return True
+    return False
+
+
+class DirectoryScanner:
+    """
+    폴더 검색 결과를 공유하는 검색기.
+    같은 폴더(또는 이미 검색한 폴더의 하위 폴더)는 다시 검색하지 않는다.
+    폴더 내용이 바뀌었을 수 있는 시점(새 수집, 지문 계산 등)에는 clear()로 결과를 버린다.
+    """
+
+    def __init__(self, include=DEFAULT_INCLUDE, exclude=()):
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self._scans = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """설정값(scan_include, scan_exclude)으로 생성"""
+        return cls(
+            include=config.get("scan_include") or DEFAULT_INCLUDE,
+            exclude=config.get("scan_exclude") or ()
+        )
+
+    def scan(self, folder) -> ScanResult:
+        """folder의 검색 결과 (공유된 결과가 있으면 재사용)"""
+        folder_key = os.path.abspath(folder)
+        with self._lock:
+            cached = self._scans.get(folder_key)
+            if cached is not None:
+                return cached if cached.root == folder else _with_root(cached, folder)
+            for root_key, parent in self._scans.items():
+                if folder_key.startswith(root_key.rstrip(os.sep) + os.sep) and not self._excluded(folder_key, root_key):
+                    return parent.subfolder(folder)
+        result = scan_directory(folder, self.include, self.exclude)
+        with self._lock:
+            self._scans[folder_key] = result
+        return result
+
+    def _excluded(self, path_key, root_key, is_dir=True):
+        """root_key의 검색에서 path_key(하위 폴더, is_dir=False면 파일)가 제외 패턴으로 빠졌는지"""
+        parts = os.path.relpath(path_key, root_key).split(os.sep)
+        patterns = [pattern.lower() for pattern in self.exclude]
+        relpath = ""
+        for position, part in enumerate(parts):
+            relpath += part
+            if _matches(part, relpath, patterns, is_dir or position < len(parts) - 1):
+                return True
+            relpath += '/'
+        return False
+
+    def accepts(self, path, roots=()):
+        """
+        path가 검색 대상인지 (폴더 감시 이벤트 등 검색 외부에서 받은 경로 확인용).
+        roots 중 path를 포함하는 폴더가 있으면 그 폴더 기준 상대 경로로 제외 패턴을 판단한다.
+        """
+        name = os.path.basename(path)
+        if name.startswith(LOCK_FILE_PREFIX):
+            return False
+        if not any(fnmatch.fnmatchcase(name.lower(), pattern.lower()) for pattern in self.include):
+            return False
+        path_key = os.path.abspath(path)
+        for root in roots:
+            root_key = os.path.abspath(root)
+            if path_key.startswith(root_key.rstrip(os.sep) + os.sep):
+                return not self._excluded(path_key, root_key, is_dir=False)
+        return not _matches(name, name, [pattern.lower() for pattern in self.exclude], False)
+
+    def has_scanned(self, folder):
+        with self._lock:
+            return os.path.abspath(folder) in self._scans
+
+    def clear(self):
+        with self._lock:
+            self._scans.clear()
+
+
+def _with_root(result, folder):
+    """같은 폴더를 다른 표기(상대/절대 경로 등)로 요청한 경우 해당 표기의 경로로 변환"""
+    return ScanResult(folder, [
+        ScannedFile(os.path.join(folder, *scanned.relpath.split('/')), scanned.relpath, scanned.mtime_ns, scanned.size)
+        for scanned in result.files
+    ])
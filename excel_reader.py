@@ -0,0 +1,382 @@
+# 엑셀 시트 읽기 관련
+
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+from openpyxl.styles.numbers import builtin_format_code, is_date_format, is_timedelta_format
+from openpyxl.utils.datetime import from_excel, from_ISO8601, CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900
+from pandas.io.parsers import TextParser
+
+# 선택 가능한 읽기 엔진
+ENGINE_OPENPYXL = "openpyxl"  # openpyxl read-only 모드
+ENGINE_XML = "xml"            # .xlsx(zip) 안의 XML을 직접 파싱
+ENGINES = (ENGINE_OPENPYXL, ENGINE_XML)
+
+
+class SheetNotFoundError(Exception):
+    """지정된 시트가 통합 문서에 없음"""
+
+
+def _convert_value(value):
+    """pandas의 openpyxl 리더와 같은 규칙으로 셀 값 변환"""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        int_value = int(value)
+        return int_value if int_value == value else value
+    if isinstance(value, str) and value in ERROR_CODES:
+        return float("nan")
+    return value
+
+
+def _select_columns(header, usecols):
+    """헤더(공백 제거 기준)에서 usecols에 해당하는 열 위치 반환 (같은 이름이 여러 개면 첫 번째)"""
+    positions = {}
+    for position, name in enumerate(header):
+        key = name.strip() if isinstance(name, str) else name
+        if key in usecols and key not in positions:
+            positions[key] = position
+    return sorted(positions.values())
+
+
+def _project(row, positions):
+    """행에서 positions 위치의 값만 추출 (행이 짧으면 None)"""
+    if positions is None:
+        return row
+    return [row[position] if position < len(row) else None for position in positions]
+
+
+def _infer_column(values):
+    """한 열의 값 목록을 pd.read_excel과 같은 규칙(TextParser)으로 타입 추론하여 배열로 변환"""
+    column = TextParser(list(zip(values)), header=None, skip_blank_lines=False).read()
+    return column.iloc[:, 0].to_numpy() if column.shape[1] else np.array(values, dtype=object)
+
+
+def read_sheet(file_path, sheet_name, usecols=None, engine=ENGINE_OPENPYXL) -> pd.DataFrame:
+    """
+    통합 문서를 한 번만 열어 시트를 DataFrame으로 읽는다.
+    - engine: "openpyxl"(read-only 모드) 또는 "xml"(zip 내 XML 직접 파싱)
+    - usecols가 지정되면 해당 열(헤더 이름 기준)만 읽는다. 없는 열은 결과에서 빠진다.
+    - 컬럼명 앞뒤 공백 제거
+    - 값 변환은 pd.read_excel(engine='openpyxl')과 동일
+    행을 읽는 즉시 열별 목록에 나눠 담고, 시트 전체를 행 목록으로 들고 있지 않는다.
+    시트가 없으면 SheetNotFoundError.
+    """
+    if engine == ENGINE_OPENPYXL:
+        source = _OpenpyxlSheetSource(file_path, sheet_name)
+    elif engine == ENGINE_XML:
+        source = _XmlSheetSource(file_path, sheet_name)
+    else:
+        raise ValueError(f"未対応の読み込みエンジンです: {engine}")
+
+    columns = []
+    row_count = 0
+    last_row_with_data = -1
+    with source:
+        header = source.read_header()
+        if header is None:
+            return pd.DataFrame()
+        positions = None if usecols is None else _select_columns(header, set(usecols))
+        for row_number, row in enumerate(source.iter_rows(positions, header)):
+            converted_row = [_convert_value(value) for value in row]
+            width = len(converted_row)
+            while width and converted_row[width - 1] == "":
+                width -= 1
+            if width:
+                last_row_with_data = row_number
+            # 처음 값이 나온 열은 앞의 행들을 빈 값으로 채워서 추가
+            while len(columns) < width:
+                columns.append([""] * row_count)
+            for column, value in zip(columns, converted_row):
+                column.append(value)
+            for column in columns[len(converted_row):]:
+                column.append("")
+            row_count += 1
+
+    if last_row_with_data < 0:
+        return pd.DataFrame()
+    for column in columns:
+        del column[last_row_with_data + 1:]
+
+    # 컬럼명(빈 이름, 중복 이름 처리 포함)은 헤더 행만으로 pd.read_excel과 같이 결정
+    df = TextParser([[column[0] for column in columns]], header=0, skip_blank_lines=False).read()
+    if last_row_with_data > 0:
+        names = df.columns
+        df = pd.DataFrame({position: _infer_column(column[1:]) for position, column in enumerate(columns)})
+        df.columns = names
+    df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
+    return df
+
+
+class _OpenpyxlSheetSource:
+    """openpyxl read-only 모드로 시트 행을 읽는다"""
+
+    def __init__(self, file_path, sheet_name):
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self._workbook = None
+        self._rows = None
+
+    def __enter__(self):
+        self._workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        if self.sheet_name not in self._workbook.sheetnames:
+            self._workbook.close()
+            raise SheetNotFoundError(self.sheet_name)
+        sheet = self._workbook[self.sheet_name]
+        sheet.reset_dimensions()
+        self._rows = sheet.iter_rows(values_only=True)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._workbook.close()
+
+    def read_header(self):
+        return next(self._rows, None)
+
+    def iter_rows(self, positions, header):
+        """헤더를 포함한 행을 positions 위치만 추출하여 반환"""
+        yield _project(header, positions)
+        for row in self._rows:
+            yield _project(row, positions)
+
+
+# OOXML 네임스페이스
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_TAG_SI = f"{{{_MAIN_NS}}}si"
+_TAG_T = f"{{{_MAIN_NS}}}t"
+_TAG_R = f"{{{_MAIN_NS}}}r"
+_TAG_ROW = f"{{{_MAIN_NS}}}row"
+_TAG_C = f"{{{_MAIN_NS}}}c"
+_TAG_V = f"{{{_MAIN_NS}}}v"
+_TAG_IS = f"{{{_MAIN_NS}}}is"
+_TAG_SHEET_DATA = f"{{{_MAIN_NS}}}sheetData"
+
+
+def _rich_text_content(element):
+    """<si>/<is> 요소의 텍스트 (서식 run 포함, 후리가나 rPh 제외) - openpyxl Text.content와 동일"""
+    snippets = []
+    plain = element.find(_TAG_T)
+    if plain is not None and plain.text is not None:
+        snippets.append(plain.text)
+    for run in element.findall(_TAG_R):
+        text = run.find(_TAG_T)
+        if text is not None and text.text is not None:
+            snippets.append(text.text)
+    return "".join(snippets)
+
+
+def _column_index(coordinate):
+    """셀 좌표(예: 'AB12')에서 1부터 시작하는 열 번호"""
+    index = 0
+    for char in coordinate:
+        if "A" <= char <= "Z":
+            index = index * 26 + (ord(char) - 64)
+        else:
+            break
+    return index
+
+
+def _resolve_target(base_dir, target):
+    """관계(rels)의 Target을 zip 내부 경로로 변환"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+class _XmlSheetSource:
+    """
+    .xlsx(zip) 안의 XML을 직접 iterparse하여 시트 행을 읽는다.
+    셀 객체를 만들지 않고, 필요한 열의 셀만 값으로 변환한다.
+    """
+
+    def __init__(self, file_path, sheet_name):
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self._zip = None
+        self._names = set()
+        self._rows = None
+
+    def __enter__(self):
+        self._zip = zipfile.ZipFile(self.file_path)
+        try:
+            self._names = set(self._zip.namelist())
+            self._open_sheet()
+        except Exception:
+            self._zip.close()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        self._zip.close()
+
+    def _read_rels(self, rels_path):
+        if rels_path not in self._names:
+            return {}
+        root = ET.fromstring(self._zip.read(rels_path))
+        return {
+            rel.get("Id"): (rel.get("Type", ""), rel.get("Target", ""))
+            for rel in root.iter(f"{{{_PKG_REL_NS}}}Relationship")
+        }
+
+    def _open_sheet(self):
+        # 통합 문서 파트 위치 (보통 xl/workbook.xml)
+        workbook_path = "xl/workbook.xml"
+        for rel_type, target in self._read_rels("_rels/.rels").values():
+            if rel_type.endswith("/officeDocument"):
+                workbook_path = _resolve_target("", target)
+        workbook_dir = posixpath.dirname(workbook_path)
+        workbook_rels = self._read_rels(posixpath.join(workbook_dir, "_rels", posixpath.basename(workbook_path) + ".rels"))
+        workbook = ET.fromstring(self._zip.read(workbook_path))
+
+        # 날짜 기준 (1904 날짜 체계 여부)
+        workbook_pr = workbook.find(f"{{{_MAIN_NS}}}workbookPr")
+        date1904 = workbook_pr is not None and workbook_pr.get("date1904", "false").lower() in ("1", "true")
+        self._epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        sheet_path = None
+        for sheet in workbook.iter(f"{{{_MAIN_NS}}}sheet"):
+            if sheet.get("name") == self.sheet_name:
+                rel = workbook_rels.get(sheet.get(f"{{{_REL_NS}}}id"))
+                if rel is not None:
+                    sheet_path = _resolve_target(workbook_dir, rel[1])
+                break
+        if sheet_path is None or sheet_path not in self._names:
+            raise SheetNotFoundError(self.sheet_name)
+
+        shared_strings_path = styles_path = None
+        for rel_type, target in workbook_rels.values():
+            if rel_type.endswith("/sharedStrings"):
+                shared_strings_path = _resolve_target(workbook_dir, target)
+            elif rel_type.endswith("/styles"):
+                styles_path = _resolve_target(workbook_dir, target)
+        self._shared_strings = self._read_shared_strings(shared_strings_path)
+        self._date_styles, self._timedelta_styles = self._read_date_styles(styles_path)
+        self._rows = self._iter_raw_rows(sheet_path)
+
+    def _read_shared_strings(self, path):
+        strings = []
+        if not path or path not in self._names:
+            return strings
+        with self._zip.open(path) as source:
+            for _, element in ET.iterparse(source):
+                if element.tag == _TAG_SI:
+                    strings.append(_rich_text_content(element).replace("x005F_", ""))
+                    element.clear()
+        return strings
+
+    def _read_date_styles(self, path):
+        """날짜/시간 표시 형식을 가진 셀 스타일 번호 (openpyxl과 같은 판정)"""
+        date_styles, timedelta_styles = set(), set()
+        if not path or path not in self._names:
+            return date_styles, timedelta_styles
+        root = ET.fromstring(self._zip.read(path))
+        custom_formats = {}
+        num_fmts = root.find(f"{{{_MAIN_NS}}}numFmts")
+        if num_fmts is not None:
+            for num_fmt in num_fmts.iter(f"{{{_MAIN_NS}}}numFmt"):
+                custom_formats[int(num_fmt.get("numFmtId"))] = num_fmt.get("formatCode")
+        cell_xfs = root.find(f"{{{_MAIN_NS}}}cellXfs")
+        if cell_xfs is not None:
+            for style_id, xf in enumerate(cell_xfs.findall(f"{{{_MAIN_NS}}}xf")):
+                num_fmt_id = int(xf.get("numFmtId", 0))
+                fmt = custom_formats.get(num_fmt_id) or builtin_format_code(num_fmt_id)
+                if fmt and is_date_format(fmt):
+                    date_styles.add(style_id)
+                    if is_timedelta_format(fmt):
+                        timedelta_styles.add(style_id)
+        return date_styles, timedelta_styles
+
+    def _iter_raw_rows(self, sheet_path):
+        """
+        행 순서대로 {열 번호: (타입, 원시 값, 스타일)} 반환.
+        파일에 없는 중간 행은 openpyxl read-only와 같이 빈 행으로 채운다.
+        """
+        expected_row = 1
+        row_counter = 0
+        with self._zip.open(sheet_path) as source:
+            sheet_data = None
+            for event, element in ET.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if element.tag == _TAG_SHEET_DATA:
+                        sheet_data = element
+                    continue
+                if element.tag != _TAG_ROW:
+                    continue
+                row_attr = element.get("r")
+                row_counter = int(row_attr) if row_attr else row_counter + 1
+                cells = {}
+                column_counter = 0
+                for cell in element.findall(_TAG_C):
+                    coordinate = cell.get("r")
+                    column_counter = _column_index(coordinate) if coordinate else column_counter + 1
+                    data_type = cell.get("t", "n")
+                    if data_type == "inlineStr":
+                        inline = cell.find(_TAG_IS)
+                        value = _rich_text_content(inline) if inline is not None else None
+                    else:
+                        value = cell.findtext(_TAG_V)
+                    cells[column_counter] = (data_type, value, cell.get("s"))
+                # 처리한 행은 바로 버려 메모리 사용량을 일정하게 유지
+                if sheet_data is not None:
+                    sheet_data.remove(element)
+                else:
+                    element.clear()
+                while expected_row < row_counter:
+                    expected_row += 1
+                    yield {}
+                expected_row = row_counter + 1
+                yield cells
+
+    def _decode(self, raw):
+        """셀 정보를 값으로 변환 (openpyxl WorkSheetParser.parse_cell과 같은 규칙)"""
+        data_type, value, style = raw
+        if value is None:
+            return None
+        if data_type == "n":
+            value = float(value) if ("." in value or "E" in value or "e" in value) else int(value)
+            style_id = int(style) if style else 0
+            if style_id in self._date_styles:
+                try:
+                    return from_excel(value, self._epoch, timedelta=style_id in self._timedelta_styles)
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return value
+        if data_type == "s":
+            return self._shared_strings[int(value)]
+        if data_type == "b":
+            return bool(int(value))
+        if data_type == "d":
+            return from_ISO8601(value)
+        return value
+
+    def _row_values(self, cells, positions):
+        if positions is None:
+            if not cells:
+                return ()
+            values = [None] * max(cells)
+            for column, raw in cells.items():
+                values[column - 1] = self._decode(raw)
+            return values
+        values = []
+        for position in positions:
+            raw = cells.get(position + 1)
+            values.append(self._decode(raw) if raw is not None else None)
+        return values
+
+    def read_header(self):
+        cells = next(self._rows, None)
+        if cells is None:
+            return None
+        return tuple(self._row_values(cells, None))
+
+    def iter_rows(self, positions, header):
+        """헤더를 포함한 행을 positions 위치의 셀만 변환하여 반환"""
+        yield _project(header, positions)
+        for cells in self._rows:
+            yield self._row_values(cells, positions)
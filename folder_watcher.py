@@ -0,0 +1,183 @@
+# フォルダー監視関連
+
+import os
+import weakref
+import threading
+import logging
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+
+logger = logging.getLogger(__name__)
+
+
+def is_watched_excel_file(path):
+    """감시 대상 엑셀 파일인지 확인 (Excel 잠금 파일 ~$*.xlsx 제외)"""
+    file_name = os.path.basename(path)
+    return file_name.endswith(".xlsx") and not file_name.startswith("~$")
+
+
+class _ExcelChangeHandler(FileSystemEventHandler):
+    """.xlsx 파일 변경 이벤트를 공유 감시(_SharedObserver)에 전달"""
+
+    def __init__(self, shared):
+        super().__init__()
+        self._shared = shared
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path and is_watched_excel_file(path):
+                self._shared.dispatch(os.fsdecode(path))
+
+
+class _Subscription:
+    """감시 이벤트를 받는 FolderWatcher 하나의 미처리 변경 경로"""
+
+    def __init__(self):
+        self.changes = set()
+        self.lock = threading.Lock()
+
+    def add(self, path):
+        with self.lock:
+            self.changes.add(path)
+
+
+class _SharedObserver:
+    """
+    같은 폴더 목록을 감시하는 watchdog Observer 하나와 그 구독자들.
+    구독자(세션)가 모두 해제되면 Observer 스레드를 종료한다.
+    FolderWatcher 객체가 아니라 구독(_Subscription)만 보관하므로, 세션이 사라지면 FolderWatcher는 회수될 수 있다.
+    """
+
+    def __init__(self, folders):
+        self.folders = folders
+        self.subscriptions = set()
+        self._observer = None
+
+    def start(self):
+        """감시 시작. 네이티브 감시에 실패하면 폴링 방식으로 전환"""
+        handler = _ExcelChangeHandler(self)
+        try:
+            self._observer = self._start_observer(Observer(), handler)
+        except Exception as e:
+            logger.warning(f"フォルダー監視を開始できませんでした。ポーリング監視に切り替えます: {str(e)}")
+            self._observer = self._start_observer(PollingObserver(), handler)
+        logger.info(f"フォルダー監視を開始しました: {', '.join(self.folders)}")
+
+    def _start_observer(self, observer, handler):
+        for folder in self.folders:
+            observer.schedule(handler, folder, recursive=True)
+        observer.daemon = True
+        observer.start()
+        return observer
+
+    def stop(self):
+        if self._observer is None:
+            return
+        self._observer.stop()
+        self._observer.join(timeout=5)
+        self._observer = None
+        logger.info(f"フォルダー監視を終了しました: {', '.join(self.folders)}")
+
+    def is_alive(self):
+        return self._observer is not None and self._observer.is_alive()
+
+    def dispatch(self, path):
+        for subscription in list(self.subscriptions):
+            subscription.add(path)
+
+
+# 폴더 목록 → 공유 감시 (프로세스 전체에서 폴더 목록별로 Observer 스레드 하나)
+_shared_observers = {}
+_shared_observers_lock = threading.Lock()
+
+
+def _acquire(folders, subscription) -> _SharedObserver:
+    """폴더 목록의 공유 감시에 구독을 추가 (없으면 시작)"""
+    key = tuple(folders)
+    with _shared_observers_lock:
+        shared = _shared_observers.get(key)
+        if shared is None or not shared.is_alive():
+            shared = _SharedObserver(list(folders))
+            shared.start()
+            _shared_observers[key] = shared
+        shared.subscriptions.add(subscription)
+        return shared
+
+
+def _release(folders, subscription):
+    """구독 해제. 마지막 구독이면 Observer 스레드를 종료"""
+    key = tuple(folders)
+    with _shared_observers_lock:
+        shared = _shared_observers.get(key)
+        if shared is None:
+            return
+        shared.subscriptions.discard(subscription)
+        if shared.subscriptions:
+            return
+        del _shared_observers[key]
+    shared.stop()
+
+
+def active_observer_count():
+    """실행 중인 공유 감시(Observer 스레드) 수"""
+    with _shared_observers_lock:
+        return len(_shared_observers)
+
+
+class FolderWatcher:
+    """
+    지정된 폴더들의 .xlsx 변경을 감시하고, 변경된 파일 경로를 모아둔다.
+    Excel 저장 시 여러 이벤트가 발생하므로 경로 단위로 중복 제거한다.
+    같은 폴더 목록을 감시하는 세션들은 Observer 스레드 하나를 공유하고(참조 수), 변경 경로는 세션별로 따로 모은다.
+    stop()을 호출하지 않고 세션이 끝나도, 객체가 회수될 때 구독이 해제된다.
+    """
+
+    def __init__(self, folders):
+        # 중복/하위 폴더 제거 (상위 폴더를 재귀 감시하면 충분)
+        normalized = sorted({os.path.abspath(folder) for folder in folders if folder and os.path.isdir(folder)})
+        self.folders = [
+            folder for folder in normalized
+            if not any(folder != other and folder.startswith(other.rstrip(os.sep) + os.sep) for other in normalized)
+        ]
+        self._subscription = None
+        self._shared = None
+        self._finalizer = None
+
+    def start(self):
+        """감시 시작 (같은 폴더 목록의 감시가 이미 있으면 공유)"""
+        if self._subscription is not None:
+            return
+        subscription = _Subscription()
+        self._shared = _acquire(self.folders, subscription)
+        self._subscription = subscription
+        self._finalizer = weakref.finalize(self, _release, tuple(self.folders), subscription)
+
+    def stop(self):
+        """감시 종료 (다른 세션이 공유 중이면 Observer는 유지)"""
+        if self._finalizer is None:
+            return
+        self._finalizer()
+        self._finalizer = None
+        self._subscription = None
+        self._shared = None
+
+    def is_running(self):
+        return self._shared is not None and self._shared.is_alive()
+
+    def has_changes(self):
+        """미처리 변경 존재 여부"""
+        if self._subscription is None:
+            return False
+        with self._subscription.lock:
+            return bool(self._subscription.changes)
+
+    def drain_changes(self):
+        """모인 변경 경로를 반환하고 비운다"""
+        if self._subscription is None:
+            return []
+        with self._subscription.lock:
+            changes, self._subscription.changes = self._subscription.changes, set()
+        return sorted(changes)
@@ -0,0 +1,59 @@
+# 병합된 시험표 데이터(merged_df)의 메모리 절약형 컬럼 타입 관련
+
+import logging
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_float_dtype
+
+logger = logging.getLogger(__name__)
+
+# 고유 값 비율이 이 값 이하인 문자열 컬럼은 category로 변환
+CATEGORY_MAX_RATIO = 0.5
+# 고유 값 비율이 높은 문자열 컬럼 (Arrow 기반 문자열)
+STRING_DTYPE = "string[pyarrow]"
+
+
+def compact_frame(df: pd.DataFrame, config) -> pd.DataFrame:
+    """
+    merged_df의 컬럼 타입을 메모리 효율이 좋은 타입으로 변환 (컬럼 단위로 교체, 행 전체 복사 없음).
+    - 試験結果, ファイル名: category
+    - 문자열만 있는 컬럼: 고유 값이 적으면 category, 많으면 Arrow 기반 문자열
+    - 정수 값만 있는 float 컬럼 (빈 값 때문에 float이 된 번호 등): nullable 정수(Int64)
+    숫자와 문자열이 섞인 컬럼은 값이 바뀌지 않도록 object 그대로 둔다.
+    """
+    if df.empty:
+        return df
+    always_category = {config["result_column"], config.get("file_name_column", "ファイル名")}
+    for col in df.columns:
+        dtype = _compact_dtype(df[col], col in always_category)
+        if dtype is not None:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def _compact_dtype(series: pd.Series, always_category):
+    """컬럼 하나의 변환 후 타입 (변환하지 않으면 None)"""
+    if series.dtype == object:
+        if infer_dtype(series, skipna=True) not in ("string", "empty"):
+            return None
+        if always_category or series.nunique(dropna=True) <= len(series) * CATEGORY_MAX_RATIO:
+            return "category"
+        return STRING_DTYPE
+    if is_float_dtype(series.dtype):
+        values = series.to_numpy()
+        present = values[~np.isnan(values)]
+        if present.size and np.array_equal(present, np.trunc(present)) and np.abs(present).max() < 2 ** 53:
+            return "Int64"
+    return None
+
+
+def column_memory(df: pd.DataFrame) -> pd.DataFrame:
+    """컬럼별 타입과 메모리 사용량 (bytes, 인덱스 포함, 내림차순)"""
+    usage = df.memory_usage(index=True, deep=True)
+    dtypes = {col: str(dtype) for col, dtype in df.dtypes.items()}
+    frame = pd.DataFrame({
+        'column': [str(col) for col in usage.index],
+        'dtype': [dtypes.get(col, 'index') for col in usage.index],
+        'bytes': usage.to_numpy(),
+    })
+    return frame.sort_values('bytes', ascending=False, kind='stable').reset_index(drop=True)
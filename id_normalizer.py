@@ -0,0 +1,81 @@
+# 버그/QA 번호(ID) 정규화 관련
+
+import re
+import logging
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# ID 템플릿에서 번호가 들어갈 자리
+TEMPLATE_PLACEHOLDER = "{Int}"
+
+
+class IdNormalizer:
+    """
+    정규식(bug_regex/qa_regex)과 템플릿(bug_pattern_template/qa_pattern_template)으로
+    ID 컬럼 전체를 한 번에(벡터 연산) 변환한다.
+    - extract_numbers: ID 문자열에서 번호 추출 (정규식 첫 번째 그룹, re.search와 같은 규칙)
+    - render: 번호로 ID 문자열 생성
+    - normalize: 숫자만 입력된 ID는 템플릿 형식으로, 그 외는 원래 값 그대로
+    """
+
+    def __init__(self, regex, template):
+        self.pattern = re.compile(regex)
+        self.template = template
+        self._template_parts = template.split(TEMPLATE_PLACEHOLDER)
+
+    def extract_numbers(self, values: pd.Series) -> pd.Series:
+        """번호 추출 (Int64). 빈 값이나 정규식과 일치하지 않는 값은 <NA>"""
+        index, values = values.index, values.reset_index(drop=True)
+        numbers = pd.Series(pd.NA, index=values.index, dtype="Int64")
+        present = values.notna()
+        if present.any():
+            extracted = values[present].astype(str).str.extract(self.pattern, expand=True)[0]
+            numbers[present] = pd.to_numeric(extracted, errors="coerce").astype("Int64")
+        numbers.index = index
+        return numbers
+
+    def render(self, numbers: pd.Series) -> pd.Series:
+        """번호로 ID 생성 (소수는 버림). 번호가 없으면 None"""
+        index = numbers.index
+        numeric = pd.to_numeric(numbers.reset_index(drop=True), errors="coerce").astype(float)
+        rendered = pd.Series(None, index=numeric.index, dtype=object)
+        present = numeric.notna()
+        if present.any():
+            digits = np.trunc(numeric[present]).astype(np.int64).astype(str)
+            result = self._template_parts[0]
+            for part in self._template_parts[1:]:
+                result = result + digits + part
+            rendered[present] = result
+        rendered.index = index
+        return rendered
+
+    def normalize(self, values: pd.Series) -> pd.Series:
+        """숫자(예: 12, '12', 12.0)만 입력된 ID는 템플릿 형식으로 변환, 그 외는 원래 값 유지"""
+        index, values = values.index, values.reset_index(drop=True)
+        normalized = values.astype(object)
+        present = values.notna()
+        text = values[present].astype(str)
+        numeric_like = text.str.replace(".", "", n=1, regex=False).str.isdigit()
+        if numeric_like.any():
+            numeric_text = text[numeric_like]
+            numbers = pd.to_numeric(numeric_text, errors="coerce").astype(float)
+            # 전각 숫자 등 to_numeric이 처리하지 못하는 값만 개별 변환
+            unparsed = numbers.isna()
+            if unparsed.any():
+                numbers[unparsed] = numeric_text[unparsed].map(float)
+            normalized[numbers.index] = self.render(numbers)
+        normalized.index = index
+        return normalized
+
+    def unmatched(self, values: pd.Series) -> pd.Series:
+        """값이 있지만 정규식과 일치하지 않는 행의 불리언 마스크"""
+        return values.notna() & self.extract_numbers(values).isna()
+
+
+@lru_cache(maxsize=None)
+def get_normalizer(regex, template) -> IdNormalizer:
+    """설정값별 IdNormalizer (정규식은 프로세스에서 한 번만 컴파일)"""
+    return IdNormalizer(regex, template)
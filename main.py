@@ -1,4 +1,5 @@
 import io
+import multiprocessing
 import streamlit as st
 import pandas as pd
 from datetime import datetime
@@ -10,6 +11,11 @@ from ui_manager import UIManager
 from business_manager import BusinessManager
 from state_manager import StateManager
 
+# PyInstaller로 빌드한 실행 파일이 프로세스 풀(납품 작업 병렬 처리 등)의 워커로 실행된 경우,
+# 화면을 만들지 않고 작업만 처리하도록 가장 먼저 호출 (실행 파일이 아니면 아무것도 하지 않음)
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
 # 페이지 설정은 가장 먼저 호출되어야 함
 st.set_page_config(layout="wide")
 
@@ -40,8 +46,24 @@ def main():
             
             # 데이터 수집
             if state_manager.get_folder_path():
-                test_result = business_manager.collect_data(state_manager.get_folder_path())
-                state_manager.set_test_result(test_result)
+                data_collector = business_manager.load_collector(state_manager.get_folder_path())
+                state_manager.set_collector(data_collector)
+                state_manager.set_test_result(data_collector.test_result)
+                # 수집 대상이 바뀌었으므로 기존 감시는 종료
+                state_manager.set_watcher(None)
+        
+        # 폴더 감시 (변경된 파일만 다시 읽어 결과 갱신)
+        data_collector = state_manager.get_collector()
+        if data_collector is not None:
+            watcher = state_manager.get_watcher()
+            if ui_manager.show_watch_toggle():
+                if watcher is None or not watcher.is_running():
+                    watcher = business_manager.start_watch(data_collector)
+                    state_manager.set_watcher(watcher)
+                business_manager.refresh_data(data_collector, watcher)
+                ui_manager.poll_folder_watcher(watcher, config.get("watch_interval_seconds", 5))
+            elif watcher is not None:
+                state_manager.set_watcher(None)
         
         # 결과 표시
         ui_manager.display_test_results(state_manager.get_test_result(), config)
@@ -56,7 +78,7 @@ def main():
             
             # 납품 작업 처리
             if state_manager.get_folder_path():
-                business_manager.process_delivery(state_manager.get_folder_path())
+                business_manager.process_delivery(state_manager.get_folder_path(), ui_manager.create_delivery_progress())
 
 if __name__ == "__main__":
     main()
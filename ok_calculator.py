@@ -0,0 +1,211 @@
+# OK 건수 계산 전략 (일별, 누적, 주별 번업, 이동 평균 속도) 관련
+
+import copy
+import threading
+import pandas as pd
+from typing import Protocol
+
+# 이동 평균 속도의 기본 기간 (일)
+DEFAULT_VELOCITY_WINDOW = 7
+# 주별 번업의 주 단위 (월요일 시작)
+WEEK_PERIOD = 'W-SUN'
+
+
+class OKCalculator(Protocol):
+    """OK 계산 전략 인터페이스"""
+    def calculate(self, df: pd.DataFrame, config: dict) -> pd.DataFrame:
+        """데이터프레임을 받아 계산된 결과를 반환 (보관 중인 상태는 버리고 전체 계산)"""
+        pass
+
+    def update(self, changes: pd.DataFrame, config: dict, removed=()) -> pd.DataFrame:
+        """
+        새로 추가되거나 건수가 바뀐 날짜의 행 [날짜, OK]과 없어진 날짜(removed)만 받아
+        보관 중인 상태를 갱신하고 전체 결과를 반환
+        """
+        pass
+
+
+class BaseOKCalculator:
+    """
+    기본 OK 계산 클래스.
+    날짜별 OK 건수(날짜 오름차순)와 마지막 계산 결과를 상태로 보관하고,
+    바뀐 날짜 중 가장 이른 날짜 이후의 결과만 _recompute()로 다시 계산한다.
+    (날짜가 뒤에 추가되기만 하는 일반적인 갱신에서는 추가된 날짜만 계산)
+    """
+    # 결과 컬럼 (날짜 컬럼 제외)
+    value_columns = ['OK']
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._ok = pd.Series(dtype='int64')
+        self._result = None
+
+    def clone(self):
+        """
+        보관 중인 상태를 이어받는 새 계산기 (잠금은 따로 가진다).
+        상태(Series/DataFrame)는 갱신 시 새 객체로 교체되고 직접 변경되지 않으므로 복사하지 않고 공유한다
+        """
+        with self._lock:
+            cloned = copy.copy(self)
+        cloned._lock = threading.RLock()
+        return cloned
+
+    def _prepare_data(self, df: pd.DataFrame, config: dict) -> pd.DataFrame:
+        """공통 데이터 전처리"""
+        if df.empty:
+            return pd.DataFrame()
+        return df
+
+    def calculate(self, df: pd.DataFrame, config: dict) -> pd.DataFrame:
+        with self._lock:
+            self._reset()
+            return self._apply(df, config, ())
+
+    def update(self, changes: pd.DataFrame, config: dict, removed=()) -> pd.DataFrame:
+        with self._lock:
+            return self._apply(changes, config, removed)
+
+    def sync(self, ok_table: pd.DataFrame, config: dict) -> pd.DataFrame:
+        """
+        ok_table [날짜, OK] 전체를 받아 보관 중인 상태와 다른 날짜만 update.
+        상태가 없으면 calculate와 같다. (갱신/캐시된 수집 결과를 다시 계산할 때 사용)
+        """
+        with self._lock:
+            changes, removed = self._diff(ok_table, config)
+            return self._apply(changes, config, removed)
+
+    def _diff(self, ok_table, config):
+        """보관 중인 날짜별 OK 건수와 ok_table의 차이 (바뀐 행, 없어진 날짜 목록)"""
+        ok_table = self._prepare_data(ok_table, config)
+        if ok_table.empty:
+            return ok_table, list(self._ok.index)
+        if self._result is None:
+            return ok_table, []
+        date_col = config["date_column"]
+        new_ok = pd.Series(ok_table['OK'].to_numpy(), index=ok_table[date_col])
+        removed = list(self._ok.index.difference(new_ok.index))
+        previous = self._ok.reindex(new_ok.index)
+        changed = (previous != new_ok).to_numpy()
+        return ok_table[changed], removed
+
+    def _apply(self, changes, config, removed):
+        date_col = config["date_column"]
+        changes = self._prepare_data(changes, config)
+        removed = list(removed)
+        if changes.empty and not removed:
+            return self._output()
+
+        changed_dates = []
+        ok = self._ok
+        if removed:
+            ok = ok.drop(removed, errors='ignore')
+            changed_dates += removed
+        if not changes.empty:
+            new_ok = pd.Series(changes['OK'].to_numpy(dtype='int64'), index=changes[date_col])
+            new_ok = new_ok[~new_ok.index.duplicated(keep='last')]
+            ok = pd.concat([ok.drop(new_ok.index, errors='ignore'), new_ok]) if not ok.empty else new_ok
+            changed_dates += list(new_ok.index)
+        if not ok.index.is_monotonic_increasing:
+            ok = ok.sort_index(kind='stable')
+
+        first_changed = min(changed_dates)
+        start = int(ok.index.searchsorted(first_changed))
+        previous = self._result if self._result is not None else pd.DataFrame()
+        self._ok = ok
+        self._result = self._recompute(ok, start, first_changed, previous, config) if not ok.empty else None
+        return self._output()
+
+    def _output(self):
+        # 호출한 쪽에서 결과를 변경해도 보관 중인 상태에 영향이 없도록 사본을 반환
+        return self._result.copy() if self._result is not None else pd.DataFrame()
+
+    def _recompute(self, ok: pd.Series, start: int, first_changed, previous: pd.DataFrame, config) -> pd.DataFrame:
+        """
+        날짜별 OK 건수 ok 중 위치 start(가장 이른 변경 날짜 first_changed의 위치) 이후가 바뀌었을 때의 전체 결과.
+        previous는 이전 결과 (start 이전 날짜에 해당하는 부분은 그대로 사용할 수 있다)
+        """
+        raise NotImplementedError
+
+    def _frame(self, dates, values: dict, config) -> pd.DataFrame:
+        frame = pd.DataFrame({config["date_column"]: dates})
+        for col in self.value_columns:
+            frame[col] = values[col]
+        return frame
+
+
+class CumulativeOKCalculator(BaseOKCalculator, OKCalculator):
+    """누적 OK 계산 전략 (바뀐 날짜 이전의 누적 값을 이어서 계산)"""
+    value_columns = ['OK_cumulative']
+
+    def _recompute(self, ok, start, first_changed, previous, config):
+        kept = previous.iloc[:start]
+        carry = kept['OK_cumulative'].iloc[-1] if not kept.empty else 0
+        tail = ok.iloc[start:]
+        recomputed = self._frame(tail.index, {'OK_cumulative': tail.cumsum().to_numpy() + carry}, config)
+        return _concat(kept, recomputed)
+
+
+class DailyOKCalculator(BaseOKCalculator, OKCalculator):
+    """일별 OK 계산 전략"""
+    def _recompute(self, ok, start, first_changed, previous, config):
+        return self._frame(ok.index, {'OK': ok.to_numpy()}, config)
+
+
+class WeeklyBurnUpCalculator(BaseOKCalculator, OKCalculator):
+    """
+    주별 번업 계산 전략 (월요일 시작 주별 OK 건수와 누적).
+    바뀐 날짜가 속한 주 이후만 다시 집계한다.
+    """
+    value_columns = ['OK', 'OK_cumulative']
+
+    def _recompute(self, ok, start, first_changed, previous, config):
+        date_col = config["date_column"]
+        weeks = _week_starts(ok.index)
+        first_week = _week_starts([first_changed])[0]
+        kept = previous[previous[date_col] < first_week] if not previous.empty else previous
+        carry = kept['OK_cumulative'].iloc[-1] if not kept.empty else 0
+
+        # 바뀐 날짜가 주 중간이면 같은 주의 앞 날짜도 포함하여 주 단위로 다시 집계
+        first = int(weeks.searchsorted(first_week))
+        weekly = ok.iloc[first:].groupby(weeks[first:], sort=True).sum()
+        recomputed = self._frame(weekly.index, {
+            'OK': weekly.to_numpy(),
+            'OK_cumulative': weekly.cumsum().to_numpy() + carry,
+        }, config)
+        return _concat(kept, recomputed)
+
+
+class MovingAverageVelocityCalculator(BaseOKCalculator, OKCalculator):
+    """
+    이동 평균 속도 계산 전략 (날짜별 직전 N일간 OK 건수의 하루 평균, 시험하지 않은 날은 0건).
+    N은 설정값 ok_velocity_window (기본 7일). 바뀐 날짜 이후의 값만 다시 계산한다.
+    """
+    value_columns = ['OK_velocity']
+
+    def _recompute(self, ok, start, first_changed, previous, config):
+        window = max(1, int(config.get("ok_velocity_window", DEFAULT_VELOCITY_WINDOW)))
+        dates = pd.DatetimeIndex(pd.to_datetime(ok.index))
+        kept = previous.iloc[:start]
+        # start 이후 값의 계산에는 window일 전까지의 건수가 필요
+        first = int(dates.searchsorted(dates[start] - pd.Timedelta(days=window - 1))) if start < len(dates) else start
+        source = pd.Series(ok.iloc[first:].to_numpy(dtype='float64'), index=dates[first:])
+        velocity = source.rolling(f'{window}D').sum() / window
+        recomputed = self._frame(ok.index[start:], {'OK_velocity': velocity.iloc[start - first:].to_numpy()}, config)
+        return _concat(kept, recomputed)
+
+
+def _concat(kept, recomputed) -> pd.DataFrame:
+    """이전 결과 중 그대로 사용하는 앞부분과 다시 계산한 뒷부분을 연결"""
+    if kept.empty:
+        return recomputed
+    if recomputed.empty:
+        return kept.reset_index(drop=True)
+    return pd.concat([kept, recomputed], ignore_index=True)
+
+
+def _week_starts(dates) -> pd.DatetimeIndex:
+    """날짜가 속한 주의 시작일 (월요일)"""
+    return pd.DatetimeIndex(pd.to_datetime(dates)).to_period(WEEK_PERIOD).start_time
@@ -0,0 +1,312 @@
+# 파일별 파싱 결과 디스크 캐시
+
+import os
+import json
+import glob
+import math
+import uuid
+import hashlib
+import logging
+from datetime import datetime, date, time, timedelta
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# 캐시 포맷이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_FORMAT_VERSION = 3
+
+# 파싱 결과에 영향을 주는 설정 키 (이 값들이 바뀌면 캐시 무효)
+RELEVANT_CONFIG_KEYS = [
+    "sheet_name",
+    "date_column",
+    "result_column",
+    "test_id_column",
+    "test_name_column",
+    "bug_no_column",
+    "qa_no_column",
+    "bug_file_name",
+    "qa_file_name",
+    "bug_file_columns",
+    "qa_file_columns",
+    "projected_read",
+    "excel_engine",
+    "file_name_column",
+]
+
+# 이전 포맷(공유 인덱스 + pickle)의 파일. 읽지 않고 삭제만 한다
+LEGACY_PATTERNS = ("index.json", "*.pkl")
+
+# object 컬럼 저장 방식: 문자열 + None / 문자열 + NaN은 Arrow 문자열 그대로, 그 외는 값별 태그 인코딩
+KIND_STRING = "str"
+KIND_STRING_NAN = "str_nan"
+KIND_TAGGED = "tagged"
+
+
+def config_hash(config, keys=RELEVANT_CONFIG_KEYS):
+    """지정된 설정 키 값들로 해시 생성"""
+    relevant = {key: config.get(key) for key in keys}
+    relevant["__version__"] = CACHE_FORMAT_VERSION
+    payload = json.dumps(relevant, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _encode_value(value):
+    """셀 값 하나를 타입 태그가 붙은 JSON 호환 값으로 (지원하지 않는 타입은 TypeError)"""
+    if value is None:
+        return None
+    if value is pd.NaT:
+        return ["NaT"]
+    if isinstance(value, str):
+        return ["s", value]
+    if isinstance(value, (bool, np.bool_)):
+        return ["b", bool(value)]
+    if isinstance(value, (int, np.integer)):
+        return ["i", int(value)]
+    if isinstance(value, (float, np.floating)):
+        return ["f", repr(float(value))]
+    if isinstance(value, pd.Timestamp):
+        return ["T", value.isoformat()]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, time):
+        return ["t", value.isoformat()]
+    if isinstance(value, pd.Timedelta):
+        return ["TD", value.value]
+    if isinstance(value, timedelta):
+        return ["td", [value.days, value.seconds, value.microseconds]]
+    raise TypeError(f"unsupported value type: {type(value).__name__}")
+
+
+def _decode_value(encoded):
+    if encoded is None:
+        return None
+    tag, payload = encoded[0], encoded[1] if len(encoded) > 1 else None
+    if tag == "NaT":
+        return pd.NaT
+    if tag in ("s", "b", "i"):
+        return payload
+    if tag == "f":
+        return float(payload)
+    if tag == "T":
+        return pd.Timestamp(payload)
+    if tag == "dt":
+        return datetime.fromisoformat(payload)
+    if tag == "d":
+        return date.fromisoformat(payload)
+    if tag == "t":
+        return time.fromisoformat(payload)
+    if tag == "TD":
+        return pd.Timedelta(payload)
+    if tag == "td":
+        return timedelta(*payload)
+    raise ValueError(f"unknown value tag: {tag}")
+
+
+def _object_kind(values):
+    """object 컬럼의 저장 방식 결정"""
+    has_none = has_nan = False
+    for value in values:
+        if isinstance(value, str):
+            continue
+        if value is None:
+            has_none = True
+        elif isinstance(value, float) and math.isnan(value):
+            has_nan = True
+        else:
+            return KIND_TAGGED
+    if has_none and has_nan:
+        return KIND_TAGGED
+    return KIND_STRING_NAN if has_nan else KIND_STRING
+
+
+def _dtype_name(dtype):
+    """astype로 복원할 수 있는 타입 이름 (문자열 타입은 저장 방식까지 포함)"""
+    if isinstance(dtype, pd.StringDtype):
+        return f"string[{dtype.storage}]"
+    return str(dtype)
+
+
+def encode_frame(df: pd.DataFrame):
+    """
+    DataFrame을 (Arrow 테이블, 메타데이터)로 변환.
+    컬럼 이름과 인덱스는 메타데이터에 보관하고, 값이 섞인 object 컬럼은 값마다 타입 태그를 붙인 JSON 문자열로 저장한다
+    """
+    default_index = isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1
+    index_levels = 0 if default_index else df.index.nlevels
+    frame = df if default_index else df.reset_index(allow_duplicates=True)
+    columns, kinds, dtypes = {}, {}, {}
+    for position in range(frame.shape[1]):
+        series = frame.iloc[:, position]
+        name = f"c{position}"
+        dtypes[name] = _dtype_name(series.dtype)
+        if series.dtype == object:
+            kind = _object_kind(series.to_numpy())
+            kinds[name] = kind
+            if kind == KIND_TAGGED:
+                series = pd.Series([
+                    None if value is None else json.dumps(_encode_value(value), ensure_ascii=False)
+                    for value in series.to_numpy()
+                ], dtype=object)
+        columns[name] = series.reset_index(drop=True)
+    table = pa.Table.from_pandas(pd.DataFrame(columns, index=pd.RangeIndex(len(frame))), preserve_index=False)
+    metadata = {
+        "columns": [_encode_value(name) for name in frame.columns],
+        "index_levels": index_levels,
+        "index_names": [_encode_value(name) for name in df.index.names] if index_levels else [],
+        "kinds": kinds,
+        "dtypes": dtypes,
+    }
+    return table, metadata
+
+
+def decode_frame(table: pa.Table, metadata) -> pd.DataFrame:
+    """encode_frame의 역변환"""
+    frame = table.to_pandas()
+    for name, dtype in metadata["dtypes"].items():
+        # Arrow 문자열(string[pyarrow]) 등 Parquet 메타데이터만으로는 복원되지 않는 타입
+        if name not in metadata["kinds"] and _dtype_name(frame[name].dtype) != dtype:
+            frame[name] = frame[name].astype(dtype)
+    for name, kind in metadata["kinds"].items():
+        values = frame[name].to_numpy(dtype=object)
+        if kind == KIND_TAGGED:
+            decoded = np.empty(len(values), dtype=object)
+            decoded[:] = [None if value is None else _decode_value(json.loads(value)) for value in values]
+            values = decoded
+        elif kind == KIND_STRING_NAN:
+            values[pd.isna(values)] = np.nan
+        frame[name] = pd.Series(values, index=frame.index, dtype=object)
+    frame.columns = [_decode_value(name) for name in metadata["columns"]]
+    levels = metadata["index_levels"]
+    if levels:
+        index_frame = frame.iloc[:, :levels]
+        frame = frame.iloc[:, levels:]
+        if levels == 1:
+            index = pd.Index(index_frame.iloc[:, 0])
+        else:
+            index = pd.MultiIndex.from_arrays([index_frame.iloc[:, i] for i in range(levels)])
+        frame.index = index
+        frame.index.names = [_decode_value(name) for name in metadata["index_names"]]
+    return frame
+
+
+class ParseCache:
+    """
+    파일별 전처리 결과(DataFrame)를 디스크에 저장하는 캐시.
+    키: 파일 경로, mtime, size, 관련 설정값 해시.
+    항목마다 메타데이터(JSON)와 데이터(Parquet) 파일을 따로 두므로, 여러 프로세스/세션이 같은 폴더를
+    공유해도 서로의 항목을 덮어쓰지 않는다. 읽을 때 코드가 실행되는 형식(pickle)은 사용하지 않는다.
+    """
+
+    def __init__(self, cache_dir, config):
+        self.cache_dir = cache_dir
+        self.config_hash = config_hash(config)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._remove_legacy_files()
+
+    def _remove_legacy_files(self):
+        for pattern in LEGACY_PATTERNS:
+            for path in glob.glob(os.path.join(glob.escape(self.cache_dir), pattern)):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _file_key(file_path):
+        return os.path.normcase(os.path.abspath(file_path))
+
+    @staticmethod
+    def _stat(file_path):
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _meta_path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _read_meta(self, meta_path):
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, file_path):
+        """캐시된 DataFrame 반환. 파일이 변경됐거나 캐시가 없으면 None"""
+        key = self._file_key(file_path)
+        meta = self._read_meta(self._meta_path(key))
+        if meta is None or meta.get("file") != key or meta.get("config_hash") != self.config_hash:
+            return None
+        try:
+            mtime_ns, size = self._stat(file_path)
+        except OSError:
+            return None
+        if meta.get("mtime_ns") != mtime_ns or meta.get("size") != size:
+            return None
+        try:
+            return decode_frame(pq.read_table(os.path.join(self.cache_dir, meta["data"])), meta)
+        except Exception as e:
+            logger.warning(f"'{os.path.basename(file_path)}' のキャッシュを読み込めませんでした: {str(e)}")
+            return None
+
+    def put(self, file_path, df, stat=None):
+        """
+        파싱 결과(DataFrame) 저장.
+        stat은 파싱 직전에 얻은 (mtime_ns, size). 생략 시 현재 파일 정보 사용.
+        데이터 파일을 먼저 쓰고 메타데이터 파일을 원자적으로 교체하므로, 읽는 쪽은 항상 완성된 항목만 본다.
+        """
+        key = self._file_key(file_path)
+        try:
+            mtime_ns, size = stat if stat else self._stat(file_path)
+        except OSError:
+            return
+        meta_path = self._meta_path(key)
+        previous = self._read_meta(meta_path)
+        data_name = f"{os.path.splitext(os.path.basename(meta_path))[0]}.{uuid.uuid4().hex[:12]}.parquet"
+        data_path = os.path.join(self.cache_dir, data_name)
+        tmp_path = f"{meta_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            table, frame_meta = encode_frame(df)
+            pq.write_table(table, data_path)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(dict(frame_meta, file=key, mtime_ns=mtime_ns, size=size,
+                               config_hash=self.config_hash, data=data_name), f, ensure_ascii=False)
+            os.replace(tmp_path, meta_path)
+        except Exception as e:
+            logger.warning(f"'{os.path.basename(file_path)}' のキャッシュを保存できませんでした: {str(e)}")
+            for path in (tmp_path, data_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            return
+        if previous and previous.get("data") and previous["data"] != data_name:
+            self._remove_data(previous["data"])
+
+    def _remove_data(self, data_name):
+        try:
+            os.remove(os.path.join(self.cache_dir, data_name))
+        except OSError:
+            pass
+
+    def prune(self, file_paths, root=None):
+        """
+        file_paths에 없는(삭제된) 파일의 캐시 제거.
+        root가 지정되면 해당 폴더 아래의 항목만 대상으로 한다.
+        """
+        keep = {self._file_key(path) for path in file_paths}
+        root_key = self._file_key(root) if root else None
+        for meta_path in glob.glob(os.path.join(glob.escape(self.cache_dir), "*.json")):
+            meta = self._read_meta(meta_path)
+            if meta is None or meta.get("file") in keep:
+                continue
+            if root_key and not str(meta.get("file", "")).startswith(root_key.rstrip(os.sep) + os.sep):
+                continue
+            try:
+                os.remove(meta_path)
+            except OSError:
+                continue
+            if meta.get("data"):
+                self._remove_data(meta["data"])
@@ -0,0 +1,52 @@
+# 사용자 알림(에러/경고) 출력 관련
+
+import sys
+import logging
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class Reporter(Protocol):
+    """수집 파이프라인의 사용자 알림 인터페이스"""
+    def error(self, message: str) -> None:
+        pass
+
+    def warning(self, message: str) -> None:
+        pass
+
+
+class LoggingReporter:
+    """로그로만 출력하는 기본 Reporter (프로세스 풀 워커 등 UI가 없는 환경용)"""
+    def error(self, message: str) -> None:
+        logger.error(message)
+
+    def warning(self, message: str) -> None:
+        logger.warning(message)
+
+
+class StreamlitReporter:
+    """Streamlit 화면에 st.error / st.warning으로 표시하는 Reporter"""
+    def error(self, message: str) -> None:
+        import streamlit as st
+        st.error(message)
+
+    def warning(self, message: str) -> None:
+        import streamlit as st
+        st.warning(message)
+
+
+class ConsoleReporter:
+    """표준 에러 출력으로 표시하고 건수를 세는 Reporter (CLI용)"""
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stderr
+        self.error_count = 0
+        self.warning_count = 0
+
+    def error(self, message: str) -> None:
+        self.error_count += 1
+        print(f"[ERROR] {message}", file=self.stream)
+
+    def warning(self, message: str) -> None:
+        self.warning_count += 1
+        print(f"[WARNING] {message}", file=self.stream)
@@ -0,0 +1,176 @@
+# 세션 간 공유 결과 캐시
+
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlight:
+    """진행 중인 계산 (같은 키를 요청한 다른 세션은 완료를 기다린다)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResultCache:
+    """
+    프로세스 전체에서 공유하는 LRU 결과 캐시.
+    - max_entries: 최대 항목 수
+    - max_bytes: 메모리 예산 (sizeof로 추정한 크기의 합계)
+    같은 키의 계산이 진행 중이면 새로 계산하지 않고 그 결과를 기다린다.
+    """
+
+    def __init__(self, max_entries, max_bytes, sizeof):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._inflight = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """캐시된 값 반환. 없으면 compute()로 계산하여 저장 (동시 요청은 하나의 계산을 공유)"""
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    return self._entries[key][0]
+                pending = self._inflight.get(key)
+                is_owner = pending is None
+                if is_owner:
+                    pending = _InFlight()
+                    self._inflight[key] = pending
+
+            if not is_owner:
+                pending.event.wait()
+                if pending.error is None:
+                    return pending.value
+                # 계산한 세션에서 오류가 난 경우 다시 시도
+                continue
+
+            try:
+                value = compute()
+                pending.value = value
+                self._store(key, value)
+                return value
+            except BaseException as e:
+                pending.error = e
+                raise
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                pending.event.set()
+
+    def _measure(self, value):
+        try:
+            return self._sizeof(value)
+        except Exception as e:
+            logger.warning(f"キャッシュ項目のサイズを計算できませんでした: {str(e)}")
+            return 0
+
+    def _store(self, key, value):
+        size = self._measure(value)
+        if self.max_bytes and size > self.max_bytes:
+            logger.warning(f"結果がキャッシュのメモリ上限を超えるため、キャッシュしません ({size / 1024 ** 2:.1f}MB)")
+            return
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._total_bytes += size
+            self._evict()
+
+    def _evict(self):
+        """LRU 순으로 항목 수/메모리 예산을 넘는 항목 제거 (lock 보유 상태에서 호출)"""
+        while self._entries and (
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_bytes and self._total_bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+
+    def resize(self, key):
+        """
+        저장된 항목의 크기를 다시 계산하여 메모리 예산에 반영 (저장 후 값이 커지는 경우: 지연 계산된 표 등).
+        예산보다 커진 항목은 제거한다
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return
+        size = self._measure(entry[0])
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or current[0] is not entry[0]:
+                return
+            self._total_bytes += size - current[1]
+            self._entries[key] = (current[0], size)
+            if self.max_bytes and size > self.max_bytes:
+                logger.warning(f"結果がキャッシュのメモリ上限を超えたため、キャッシュから削除します ({size / 1024 ** 2:.1f}MB)")
+                del self._entries[key]
+                self._total_bytes -= size
+            self._evict()
+
+    def keys(self):
+        """저장된 키 (오래 사용하지 않은 순)"""
+        with self._lock:
+            return list(self._entries)
+
+    def configure(self, max_entries, max_bytes):
+        """상한 변경 (설정 변경 반영용)"""
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def invalidate(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        with self._lock:
+            return self._total_bytes
+
+
+_shared_caches = {}
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache(name, max_entries, max_bytes, sizeof):
+    """프로세스 전체에서 이름별로 하나만 존재하는 캐시 반환 (Streamlit 재실행/세션 간 공유)"""
+    with _shared_cache_lock:
+        cache = _shared_caches.get(name)
+        if cache is None:
+            cache = _shared_caches[name] = ResultCache(max_entries, max_bytes, sizeof)
+        elif (cache.max_entries, cache.max_bytes) != (max_entries, max_bytes):
+            cache.configure(max_entries, max_bytes)
+        return cache
+
+
+def get_shared_result_cache(max_entries, max_bytes, sizeof):
+    """수집 결과(세션에서 직접 갱신하지 않는 원본 DataCollector) 공유 캐시"""
+    return get_shared_cache("result", max_entries, max_bytes, sizeof)
+
+
+def clear_shared_caches():
+    """모든 공유 캐시 비우기 (벤치마크에서 캐시 없는 상태를 측정할 때 등)"""
+    with _shared_cache_lock:
+        caches = list(_shared_caches.values())
+    for cache in caches:
+        cache.clear()
@@ -0,0 +1,50 @@
+# 날짜 × 시험 결과 건수 큐브 관련 (OK 테이블, 날짜별 시험 결과 일람, 그래프의 공통 입력)
+
+import logging
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TOTAL_ROW_LABEL = "累計"
+CONSUMED_COLUMN = "消化項目数"
+
+
+def build_result_cube(merged_df: pd.DataFrame, date_col, result_col, test_id_col) -> pd.DataFrame:
+    """
+    날짜별/시험 결과별 항목 수 (pivot_table(index=날짜, columns=결과, values=테스트ID, aggfunc='count')와 같은 결과).
+    index는 날짜(오름차순), 컬럼은 시험 결과, 값은 정수 건수. 데이터가 없으면 빈 DataFrame.
+    """
+    missing = [col for col in [date_col, result_col, test_id_col] if col not in merged_df.columns]
+    if merged_df.empty or missing:
+        if missing and not merged_df.empty:
+            logger.error(f"日付別集計を作成できません: カラム {', '.join(missing)} が見つかりません。")
+        return pd.DataFrame(index=pd.DatetimeIndex([], name=date_col))
+
+    counts = merged_df.groupby([date_col, result_col], observed=True, sort=True)[test_id_col].count()
+    cube = counts.unstack(result_col, fill_value=0).astype('int64')
+    # category 타입의 결과 컬럼도 일반 컬럼명으로 (OK 컬럼 추가 등 후처리를 위해)
+    cube.columns = pd.Index(list(cube.columns), name=result_col)
+    return cube
+
+
+def ok_counts(cube: pd.DataFrame, date_col) -> pd.DataFrame:
+    """날짜별 OK 건수 [날짜, OK] (OK 결과가 없으면 0)"""
+    if cube.empty:
+        return pd.DataFrame(columns=[date_col, 'OK'])
+    ok = cube['OK'] if 'OK' in cube.columns else pd.Series(0, index=cube.index, dtype='int64')
+    return pd.DataFrame({date_col: cube.index, 'OK': ok.to_numpy()})
+
+
+def date_summary_table(cube: pd.DataFrame, date_col) -> pd.DataFrame:
+    """화면 표시용 날짜별 시험 결과 일람 (날짜는 'YYYY-MM-DD' 문자열, 마지막에 累計 행, 消化項目数 컬럼)"""
+    date_summary = cube.reset_index()
+    date_summary.columns.name = None
+    date_summary[date_col] = date_summary[date_col].dt.strftime('%Y-%m-%d')
+
+    total_row = {date_col: TOTAL_ROW_LABEL}
+    for col in cube.columns:
+        total_row[col] = date_summary[col].sum()
+    date_summary = pd.concat([date_summary, pd.DataFrame([total_row])], ignore_index=True)
+
+    date_summary[CONSUMED_COLUMN] = date_summary[list(cube.columns)].sum(axis=1)
+    return date_summary
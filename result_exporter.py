@@ -0,0 +1,166 @@
+# 집계 결과 출력(엑셀, CSV, Parquet) 관련
+
+import io
+import os
+import logging
+import xlsxwriter
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# 청크 단위 출력 시 한 번에 변환하는 행 수
+EXPORT_CHUNK_ROWS = 50_000
+# 엑셀 시트의 최대 행 수 (헤더 포함)
+EXCEL_MAX_ROWS = 1_048_576
+# 통합 시트(merged_df)를 단독으로 출력하는 시트명 (CSV/Parquet)
+MERGED_SHEET_NAME = '統合シート'
+
+# 화면 다운로드용 출력 형식: 형식 → (표시명, 확장자, MIME)
+EXPORT_FORMATS = {
+    "xlsx": ("Excel（全シート）", ".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "csv": ("CSV（統合シート）", ".csv", "text/csv"),
+    "parquet": ("Parquet（統合シート）", ".parquet", "application/octet-stream"),
+}
+
+
+def result_sheets(test_result):
+    """출력 대상 (시트명, DataFrame) 목록. 버그/QA 일람은 데이터가 있을 때만 포함"""
+    sheets = [
+        ('試験表別結果一覧', test_result.summary_df),
+        (MERGED_SHEET_NAME, test_result.merged_df),
+        ('日々のOK数グラフ', test_result.daily_ok_df),
+        ('OK累計グラフ', test_result.cumulative_ok_df),
+    ]
+    if not test_result.bug_table.empty:
+        sheets.append(('内部バグ一覧', test_result.bug_table))
+    if not test_result.qa_table.empty:
+        sheets.append(('内部QA一覧', test_result.qa_table))
+    if not test_result.findings.empty:
+        sheets.append(('検証結果', test_result.findings))
+    return sheets
+
+
+def write_result_workbook(test_result, output):
+    """
+    집계 결과를 엑셀 파일로 출력 (output은 파일 경로 또는 BytesIO).
+    XlsxWriter의 constant_memory 모드로 행 순서대로 기록하여, 큰 통합 시트도 전체를 메모리에 올리지 않는다.
+    """
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        # pandas.to_excel과 같은 표시 형식
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+    })
+    try:
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        for sheet_name, df in result_sheets(test_result):
+            _write_sheet(workbook.add_worksheet(sheet_name), df, header_format)
+    finally:
+        workbook.close()
+
+
+def _write_sheet(worksheet, df, header_format):
+    """DataFrame 하나를 헤더 + 행 순서대로 기록 (엑셀 최대 행 수를 넘는 행은 제외하고 경고)"""
+    worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+    max_rows = EXCEL_MAX_ROWS - 1
+    if len(df) > max_rows:
+        logger.warning(f"'{worksheet.name}' は Excel の最大行数を超えるため、先頭 {max_rows} 行のみ出力します ({len(df)}行)。CSV/Parquet 出力を利用してください。")
+        df = df.iloc[:max_rows]
+    row = 1
+    for chunk in _iter_chunks(df):
+        for values in zip(*[_cell_values(chunk.iloc[:, i]) for i in range(chunk.shape[1])]):
+            worksheet.write_row(row, 0, values)
+            row += 1
+
+
+def _cell_values(series: pd.Series) -> list:
+    """셀에 기록할 값 목록 (빈 값은 None: 셀을 기록하지 않음)"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _iter_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def write_frame_csv(df, output, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    DataFrame을 청크 단위로 CSV 출력 (output은 파일 경로 또는 바이너리 파일 객체).
+    엑셀에서 열 수 있도록 BOM 포함 UTF-8로 출력한다.
+    """
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, 'wb') as f:
+            return write_frame_csv(df, f, chunk_rows)
+    text = io.TextIOWrapper(output, encoding='utf-8-sig', newline='')
+    try:
+        if df.empty:
+            df.to_csv(text, index=False)
+        for start in range(0, len(df), chunk_rows):
+            df.iloc[start:start + chunk_rows].to_csv(text, index=False, header=start == 0)
+        text.flush()
+    finally:
+        text.detach()
+
+
+def write_frame_parquet(df, output, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    DataFrame을 청크(행 그룹) 단위로 Parquet 출력 (output은 파일 경로 또는 바이너리 파일 객체).
+    시험표의 열에는 숫자와 문자열이 섞이는 경우가 있어, Arrow로 변환할 수 없는 열은 문자열로 바꿔 출력한다.
+    """
+    df = _arrow_compatible(df)
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(output, schema) as writer:
+        for chunk in _iter_chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _arrow_compatible(df):
+    """Arrow로 변환할 수 없는 object 열만 문자열로 바꾼 DataFrame (바꿀 열이 없으면 원본 그대로)"""
+    converted = {}
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            logger.warning(f"'{col}' 列の型変換に失敗したため、文字列として出力します: {str(e)}")
+            converted[col] = df[col].map(lambda value: None if pd.isna(value) else str(value))
+    return df.assign(**converted) if converted else df
+
+
+def write_result_parquet(test_result, output_dir):
+    """집계 결과를 시트별 Parquet 파일로 출력하고, 출력한 파일 경로 목록을 반환"""
+    return _write_result_files(test_result, output_dir, ".parquet", write_frame_parquet)
+
+
+def write_result_csv(test_result, output_dir):
+    """집계 결과를 시트별 CSV 파일로 출력하고, 출력한 파일 경로 목록을 반환"""
+    return _write_result_files(test_result, output_dir, ".csv", write_frame_csv)
+
+
+def _write_result_files(test_result, output_dir, extension, write_frame):
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for sheet_name, df in result_sheets(test_result):
+        file_path = os.path.join(output_dir, f"{sheet_name}{extension}")
+        write_frame(df, file_path)
+        written.append(file_path)
+    return written
+
+
+def export_bytes(test_result, export_format) -> bytes:
+    """
+    화면 다운로드용 출력 데이터.
+    xlsx: 전체 시트, csv/parquet: 통합 시트(merged_df)만 (엑셀로 열 수 없는 큰 데이터용)
+    """
+    output = io.BytesIO()
+    if export_format == "xlsx":
+        write_result_workbook(test_result, output)
+    elif export_format == "csv":
+        write_frame_csv(test_result.merged_df, output)
+    elif export_format == "parquet":
+        write_frame_parquet(test_result.merged_df, output)
+    else:
+        raise ValueError(f"未対応の出力形式です: {export_format}")
+    return output.getvalue()
@@ -0,0 +1,75 @@
+# 상세 보기용 행 인덱스 (버그/QA 번호, 시험 결과, 파일별 행 위치) 관련
+
+import numpy as np
+import pandas as pd
+
+# 인덱스 종류
+INDEX_BUG = "bug"
+INDEX_QA = "qa"
+INDEX_RESULT = "result"
+INDEX_FILE = "file"
+
+_EMPTY_POSITIONS = np.array([], dtype=np.int64)
+
+
+class ResultIndex:
+    """
+    merged_df의 그룹별 행 위치(0부터 시작하는 위치 번호)를 한 번만 계산해 보관.
+    - bug: 버그 번호 → 행 (試験結果가 NG/BK인 행만)
+    - qa: QA 번호 → 행 (試験結果가 QA인 행만)
+    - result: 試験結果 → 행
+    - file: ファイル名 → 행
+    상세 보기는 마스크로 전체를 다시 검색하지 않고 select()로 해당 행만 잘라낸다.
+    merged_df가 바뀌면 새로 만들어야 한다.
+    """
+
+    def __init__(self, merged_df: pd.DataFrame, config):
+        self.num_rows = len(merged_df)
+        self.groups = {INDEX_BUG: {}, INDEX_QA: {}, INDEX_RESULT: {}, INDEX_FILE: {}}
+        result_col = config["result_column"]
+        if merged_df.empty or result_col not in merged_df.columns:
+            return
+        results = merged_df[result_col]
+        self.groups[INDEX_RESULT] = _group_positions(merged_df, result_col)
+        self.groups[INDEX_BUG] = _group_positions(merged_df, config["bug_no_column"], results.isin(['NG', 'BK']))
+        self.groups[INDEX_QA] = _group_positions(merged_df, config["qa_no_column"], results == 'QA')
+        self.groups[INDEX_FILE] = _group_positions(merged_df, config.get("file_name_column", "ファイル名"))
+
+    @property
+    def nbytes(self):
+        """보관 중인 행 위치 배열의 메모리 사용량 (bytes)"""
+        return sum(positions.nbytes for groups in self.groups.values() for positions in groups.values())
+
+    def keys(self, kind) -> list:
+        return list(self.groups[kind])
+
+    def positions(self, kind, key) -> np.ndarray:
+        """key에 해당하는 행 위치 (없으면 빈 배열)"""
+        try:
+            return self.groups[kind].get(key, _EMPTY_POSITIONS)
+        except TypeError:  # 해시할 수 없는 key
+            return _EMPTY_POSITIONS
+
+    def select(self, merged_df: pd.DataFrame, kind, key) -> pd.DataFrame:
+        """key에 해당하는 merged_df의 행 (원래 행 순서 유지)"""
+        if len(merged_df) != self.num_rows:
+            raise ValueError("インデックス作成後にデータが変更されています")
+        return merged_df.iloc[self.positions(kind, key)]
+
+
+def _group_positions(df, column, mask=None) -> dict:
+    """column 값별 행 위치. mask가 있으면 mask가 True인 행만 대상 (빈 값은 제외)"""
+    if column not in df.columns:
+        return {}
+    positions = np.arange(len(df))
+    values = df[column]
+    if mask is not None:
+        mask = mask.to_numpy(dtype=bool, na_value=False)
+        positions, values = positions[mask], values[mask]
+    if values.empty:
+        return {}
+    # 행 수에 비례하는 위치 배열은 int32로 보관해 메모리 절약
+    if len(df) < np.iinfo(np.int32).max:
+        positions = positions.astype(np.int32)
+    groups = values.groupby(values, observed=True, sort=False).indices
+    return {key: positions[group] for key, group in groups.items()}
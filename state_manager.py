@@ -14,6 +14,10 @@ class StateManager:
             st.session_state.selected_bug = None
         if 'selected_qa' not in st.session_state:
             st.session_state.selected_qa = None
+        if 'collector' not in st.session_state:
+            st.session_state.collector = None
+        if 'folder_watcher' not in st.session_state:
+            st.session_state.folder_watcher = None
     
     def get_folder_path(self):
         """폴더 경로 가져오기"""
@@ -50,4 +54,23 @@ class StateManager:
     
     def set_selected_qa(self, qa):
         """선택된 QA 설정"""
-        st.session_state.selected_qa = qa 
\ No newline at end of file
+        st.session_state.selected_qa = qa
+    
+    def get_collector(self):
+        """최근 수집에 사용한 DataCollector 가져오기"""
+        return st.session_state.collector
+    
+    def set_collector(self, collector):
+        """최근 수집에 사용한 DataCollector 설정"""
+        st.session_state.collector = collector
+    
+    def get_watcher(self):
+        """폴더 감시 객체 가져오기"""
+        return st.session_state.folder_watcher
+    
+    def set_watcher(self, watcher):
+        """폴더 감시 객체 설정 (기존 감시는 종료)"""
+        current = st.session_state.folder_watcher
+        if current is not None and current is not watcher:
+            current.stop()
+        st.session_state.folder_watcher = watcher
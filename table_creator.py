@@ -1,15 +1,26 @@
-import re
 import pandas as pd
-import streamlit as st
 import logging
+from reporter import LoggingReporter
+from id_normalizer import get_normalizer
+from aggregation import build_aggregates, aggregate_by_key
 
 # 로거 설정 (data_collector.py와 동일한 설정을 사용하거나, 필요시 다르게 설정)
 # 여기서는 data_collector.py에서 이미 설정했다고 가정하고, 동일한 로거 사용
 logger = logging.getLogger(__name__) 
 
+# 외부 목록(버그/QA 리스트)의 번호 컬럼 (숫자로 변환되어 인덱스로 보관됨)
+EXTERNAL_NO_COLUMN = 'No'
+
+def index_by_no(external_data):
+    """외부 목록을 'No' 인덱스로 변환 (이미 인덱스이거나 None이면 그대로)"""
+    if external_data is None or external_data.index.name == EXTERNAL_NO_COLUMN:
+        return external_data
+    return external_data.set_index(EXTERNAL_NO_COLUMN)
+
 class TableCreator:
-    def __init__(self, config, merged_df, find_external_file):
+    def __init__(self, config, merged_df, find_external_file, reporter=None):
         self.config = config
+        self.reporter = reporter if reporter is not None else LoggingReporter()
         self.merged_df = merged_df
         self._find_external_file = find_external_file
         # 자식 클래스에서 정의할 속성들
@@ -17,12 +28,18 @@ class TableCreator:
         self.regex_key: str = ""           # 예: "bug_regex"
         self.template_key: str = ""        # 예: "bug_pattern_template"
         self.external_columns_key: str = "" # 예: "bug_file_columns"
+        self.extra_aggregates_key: str = "" # 예: "bug_extra_aggregates"
         self.merge_how: str = ""           # 'left' 또는 'right'
         self.desired_order: list[str] = [] # 최종 컬럼 순서
+        # ID별 집계 목록 (件数, 試験名 + 설정된 추가 집계). create_table에서 설정
+        self.aggregates = []
+        # 정규식과 일치하지 않아 외부 목록과 연결하지 못한 ID (ID, 件数, 試験名)
+        self.unmatched_ids = pd.DataFrame()
 
     def create_table(self):
         """테이블 생성"""
         filtered_df = self._filter_data()
+        self.aggregates = self._build_aggregates()
         pivot_df = self._create_pivot_table(filtered_df)
         external_data = self._load_external_data()
         return self._merge_and_finalize(pivot_df, external_data)
@@ -32,6 +49,33 @@ class TableCreator:
         
     def _create_pivot_table(self, filtered_df):
         raise NotImplementedError
+
+    def _build_aggregates(self):
+        """기본 집계 + 설정된 추가 집계. 시험표에 없는 컬럼을 집계하는 설정은 경고 후 제외"""
+        aggregates = build_aggregates(self.config, self.extra_aggregates_key, reserved=self.desired_order)
+        available = []
+        for aggregate in aggregates:
+            if aggregate.name in ('件数', self.config["test_name_column"]) or aggregate.column in self.merged_df.columns:
+                available.append(aggregate)
+            else:
+                logger.warning(f"{self.__class__.__name__}: 集計対象のカラム({aggregate.column})が見つからないため無視します。")
+        return available
+
+    @property
+    def extra_columns(self):
+        """설정된 추가 집계의 출력 컬럼 (件数, 試験名 제외)"""
+        return [aggregate.name for aggregate in self.aggregates[2:]]
+
+    def _aggregate(self, filtered_df):
+        """
+        ID별 件数, 試験名 목록(정렬된 고유 값), 추가 집계를 한 번의 그룹화로 계산.
+        ID 컬럼이 빈 행은 제외된다.
+        """
+        id_col = self.config[self.id_column_key]
+        final_cols = [id_col] + [aggregate.name for aggregate in self.aggregates]
+        if filtered_df.empty:
+            return pd.DataFrame(columns=final_cols)
+        return aggregate_by_key(filtered_df, id_col, self.aggregates)
         
     def _load_external_data(self):
         # 자식 클래스가 external_data를 로드하고,
@@ -39,33 +83,29 @@ class TableCreator:
         # 각 자식 클래스에 이미 구현되어 있음.
         raise NotImplementedError
 
-    def _extract_number(self, db_no):
-        """ID 컬럼 값에서 숫자 추출 (정규식 사용)"""
-        if pd.isna(db_no):
-            return None
-        # self.regex_key는 자식 클래스에서 설정됨
-        match = re.search(self.config[self.regex_key], str(db_no))
-        return int(match.group(1)) if match else None
+    @property
+    def id_normalizer(self):
+        """설정된 정규식/템플릿의 IdNormalizer (regex_key, template_key는 자식 클래스에서 설정됨)"""
+        return get_normalizer(self.config[self.regex_key], self.config[self.template_key])
 
     def _merge_and_finalize(self, pivot_df, external_data):
         """
         공통 Merge 및 후처리 로직.
         입력 pivot_df와 external_data는 기본적인 전처리가 완료되었다고 가정.
-        (예: external_data의 'No'는 숫자형이고 NaN 없음, 원본 'No'는 'No_original'에 있음)
+        (예: external_data의 'No'는 숫자형 인덱스이고 NaN 없음, 원본 'No'는 'No_original'에 있음)
         """
         id_col_name = self.config[self.id_column_key]
         test_name_col_name = self.config["test_name_column"]
         external_file_cols = self.config[self.external_columns_key]
-        id_template = self.config[self.template_key]
 
         # 1. external_data 유효성 검사 (None 처리)
         if external_data is None:
             # (기존 로직 유지)
             if self.merge_how == 'right':
-                 final_cols = [id_col_name] + [col for col in external_file_cols if col != 'No'] + ["件数", test_name_col_name]
+                 final_cols = [id_col_name] + [col for col in external_file_cols if col != 'No'] + ["件数", test_name_col_name] + self.extra_columns
                  return pd.DataFrame(columns=final_cols)
             else: # QA
-                 final_cols = [id_col_name, "件数", test_name_col_name]
+                 final_cols = [id_col_name, "件数", test_name_col_name] + self.extra_columns
                  # pivot_df에 필요한 컬럼이 없을 수 있으므로 확인 후 추가
                  for col in final_cols:
                      if col not in pivot_df.columns:
@@ -84,25 +124,29 @@ class TableCreator:
         # 2. pivot_df 준비 (ID Number 추출)
         temp_id_number_col = 'IDNumber' # 임시 컬럼명
         if not pivot_df.empty and id_col_name in pivot_df.columns:
-            pivot_df[temp_id_number_col] = pivot_df[id_col_name].apply(self._extract_number)
-            pivot_df = pivot_df.dropna(subset=[temp_id_number_col]) # Regex 매칭 안된 경우 NaN 제거
-            if not pivot_df.empty:
-                pivot_df[temp_id_number_col] = pivot_df[temp_id_number_col].astype(int)
+            id_numbers = self.id_normalizer.extract_numbers(pivot_df[id_col_name])
+            # Regex 매칭 안된 ID는 별도 표로 보관 후 제외
+            unmatched = id_numbers.isna()
+            self.unmatched_ids = pivot_df.loc[unmatched, [col for col in [id_col_name, '件数', test_name_col_name] if col in pivot_df.columns]].reset_index(drop=True)
+            if unmatched.any():
+                logger.warning(f"{self.__class__.__name__}: 形式が一致しないID {int(unmatched.sum())}件を除外しました。")
+            pivot_df = pivot_df[~unmatched].copy()
+            pivot_df[temp_id_number_col] = id_numbers[~unmatched].astype(int)
         else:
             # pivot_df가 비거나 id_col_name이 없으면 빈 DF로 초기화
-             pivot_df = pd.DataFrame(columns=[id_col_name, '件数', test_name_col_name, temp_id_number_col])
+             pivot_df = pd.DataFrame(columns=[id_col_name, '件数', test_name_col_name] + self.extra_columns + [temp_id_number_col])
 
 
         # 3. Merge 수행
-        # external_data의 'No'는 이미 숫자형임
+        # external_data는 숫자형 'No' 인덱스 (DataCollector에서 인덱싱되어 캐시됨)
         # pivot_df의 temp_id_number_col도 숫자형임
         merged_result = pd.merge(
             pivot_df,
-            external_data, # 'No', 'No_original' 및 external_file_columns 포함
-            left_on=temp_id_number_col, right_on='No', # 숫자형 ID로 조인
+            index_by_no(external_data), # 'No_original' 및 external_file_columns 포함
+            left_on=temp_id_number_col, right_index=True, # 숫자형 ID와 'No' 인덱스로 조인
             how=self.merge_how,
             suffixes=('_pivot', '_external')
-        )
+        ).reset_index(drop=True)
 
         # 4. 컬럼 정리 및 값 채우기
         # '件数' 컬럼 처리 (기존 로직 유지)
@@ -129,9 +173,7 @@ class TableCreator:
         
         if self.merge_how == 'right': # Bug: external 기준, No_original 사용
             if no_original_col in merged_result.columns:
-                 merged_result[id_col_name] = merged_result[no_original_col].apply(
-                     lambda no: id_template.replace("{Int}", str(int(no))) if pd.notna(no) else None
-                 )
+                 merged_result[id_col_name] = self.id_normalizer.render(merged_result[no_original_col])
                  # No_original 사용 후 제거는 최종 컬럼 선택에서 처리
             else:
                  merged_result[id_col_name] = None
@@ -143,10 +185,8 @@ class TableCreator:
         else: # QA: pivot 기준, pivot의 id_col 사용
             id_col_pivot = id_col_name + '_pivot'
             if id_col_pivot in merged_result.columns:
-                 # 숫자로 시작하는 ID 값이면 정수 변환 후 템플릿에 적용, 아니면 원본 값 사용
-                 merged_result[id_col_name] = merged_result[id_col_pivot].apply(
-                     lambda id_val: id_template.replace("{Int}", str(int(float(id_val)))) if pd.notna(id_val) and str(id_val).replace('.', '', 1).isdigit() else id_val
-                 )
+                 # 숫자만 입력된 ID 값이면 정수 변환 후 템플릿에 적용, 아니면 원본 값 사용
+                 merged_result[id_col_name] = self.id_normalizer.normalize(merged_result[id_col_pivot])
                  # ID 컬럼 이름 정리가 되었으므로 _pivot 버전 제거는 최종 단계에서 처리
             elif id_col_name not in merged_result.columns and not merged_result.empty:
                  logger.warning(f"Could not find original ID column ({id_col_name} or {id_col_pivot}) after merge.")
@@ -160,8 +200,10 @@ class TableCreator:
 
 
         # 5. 최종 컬럼 선택 및 순서 지정 (기존 로직 유지)
+        # 추가 집계 컬럼은 마지막에 배치
+        desired_order = self.desired_order + self.extra_columns
         final_cols_mapping = {}
-        for col_name in self.desired_order:
+        for col_name in desired_order:
             # external에서 온 컬럼은 _external suffix 확인
             col_suffixed_external = col_name + '_external'
             if col_name == id_col_name or col_name == '件数' or col_name == test_name_col_name:
@@ -171,10 +213,10 @@ class TableCreator:
             elif col_name in merged_result.columns: # suffix 없이 external에서 온 경우
                 final_cols_mapping[col_name] = col_name
 
-        final_cols_existing_suffixed = [final_cols_mapping[col] for col in self.desired_order if col in final_cols_mapping]
+        final_cols_existing_suffixed = [final_cols_mapping[col] for col in desired_order if col in final_cols_mapping]
 
         if not final_cols_existing_suffixed:
-             return pd.DataFrame(columns=self.desired_order)
+             return pd.DataFrame(columns=desired_order)
 
         merged_result = merged_result[final_cols_existing_suffixed].copy()
         merged_result.columns = [col.replace('_external', '') for col in merged_result.columns]
@@ -187,14 +229,15 @@ class TableCreator:
 
 
 class BugTableCreator(TableCreator):
-    def __init__(self, config, merged_df, find_external_file):
-        super().__init__(config, merged_df, find_external_file)
+    def __init__(self, config, merged_df, find_external_file, reporter=None):
+        super().__init__(config, merged_df, find_external_file, reporter)
         self.bug_data = None
 
         self.id_column_key = "bug_no_column"
         self.regex_key = "bug_regex"
         self.template_key = "bug_pattern_template"
         self.external_columns_key = "bug_file_columns"
+        self.extra_aggregates_key = "bug_extra_aggregates"
         self.merge_how = "right"
         self.desired_order = [
             self.config[self.id_column_key],
@@ -205,7 +248,7 @@ class BugTableCreator(TableCreator):
     def _filter_data(self):
         if self.merged_df.empty or self.config["result_column"] not in self.merged_df.columns:
             return pd.DataFrame()
-        return self.merged_df[self.merged_df[self.config["result_column"]].isin(['NG', 'BK'])].copy()
+        return self.merged_df[self.merged_df[self.config["result_column"]].isin(['NG', 'BK'])]
 
     def _create_pivot_table(self, filtered_df):
         """
@@ -213,37 +256,16 @@ class BugTableCreator(TableCreator):
         입력 filtered_df는 전처리 완료 가정 (필수 컬럼 존재).
         """
         id_col = self.config[self.id_column_key]
-        test_id_col = self.config["test_id_column"]
-        test_name_col = self.config["test_name_column"]
-        final_cols = [id_col, '件数', test_name_col]
-
-        # 입력 데이터 확인 (ID 컬럼 등 존재는 DataCollector에서 보장)
-        if filtered_df.empty:
-            return pd.DataFrame(columns=final_cols)
+        final_cols = [id_col] + [aggregate.name for aggregate in self.aggregates]
 
         try:
-            # 件数 계산 (ID 컬럼의 NaN은 pivot_table에서 자동 제외)
-            pivot_count = filtered_df.pivot_table(
-                index=id_col, values=test_id_col, aggfunc='count'
-            ).reset_index().rename(columns={test_id_col: '件数'})
-
-            # 試験名 목록 생성 (컬럼 없으면 빈 값으로 채워짐 - DataCollector에서 처리)
-            pivot_test_names = filtered_df.groupby(id_col)[test_name_col] \
-                .agg(lambda x: ', '.join(sorted(set(x.dropna().astype(str))))) \
-                .reset_index()
-
-            # 병합 (pivot_count가 기준)
-            if pivot_count.empty: # NG/BK가 하나도 없는 경우
-                 return pd.DataFrame(columns=final_cols)
-            else:
-                 merged_pivot = pd.merge(pivot_count, pivot_test_names, on=id_col, how='left')
-                 merged_pivot[test_name_col] = merged_pivot[test_name_col].fillna('')
-                 return merged_pivot[final_cols]
+            # 件数, 試験名 목록, 추가 집계를 한 번에 계산 (ID 컬럼의 NaN은 제외)
+            return self._aggregate(filtered_df)
 
         except KeyError as e:
             # test_id_col 등이 없을 경우 (DataCollector에서 걸러지지 않았다면)
             logger.error(f"Bug ピボットテーブル作成中にエラー: 必要なカラム({e})が見つかりません。")
-            st.error(f"버그 피벗 테이블 생성 중 오류가 발생했습니다. 필요한 컬럼({e})을 찾을 수 없습니다. CLI 로그를 확인하세요.")
+            self.reporter.error(f"버그 피벗 테이블 생성 중 오류가 발생했습니다. 필요한 컬럼({e})을 찾을 수 없습니다. CLI 로그를 확인하세요.")
             return pd.DataFrame(columns=final_cols)
 
     def _load_external_data(self):
@@ -253,23 +275,24 @@ class BugTableCreator(TableCreator):
         """
         # hasattr 체크 제거 (DataCollector에서 항상 설정 가정)
         if self.bug_data is not None:
-             # 전달받은 데이터 사용 (이미 전처리됨)
-             return self.bug_data.copy() # 방어적 복사
+             # 전달받은 데이터 사용 (이미 전처리됨, merge는 원본을 변경하지 않으므로 복사하지 않음)
+             return self.bug_data
         else:
              logger.error("BugTableCreator에 내부 버그 리스트 데이터가 전달되지 않았습니다.")
-             st.error("버그 테이블 생성에 필요한 내부 버그 리스트 데이터가 없습니다. CLI 로그를 확인하세요.")
+             self.reporter.error("버그 테이블 생성에 필요한 내부 버그 리스트 데이터가 없습니다. CLI 로그를 확인하세요.")
              return None
 
 
 class QATableCreator(TableCreator):
-    def __init__(self, config, merged_df, find_external_file):
-        super().__init__(config, merged_df, find_external_file)
+    def __init__(self, config, merged_df, find_external_file, reporter=None):
+        super().__init__(config, merged_df, find_external_file, reporter)
         self.qa_data = None
 
         self.id_column_key = "qa_no_column"
         self.regex_key = "qa_regex"
         self.template_key = "qa_pattern_template"
         self.external_columns_key = "qa_file_columns"
+        self.extra_aggregates_key = "qa_extra_aggregates"
         self.merge_how = "left"
         self.desired_order = [
             self.config[self.id_column_key],
@@ -280,7 +303,7 @@ class QATableCreator(TableCreator):
     def _filter_data(self):
         if self.merged_df.empty or self.config["result_column"] not in self.merged_df.columns:
             return pd.DataFrame()
-        return self.merged_df[self.merged_df[self.config["result_column"]] == 'QA'].copy()
+        return self.merged_df[self.merged_df[self.config["result_column"]] == 'QA']
 
     def _create_pivot_table(self, filtered_df):
         """
@@ -288,32 +311,14 @@ class QATableCreator(TableCreator):
         입력 filtered_df는 전처리 완료 가정 (필수 컬럼 존재).
         """
         id_col = self.config[self.id_column_key]
-        test_id_col = self.config["test_id_column"]
-        test_name_col = self.config["test_name_column"]
-        final_cols = [id_col, '件数', test_name_col]
-
-        if filtered_df.empty:
-            return pd.DataFrame(columns=final_cols)
+        final_cols = [id_col] + [aggregate.name for aggregate in self.aggregates]
 
         try:
-            pivot_count = filtered_df.pivot_table(
-                index=id_col, values=test_id_col, aggfunc='count'
-            ).reset_index().rename(columns={test_id_col: '件数'})
-
-            pivot_test_names = filtered_df.groupby(id_col)[test_name_col] \
-                .agg(lambda x: ', '.join(sorted(set(x.dropna().astype(str))))) \
-                .reset_index()
-
-            if pivot_count.empty: # QA 결과가 하나도 없는 경우
-                 return pd.DataFrame(columns=final_cols)
-            else:
-                 merged_pivot = pd.merge(pivot_count, pivot_test_names, on=id_col, how='left')
-                 merged_pivot[test_name_col] = merged_pivot[test_name_col].fillna('')
-                 return merged_pivot[final_cols]
+            return self._aggregate(filtered_df)
 
         except KeyError as e:
              logger.error(f"QA ピボットテーブル作成中にエラー: 必要なカラム({e})が見つかりません。")
-             st.error(f"QA 피벗 테이블 생성 중 오류가 발생했습니다. 필요한 컬럼({e})을 찾을 수 없습니다. CLI 로그를 확인하세요.")
+             self.reporter.error(f"QA 피벗 테이블 생성 중 오류가 발생했습니다. 필요한 컬럼({e})을 찾을 수 없습니다. CLI 로그를 확인하세요.")
              return pd.DataFrame(columns=final_cols)
 
 
@@ -323,8 +328,8 @@ class QATableCreator(TableCreator):
         (데이터는 이미 전처리 되었다고 가정)
         """
         if self.qa_data is not None:
-             return self.qa_data.copy() # 방어적 복사
+             return self.qa_data # merge는 원본을 변경하지 않으므로 복사하지 않음
         else:
              logger.error("QATableCreator에 내부 QA 리스트 데이터가 전달되지 않았습니다.")
-             st.error("QA 테이블 생성에 필요한 내부 QA 리스트 데이터가 없습니다. CLI 로그를 확인하세요.")
+             self.reporter.error("QA 테이블 생성에 필요한 내부 QA 리스트 데이터가 없습니다. CLI 로그를 확인하세요.")
              return None 
\ No newline at end of file
@@ -1,55 +1,136 @@
-import pandas as pd
+# 시험 데이터(시험표, 내부 버그/QA 리스트) 생성
+#
+# 사용 예:
+#   python test_data_generator.py                       # 현재 폴더에 시험표 3개(50행) 생성
+#   python test_data_generator.py --files 200 --rows 5000 --extra-columns 10 --output D:\bench_corpus
+#   python test_data_generator.py --invalid-rate 0.01 --missing-rate 0.2 --seed 1
+#   python test_data_generator.py --base-date 2024-06-30   # 실시일을 2024-06-30 이전 30일 이내로 생성
+#
+# 옵션 없이 실행해도 초기 버전의 스크립트와는 생성 내용이 다르다.
+#   - 시험 결과에 OK 도 포함
+#   - 버그/QA 번호는 NG/BK 행(버그), QA 행(QA)에만 입력하고, 그중 --missing-rate 비율(기본 0.3)을 비워 둔다
+#     (초기 버전은 결과와 관계없이 모든 행에서 임의로 입력/미입력)
+#   - 실시일은 실행 날짜가 아닌 고정 기준일(2024-01-31)부터 30일 전까지 (--base-date 로 변경)
+
+import os
+import argparse
 import random
+import pandas as pd
 from datetime import datetime, timedelta
 
-def generate_test_sheet(num_rows=50):
-    # 시험표 데이터 생성
+RESULT_CATEGORIES = ['OK', 'NG', 'BK', 'QA', 'NY', 'TS', 'NT']
+INVALID_RESULTS = ['XX', 'ok', '済', '保留']
+# 실시일 기준일 (실행 날짜와 관계없이 같은 시드로 같은 데이터가 생성되도록 고정)
+DEFAULT_BASE_DATE = datetime(2024, 1, 31)
+
+def generate_test_sheet(num_rows=50, extra_columns=0, invalid_rate=0.0, missing_rate=0.3, num_bugs=30, num_qas=40,
+                        base_date=DEFAULT_BASE_DATE, rng=random):
+    """
+    시험표 데이터 생성
+    - extra_columns: 집계에 사용하지 않는 추가 컬럼 수 (실제 시험표의 비고/절차 등)
+    - invalid_rate: 부적절한 시험 결과의 비율
+    - missing_rate: NG/BK/QA 행 중 버그/QA 번호가 비어 있는 비율
+    - base_date: 실시일 기준일 (기준일부터 30일 전까지의 날짜를 사용)
+    """
+    results = [
+        rng.choice(INVALID_RESULTS) if rng.random() < invalid_rate else rng.choice(RESULT_CATEGORIES)
+        for _ in range(num_rows)
+    ]
+    bug_numbers = [
+        f'内部バグ#{rng.randint(1, num_bugs)}' if result in ('NG', 'BK') and rng.random() >= missing_rate else ''
+        for result in results
+    ]
+    qa_numbers = [
+        f'内部QA#{rng.randint(1, num_qas)}' if result == 'QA' and rng.random() >= missing_rate else ''
+        for result in results
+    ]
     data = {
         '試験項目ID': [f'TEST{i:03d}' for i in range(1, num_rows + 1)],
         '試験名': [f'機能テスト {i}' for i in range(1, num_rows + 1)],
-        '実施日': [(datetime.now() - timedelta(days=random.randint(0, 30))).strftime('%Y-%m-%d') for _ in range(num_rows)],
-        '試験結果': random.choices(['NG', 'BK', 'QA', 'NY', 'TS', 'NT'], k=num_rows),
-        'バグ_DB_No': [f'内部バグ#{random.randint(1, 30)}' if random.random() > 0.7 else '' for _ in range(num_rows)],
-        'Q&A_DB_No': [f'内部QA#{random.randint(1, 40)}' if random.random() > 0.7 else '' for _ in range(num_rows)]
+        '実施日': [(base_date - timedelta(days=rng.randint(0, 30))).strftime('%Y-%m-%d') for _ in range(num_rows)],
+        '試験結果': results,
+        'バグ_DB_No': bug_numbers,
+        'Q&A_DB_No': qa_numbers
     }
+    for col in range(1, extra_columns + 1):
+        data[f'備考{col}'] = [f'手順 {i}-{col} の確認内容' for i in range(1, num_rows + 1)]
     return pd.DataFrame(data)
 
-def generate_bug_list(num_rows=30):
+def generate_bug_list(num_rows=30, rng=random):
     # 버그 리스트 데이터 생성
     data = {
         'No': [i for i in range(1, num_rows + 1)],
-        'ステータス': random.choices(['新規', '対応中', '解決済', '確認済'], k=num_rows),
+        'ステータス': rng.choices(['新規', '対応中', '解決済', '確認済'], k=num_rows),
         '概要': [f'機能エラー {i}' for i in range(1, num_rows + 1)],
-        'JIRA#': [f'JIRA-{random.randint(1000, 9999)}' if random.random() > 0.5 else '' for _ in range(num_rows)]
+        'JIRA#': [f'JIRA-{rng.randint(1000, 9999)}' if rng.random() > 0.5 else '' for _ in range(num_rows)]
     }
     return pd.DataFrame(data)
 
-def generate_qa_list(num_rows=40):
+def generate_qa_list(num_rows=40, rng=random):
     # QA 리스트 데이터 생성
     data = {
         'No': [i for i in range(1, num_rows + 1)],
         'コメント': [f'品質検証項目 {i}' for i in range(1, num_rows + 1)],
-        '質問者': random.choices(['山田太郎', '佐藤花子', '鈴木一郎', '田中次郎'], k=num_rows),
+        '質問者': rng.choices(['山田太郎', '佐藤花子', '鈴木一郎', '田中次郎'], k=num_rows),
         '回答': [f'回答 {i}' for i in range(1, num_rows + 1)],
-        'ステータス': random.choices(['待機', '対応中', '完了'], k=num_rows)
+        'ステータス': rng.choices(['待機', '対応中', '完了'], k=num_rows)
     }
     return pd.DataFrame(data)
 
+def _write_sheet(df, file_path, sheet_name, engine):
+    with pd.ExcelWriter(file_path, engine=engine) as writer:
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+def generate_corpus(output_dir='.', files=3, rows=50, extra_columns=0, invalid_rate=0.0, missing_rate=0.3,
+                    num_bugs=30, num_qas=40, seed=None, engine='openpyxl', base_date=DEFAULT_BASE_DATE):
+    """시험표 files개와 내부 버그/QA 리스트를 output_dir에 생성하고 생성한 파일 경로 목록을 반환"""
+    rng = random.Random(seed)
+    os.makedirs(output_dir, exist_ok=True)
+    created = []
+    for i in range(1, files + 1):
+        test_sheet = generate_test_sheet(rows, extra_columns, invalid_rate, missing_rate, num_bugs, num_qas,
+                                         base_date=base_date, rng=rng)
+        file_path = os.path.join(output_dir, f'試験表_{i}.xlsx')
+        _write_sheet(test_sheet, file_path, '試験表', engine)
+        created.append(file_path)
+
+    # 버그 리스트, QA 리스트 생성
+    for file_name, df in [('内部バグリスト.xlsx', generate_bug_list(num_bugs, rng=rng)),
+                          ('内部QAリスト.xlsx', generate_qa_list(num_qas, rng=rng))]:
+        file_path = os.path.join(output_dir, file_name)
+        _write_sheet(df, file_path, '一覧', engine)
+        created.append(file_path)
+    return created
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="試験表と内部バグ/QAリストのテストデータを生成します。")
+    parser.add_argument("--output", default=".", help="出力フォルダー (既定: 現在のフォルダー)")
+    parser.add_argument("--files", type=int, default=3, help="試験表ファイル数")
+    parser.add_argument("--rows", type=int, default=50, help="試験表1ファイルあたりの行数")
+    parser.add_argument("--extra-columns", type=int, default=0, help="集計に使わない追加列の数")
+    parser.add_argument("--invalid-rate", type=float, default=0.0, help="不正な試験結果の割合 (0〜1)")
+    parser.add_argument("--missing-rate", type=float, default=0.3, help="NG/BK/QA行のうち番号未入力の割合 (0〜1)")
+    parser.add_argument("--bugs", type=int, default=30, help="内部バグリストの件数")
+    parser.add_argument("--qas", type=int, default=40, help="内部QAリストの件数")
+    parser.add_argument("--seed", type=int, help="乱数シード (同じ値で同じデータを生成)")
+    parser.add_argument("--base-date", type=datetime.fromisoformat, default=DEFAULT_BASE_DATE,
+                        help=f"実施日の基準日 YYYY-MM-DD (既定: {DEFAULT_BASE_DATE:%Y-%m-%d}、基準日から30日前までの日付を生成)")
+    parser.add_argument("--engine", default="openpyxl", choices=["openpyxl", "xlsxwriter"], help="Excel書き込みエンジン")
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
-    # 시험표 파일 3개 생성
-    for i in range(1, 4):
-        test_sheet = generate_test_sheet()
-        with pd.ExcelWriter(f'試験表_{i}.xlsx', engine='openpyxl') as writer:
-            test_sheet.to_excel(writer, sheet_name='試験表', index=False)
-    
-    # 버그 리스트 생성
-    bug_list = generate_bug_list()
-    with pd.ExcelWriter('内部バグリスト.xlsx', engine='openpyxl') as writer:
-        bug_list.to_excel(writer, sheet_name='一覧', index=False)
-    
-    # QA 리스트 생성
-    qa_list = generate_qa_list()
-    with pd.ExcelWriter('内部QAリスト.xlsx', engine='openpyxl') as writer:
-        qa_list.to_excel(writer, sheet_name='一覧', index=False)
-    
-    print("すべてのテストファイルが生成されました。") 
\ No newline at end of file
+    args = parse_args()
+    generate_corpus(
+        output_dir=args.output,
+        files=args.files,
+        rows=args.rows,
+        extra_columns=args.extra_columns,
+        invalid_rate=args.invalid_rate,
+        missing_rate=args.missing_rate,
+        num_bugs=args.bugs,
+        num_qas=args.qas,
+        seed=args.seed,
+        engine=args.engine,
+        base_date=args.base_date
+    )
+    print("すべてのテストファイルが生成されました。")
@@ -0,0 +1,66 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from aggregation import Aggregate, build_aggregates, aggregate_by_key
+from table_creator import BugTableCreator
+
+CONFIG = {
+    'result_column': 'result', 'test_id_column': 'test_id', 'test_name_column': 'test_name',
+    'bug_no_column': 'bug_no', 'bug_regex': r'内部バグ#(\d+)', 'bug_pattern_template': '内部バグ#{Int}',
+    'bug_file_columns': ['概要'],
+}
+
+def test_aggregate_by_key_matches_pivot_and_join():
+    """件数와 試験名 목록이 기존 pivot_table + groupby(lambda) 결과와 같은지 테스트"""
+    df = pd.DataFrame({
+        'bug_no': ['B2', 'B1', 'B2', None, 'B2', 'B3'],
+        'test_id': ['T1', 'T2', 'T3', 'T4', None, 'T6'],
+        'test_name': ['b', 'a', 'a', 'x', 'b', None],
+    })
+
+    result = aggregate_by_key(df, 'bug_no', build_aggregates(CONFIG, 'bug_extra_aggregates'))
+
+    assert result.columns.tolist() == ['bug_no', '件数', 'test_name']
+    assert result.values.tolist() == [['B1', 1, 'a'], ['B2', 2, 'a, b'], ['B3', 1, '']]
+
+def test_build_aggregates_skips_invalid_specs():
+    """잘못된 함수명, 누락된 키, 중복된 출력 컬럼명은 무시되는지 테스트"""
+    config = dict(CONFIG, bug_extra_aggregates=[
+        {'name': '初回実施日', 'column': 'date', 'func': 'min'},
+        {'name': '平均', 'column': 'date', 'func': 'mean'},
+        {'name': '対象', 'column': 'file'},
+        {'name': '件数', 'column': 'date', 'func': 'max'},
+        {'name': '概要', 'column': 'date', 'func': 'max'},
+    ])
+
+    aggregates = build_aggregates(config, 'bug_extra_aggregates', reserved=['概要'])
+
+    assert aggregates[2:] == [Aggregate('初回実施日', 'date', 'min')]
+
+def test_bug_table_includes_extra_aggregates():
+    """설정된 추가 집계(최초/최종 실시일, 대상 파일 목록)가 버그 테이블 마지막 컬럼에 추가되는지 테스트"""
+    config = dict(CONFIG, bug_extra_aggregates=[
+        {'name': '初回実施日', 'column': 'date', 'func': 'min'},
+        {'name': '最終実施日', 'column': 'date', 'func': 'max'},
+        {'name': '対象ファイル', 'column': 'file', 'func': 'join'},
+        {'name': '不明', 'column': 'missing', 'func': 'max'},
+    ])
+    merged_df = pd.DataFrame({
+        'test_id': ['T1', 'T2', 'T3'],
+        'test_name': ['A', 'B', 'C'],
+        'result': ['NG', 'BK', 'NG'],
+        'bug_no': ['内部バグ#1', '内部バグ#1', '内部バグ#2'],
+        'date': pd.to_datetime(['2024-01-03', '2024-01-01', '2024-01-02']),
+        'file': ['b.xlsx', 'a.xlsx', 'b.xlsx'],
+    })
+    creator = BugTableCreator(config, merged_df, lambda name: None)
+    creator.bug_data = pd.DataFrame({'No': [1, 2], 'No_original': [1, 2], '概要': ['不具合1', '不具合2']})
+
+    bug_table = creator.create_table()
+
+    assert bug_table.columns.tolist()[-3:] == ['初回実施日', '最終実施日', '対象ファイル']
+    assert bug_table['初回実施日'].tolist() == [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-02')]
+    assert bug_table['最終実施日'].tolist() == [pd.Timestamp('2024-01-03'), pd.Timestamp('2024-01-02')]
+    assert bug_table['対象ファイル'].tolist() == ['a.xlsx, b.xlsx', 'b.xlsx']
@@ -0,0 +1,58 @@
+import sys
+import os
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, 'test_data'))
+sys.path.append(os.path.join(ROOT_DIR, 'benchmarks'))
+
+import random
+from datetime import datetime
+import pandas as pd
+from test_data_generator import generate_test_sheet, generate_corpus
+import run_benchmarks
+
+def test_generate_test_sheet_rates():
+    """추가 컬럼 수, 부적절한 결과 비율, 번호 미입력 비율이 반영되는지 테스트"""
+    df = generate_test_sheet(num_rows=2000, extra_columns=3, invalid_rate=0.1, missing_rate=1.0, rng=random.Random(0))
+
+    assert len(df) == 2000
+    assert [col for col in df.columns if col.startswith('備考')] == ['備考1', '備考2', '備考3']
+    invalid = ~df['試験結果'].isin(['OK', 'NG', 'BK', 'QA', 'NY', 'TS', 'NT'])
+    assert 0.05 < invalid.mean() < 0.15
+    # 번호 미입력 비율 1.0: 모든 번호가 비어 있음
+    assert (df['バグ_DB_No'] == '').all()
+    assert (df['Q&A_DB_No'] == '').all()
+
+def test_generate_corpus_is_reproducible(tmp_path):
+    """같은 시드로 실시일을 포함한 같은 데이터가 생성되는지 테스트"""
+    first = generate_corpus(str(tmp_path / 'a'), files=2, rows=20, seed=1)
+    second = generate_corpus(str(tmp_path / 'b'), files=2, rows=20, seed=1)
+
+    assert [os.path.basename(path) for path in first] == ['試験表_1.xlsx', '試験表_2.xlsx', '内部バグリスト.xlsx', '内部QAリスト.xlsx']
+    for first_path, second_path in zip(first, second):
+        sheet_name = '試験表' if '試験表' in first_path else '一覧'
+        pd.testing.assert_frame_equal(
+            pd.read_excel(first_path, sheet_name=sheet_name),
+            pd.read_excel(second_path, sheet_name=sheet_name)
+        )
+
+def test_generate_test_sheet_base_date():
+    """실시일이 기준일부터 30일 전까지의 날짜로 생성되는지 테스트"""
+    df = generate_test_sheet(num_rows=200, base_date=datetime(2023, 3, 31), rng=random.Random(0))
+
+    dates = pd.to_datetime(df['実施日'])
+    assert dates.min() >= pd.Timestamp(2023, 3, 1)
+    assert dates.max() <= pd.Timestamp(2023, 3, 31)
+
+def test_run_suite_reports_every_stage(tmp_path):
+    """벤치마크 결과에 모든 집계 단계가 포함되고 기준 결과와 비교할 수 있는지 테스트"""
+    report = run_benchmarks.run_suite(['2x20'], str(tmp_path), include_delivery=False)
+
+    stages = report['results'][0]['collector']
+    assert list(stages) == ['scan', 'read', 'merge', 'compact', 'summary', 'validation', 'bug_table', 'qa_table', 'ok_tables', 'index', 'collect_total', 'collect_warm']
+    assert all(stats['min'] >= 0 for stats in stages.values())
+    assert [stage for stage, stats in stages.items() if stats['cache'] == 'warm'] == ['collect_warm']
+    assert report['meta']['warm_stages'] == ['collect_warm']
+
+    comparison = run_benchmarks.compare(report, report)
+    assert (comparison['ratio'].dropna() == 1.0).all()
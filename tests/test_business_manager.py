@@ -0,0 +1,119 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+from business_manager import BusinessManager
+
+@pytest.fixture
+def manager_config():
+    """테스트용 설정 데이터"""
+    return {
+        'date_column': 'date',
+        'result_column': 'result',
+        'bug_no_column': 'bug_no',
+        'qa_no_column': 'qa_no',
+        'test_id_column': 'test_id',
+        'test_name_column': 'test_name',
+        'bug_file_name': 'bug_list.xlsx',
+        'qa_file_name': 'qa_list.xlsx',
+        'sheet_name': 'Sheet1',
+        'bug_file_columns': ['description'],
+        'qa_file_columns': ['description'],
+        'bug_regex': '内部バグ#(\\d+)',
+        'qa_regex': '内部QA#(\\d+)',
+        'parse_cache_dir': '',
+        'result_cache_max_entries': 4,
+        'result_cache_max_mb': 1024
+    }
+
+def _write_test_sheet(path, results):
+    pd.DataFrame({
+        'test_id': [f'T{i:03d}' for i in range(len(results))],
+        'test_name': [f'Test {i}' for i in range(len(results))],
+        'date': ['2024-01-01'] * len(results),
+        'result': results,
+        'bug_no': ['内部バグ#1' if result == 'NG' else None for result in results],
+        'qa_no': [None] * len(results)
+    }).to_excel(path, sheet_name='Sheet1', index=False)
+
+class _Watcher:
+    def __init__(self, changes):
+        self.changes = changes
+
+    def drain_changes(self):
+        changes, self.changes = self.changes, []
+        return changes
+
+@pytest.fixture
+def manager(manager_config):
+    manager = BusinessManager(manager_config)
+    result_cache = manager._result_cache()
+    result_cache.clear()
+    yield manager
+    result_cache.clear()
+
+def test_sessions_get_forks_of_cached_collector(manager, tmp_path):
+    """세션마다 공유 원본의 사본을 받고, 한 세션의 갱신이 다른 세션과 캐시 원본에 영향을 주지 않는지 테스트"""
+    _write_test_sheet(tmp_path / 'a.xlsx', ['OK', 'NG'])
+    first = manager.load_collector(str(tmp_path))
+    second = manager.load_collector(str(tmp_path))
+    result_cache = manager._result_cache()
+    assert first is not second and len(result_cache) == 1
+    fingerprint = first.test_result.fingerprint
+
+    # 아직 계산하지 않은 표는 원본에서 한 번만 계산되어 공유
+    assert first.test_result.bug_table is second.test_result.bug_table
+
+    _write_test_sheet(tmp_path / 'a.xlsx', ['OK', 'OK', 'OK'])
+    manager.refresh_data(first, _Watcher([str(tmp_path / 'a.xlsx')]))
+
+    assert len(first.test_result.merged_df) == 3
+    assert len(second.test_result.merged_df) == 2
+    assert second.test_result.summary_df['OK'].iloc[-1] == 1
+    # 이전 지문의 항목은 제거되고, 다시 읽으면 새 폴더 내용으로 수집
+    assert fingerprint not in result_cache.keys()
+    assert len(manager.load_collector(str(tmp_path)).test_result.merged_df) == 3
+
+def test_lazy_tables_count_towards_cache_budget(manager, tmp_path):
+    """캐시 저장 후 계산된 지연 필드의 크기도 메모리 예산에 반영되어, 예산을 넘으면 항목이 제거되는지 테스트"""
+    _write_test_sheet(tmp_path / 'a.xlsx', ['OK', 'NG', 'QA'])
+    session = manager.load_collector(str(tmp_path))
+    result_cache = manager._result_cache()
+    stored_bytes = result_cache.total_bytes
+    assert stored_bytes > 0
+
+    session.test_result.bug_table
+    grown_bytes = result_cache.total_bytes
+    assert grown_bytes > stored_bytes
+
+    # 남은 표를 계산하면 예산을 넘으므로 항목 제거
+    result_cache.configure(result_cache.max_entries, grown_bytes + 1)
+    session.test_result.materialize()
+    assert len(result_cache) == 0 and result_cache.total_bytes == 0
+    # 세션의 결과는 그대로 사용 가능
+    assert session.test_result.is_computed('row_index')
+
+def test_cached_result_reports_findings_to_each_session(manager, tmp_path, caplog, monkeypatch):
+    """공유 캐시에서 결과를 받은 세션도 검증 결과를 로그와 자기 화면(Reporter)에 알리는지 테스트"""
+    _write_test_sheet(tmp_path / 'a.xlsx', ['OK', 'XX'])
+    manager.load_collector(str(tmp_path))
+
+    warnings = []
+    class _Reporter:
+        def error(self, message):
+            pass
+
+        def warning(self, message):
+            warnings.append(message)
+    monkeypatch.setattr('business_manager.StreamlitReporter', _Reporter)
+    caplog.clear()
+    with caplog.at_level('WARNING', logger='data_collector'):
+        collector = manager.load_collector(str(tmp_path))
+
+    # 다시 수집하지 않고 캐시된 결과의 검증 결과를 알림
+    assert len(manager._result_cache()) == 1
+    assert [record.getMessage().splitlines()[0] for record in caplog.records if record.name == 'data_collector'] == ['検証結果 不正な試験結果: 1件 (1ファイル)']
+    assert len(warnings) == 1
+    assert isinstance(collector.reporter, _Reporter)
@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import subprocess
+import pandas as pd
+import pytest
+import cli
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def cli_config(monkeypatch):
+    """테스트용 설정 데이터 (load_config 대체)"""
+    config = {
+        'date_column': 'date',
+        'result_column': 'result',
+        'bug_no_column': 'bug_no',
+        'qa_no_column': 'qa_no',
+        'test_id_column': 'test_id',
+        'test_name_column': 'test_name',
+        'bug_file_name': 'bug_list.xlsx',
+        'qa_file_name': 'qa_list.xlsx',
+        'sheet_name': 'Sheet1',
+        'bug_file_columns': ['description'],
+        'qa_file_columns': ['description'],
+        'bug_pattern_template': '내부버그#{Int}',
+        'qa_pattern_template': '내부QA#{Int}',
+        'bug_regex': '내부버그#(\\d+)',
+        'qa_regex': '내부QA#(\\d+)',
+        'parse_cache_dir': ''
+    }
+    monkeypatch.setattr(cli, 'load_config', lambda: (dict(config), {}))
+    return config
+
+def _write_folder(folder, results, bug_no):
+    pd.DataFrame({
+        'test_id': [f'T{i:03d}' for i in range(len(results))],
+        'test_name': [f'Test {i}' for i in range(len(results))],
+        'date': ['2024-01-01'] * len(results),
+        'result': results,
+        'bug_no': bug_no,
+        'qa_no': [None] * len(results)
+    }).to_excel(folder / 'test.xlsx', sheet_name='Sheet1', index=False)
+    pd.DataFrame({'No': [1], 'description': ['Bug 1']}).to_excel(folder / 'bug_list.xlsx', sheet_name='一覧', index=False)
+    pd.DataFrame({'No': [1], 'description': ['QA 1']}).to_excel(folder / 'qa_list.xlsx', sheet_name='一覧', index=False)
+
+def test_cli_writes_outputs_and_succeeds(cli_config, tmp_path):
+    """검증 오류가 없으면 결과를 출력하고 0을 반환하는지 테스트"""
+    _write_folder(tmp_path, ['OK', 'NG'], [None, '내부버그#1'])
+    output = tmp_path / 'out' / 'result.xlsx'
+    output.parent.mkdir()
+
+    exit_code = cli.run([str(tmp_path), '--output', str(output), '--parquet-dir', str(tmp_path / 'parquet'),
+                         '--csv-dir', str(tmp_path / 'csv')], stream=io.StringIO())
+
+    assert exit_code == cli.EXIT_OK
+    assert '統合シート' in pd.ExcelFile(output).sheet_names
+    merged = pd.read_parquet(tmp_path / 'parquet' / '統合シート.parquet')
+    assert len(merged) == 2
+    assert len(pd.read_csv(tmp_path / 'csv' / '統合シート.csv', encoding='utf-8-sig')) == 2
+
+def test_cli_fails_on_validation_errors(cli_config, tmp_path):
+    """검증 오류가 있으면 0이 아닌 값을 반환하는지 테스트"""
+    _write_folder(tmp_path, ['OK', 'NG', 'XX'], [None, None, None])
+
+    exit_code = cli.run([str(tmp_path), '--output', str(tmp_path / 'result.xlsx')], stream=io.StringIO())
+
+    assert exit_code == cli.EXIT_VALIDATION_FAILED
+
+def test_cli_fails_on_invalid_folder(cli_config, tmp_path):
+    """폴더가 없으면 수집 실패 코드를 반환하는지 테스트"""
+    exit_code = cli.run([str(tmp_path / 'missing')], stream=io.StringIO())
+    assert exit_code == cli.EXIT_COLLECTION_FAILED
+
+def test_cli_does_not_import_streamlit():
+    """CLI가 Streamlit 없이 동작하는지(임포트하지 않는지) 테스트"""
+    code = "import sys, cli; sys.exit('streamlit' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR).returncode == 0
@@ -4,6 +4,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
 import pytest
+import shutil
 from datetime import datetime
 from data_collector import (
     DataCollector, 
@@ -341,4 +342,180 @@ def test_get_excel_files(sample_config, sample_excel_files):
     
     assert isinstance(excel_files, list)
     assert len(excel_files) == 3  # test.xlsx, bug_list.xlsx, qa_list.xlsx
-    assert all(file.endswith('.xlsx') for file in excel_files)
\ No newline at end of file
+    assert all(file.endswith('.xlsx') for file in excel_files)
+
+def test_collect_excel_data_parallel_matches_serial(sample_config, tmp_path):
+    """병렬 읽기 결과가 순차 읽기와 동일하고 파일 순서가 고정되는지 테스트"""
+    for i in range(4):
+        pd.DataFrame({
+            'test_id': [f'T{i}01', f'T{i}02', f'T{i}03'],
+            'test_name': ['Test 1', 'Test 2', 'Test 3'],
+            'date': ['2024-01-01', '2024-01-02', '2024-01-03'],
+            'result': ['OK', 'NG', 'XX' if i % 2 else 'QA'],
+            'bug_no': [None, None if i % 2 else 'B001', None],
+            'qa_no': [None, None, None]
+        }).to_excel(tmp_path / f"test_{i}.xlsx", sheet_name='Sheet1', index=False)
+
+    serial = DataCollector(selected_folder_path=str(tmp_path), config=dict(sample_config, ingest_workers=1))
+    parallel = DataCollector(selected_folder_path=str(tmp_path), config=dict(sample_config, ingest_workers=3))
+
+    excel_files = serial._get_excel_files()
+    assert excel_files == sorted(excel_files)
+
+    serial_data = serial._collect_excel_data(excel_files)
+    parallel_data = parallel._collect_excel_data(excel_files)
+
+    assert len(serial_data) == len(parallel_data) == 4
+    for serial_df, parallel_df in zip(serial_data, parallel_data):
+        pd.testing.assert_frame_equal(serial_df, parallel_df)
+    assert serial.summaries == parallel.summaries
+    assert [s['file_name'] for s in parallel.summaries] == [f"test_{i}.xlsx" for i in range(4)]
+
+    # 검증은 병합 후 수행
+    for dc, data in ((serial, serial_data), (parallel, parallel_data)):
+        dc.merged_df = dc._merge_data(data)
+        dc._set_legacy_findings(dc._validate())
+    assert serial.invalid_results == parallel.invalid_results
+    assert serial.qa_without_no == parallel.qa_without_no
+    assert serial.bug_without_no == parallel.bug_without_no
+    assert len(parallel.invalid_results) == 2
+
+
+def test_refresh_patches_result_in_place(sample_config, sample_excel_files):
+    """변경/삭제된 파일만 반영하여 기존 DataTestResult가 갱신되는지 테스트"""
+    tmp_path = sample_excel_files['tmp_path']
+    dc = DataCollector(selected_folder_path=tmp_path, config=sample_config)
+    result = dc.collect_data()
+    assert list(result.summary_df['file_name'][:-1]) == ['test.xlsx']
+
+    # 시험표 추가 및 기존 시험표 수정
+    new_file = os.path.join(tmp_path, 'test_new.xlsx')
+    pd.DataFrame({
+        'test_id': ['T101'], 'test_name': ['Test 101'], 'date': ['2024-01-03'],
+        'result': ['OK'], 'bug_no': [None], 'qa_no': [None]
+    }).to_excel(new_file, sheet_name='Sheet1', index=False)
+    pd.DataFrame({
+        'test_id': ['T001'], 'test_name': ['Test 1'], 'date': ['2024-01-01'],
+        'result': ['OK'], 'bug_no': [None], 'qa_no': [None]
+    }).to_excel(sample_excel_files['test_file'], sheet_name='Sheet1', index=False)
+
+    refreshed = dc.refresh([new_file, sample_excel_files['test_file'], os.path.join(tmp_path, '~$test.xlsx')])
+    assert refreshed is result
+    assert list(result.summary_df['file_name'][:-1]) == ['test.xlsx', 'test_new.xlsx']
+    assert len(result.merged_df) == 2
+    assert result.summary_df['OK'].iloc[-1] == 2
+
+    # 파일 삭제
+    os.remove(new_file)
+    dc.refresh([new_file])
+    assert list(result.summary_df['file_name'][:-1]) == ['test.xlsx']
+    assert len(result.merged_df) == 1
+
+
+def test_previous_result_keeps_own_ok_state(sample_config, sample_excel_files, monkeypatch):
+    """이전 결과의 OK 표를 새 결과 이후에 계산해도 이전 데이터로 계산되고, 수집기의 증분 상태를 바꾸지 않는지 테스트"""
+    tmp_path = sample_excel_files['tmp_path']
+    dc = DataCollector(selected_folder_path=tmp_path, config=sample_config)
+    previous = dc.collect_data()
+    expected_daily = previous.daily_ok_df
+    previous.invalidate('daily_ok_df', 'cumulative_ok_df')
+
+    pd.DataFrame({
+        'test_id': ['T101', 'T102'], 'test_name': ['Test 101', 'Test 102'], 'date': ['2024-01-01', '2024-01-05'],
+        'result': ['OK', 'OK'], 'bug_no': [None, None], 'qa_no': [None, None]
+    }).to_excel(os.path.join(tmp_path, 'test_new.xlsx'), sheet_name='Sheet1', index=False)
+    current = dc.collect_data()
+    current_daily = current.daily_ok_df
+    assert len(current_daily) == len(expected_daily) + 1
+
+    # 이전 결과는 자기 상태의 계산기로 이전 데이터의 OK 표를 계산
+    pd.testing.assert_frame_equal(previous.daily_ok_df, expected_daily)
+    assert previous.cumulative_ok_df['OK_cumulative'].iloc[-1] == current.cumulative_ok_df['OK_cumulative'].iloc[-1] - 2
+
+    # 수집기의 계산 상태는 최신 결과 그대로 (다음 갱신에서 다시 계산할 날짜 없음)
+    recomputed = []
+    original = DailyOKCalculator._recompute
+    monkeypatch.setattr(DailyOKCalculator, '_recompute', lambda self, *args: recomputed.append(args[1]) or original(self, *args))
+    pd.testing.assert_frame_equal(dc.ok_calculators['daily'].sync(current.ok_table, sample_config), current_daily)
+    assert recomputed == []
+
+
+def test_fingerprint_changes_with_files_and_config(sample_config, sample_excel_files):
+    """폴더 내용이나 설정이 바뀌면 결과 캐시 키가 바뀌는지 테스트"""
+    tmp_path = sample_excel_files['tmp_path']
+    dc = DataCollector(selected_folder_path=tmp_path, config=sample_config)
+    fingerprint = dc.fingerprint()
+
+    assert DataCollector(selected_folder_path=tmp_path, config=sample_config).fingerprint() == fingerprint
+    assert DataCollector(selected_folder_path=tmp_path, config=dict(sample_config, sheet_name='Other')).fingerprint() != fingerprint
+
+    pd.DataFrame({'test_id': ['T009']}).to_excel(os.path.join(tmp_path, 'added.xlsx'), index=False)
+    assert dc.fingerprint() != fingerprint
+
+
+def test_result_tables_are_lazy_and_memoised(sample_config, sample_excel_files):
+    """표가 처음 접근할 때만 계산되고, 저장된 값이 재사용되며, invalidate 후 다시 계산되는지 테스트"""
+    dc = DataCollector(selected_folder_path=sample_excel_files['tmp_path'], config=sample_config)
+    result = dc.collect_data()
+
+    assert not result.is_computed('bug_table')
+    assert not result.is_computed('summary_df')
+    summary_df = result.summary_df
+    assert result.summary_df is summary_df
+    # 요약만 사용하면 버그/QA 테이블은 계산되지 않음
+    assert not result.is_computed('bug_table') and not result.is_computed('qa_table')
+
+    # OK 테이블은 의존하는 큐브와 함께 계산됨
+    result.cumulative_ok_df
+    assert result.is_computed('result_cube') and result.is_computed('ok_table')
+
+    result.invalidate('summary_df')
+    assert not result.is_computed('summary_df')
+    assert result.summary_df is not summary_df
+    pd.testing.assert_frame_equal(result.summary_df, summary_df)
+
+    result.materialize()
+    assert all(result.is_computed(name) for name in ['bug_table', 'qa_table', 'unmatched_ids', 'daily_ok_df', 'row_index'])
+
+def test_external_lists_are_cached_and_rejoined(sample_config, tmp_path):
+    """버그 리스트는 mtime별로 캐시되고, 리스트만 바뀌면 조인(버그 테이블)만 다시 계산되는지 테스트"""
+    config = dict(sample_config, bug_file_columns=['概要'])
+    test_file = tmp_path / 'test.xlsx'
+    bug_file = tmp_path / 'bug_list.xlsx'
+    pd.DataFrame({
+        'test_id': ['T001', 'T002'], 'test_name': ['Test 1', 'Test 2'], 'date': ['2024-01-01', '2024-01-02'],
+        'result': ['NG', 'OK'], 'bug_no': ['내부버그#1', None], 'qa_no': [None, None]
+    }).to_excel(test_file, sheet_name='Sheet1', index=False)
+    pd.DataFrame({'No': [1, 2], '概要': ['Bug 1', 'Bug 2']}).to_excel(bug_file, sheet_name='一覧', index=False)
+
+    result = DataCollector(selected_folder_path=tmp_path, config=config).collect_data()
+    assert result.bug_table['概要'].tolist() == ['Bug 1']
+
+    # 다른 수집기에서도 바뀌지 않은 리스트는 다시 읽지 않음 ('No' 인덱스로 보관)
+    dc = DataCollector(selected_folder_path=tmp_path, config=config)
+    result = dc.collect_data()
+    sources = {os.path.basename(entry['file']): entry['source'] for entry in result.diagnostics.files}
+    assert sources['bug_list.xlsx'] == 'list_cache'
+    assert dc.bug_data.index.name == 'No'
+
+    summary_df, result_cube = result.summary_df, result.result_cube
+    pd.DataFrame({'No': [1, 2], '概要': ['Bug 1 (修正)', 'Bug 2']}).to_excel(bug_file, sheet_name='一覧', index=False)
+    os.utime(bug_file, ns=(os.stat(bug_file).st_atime_ns, os.stat(bug_file).st_mtime_ns + 10 ** 9))
+    assert dc.refresh([str(bug_file)]) is result
+    assert result.bug_table['概要'].tolist() == ['Bug 1 (修正)']
+    # 시험표 쪽 결과는 다시 계산하지 않음
+    assert result.summary_df is summary_df and result.result_cube is result_cube
+
+def test_collect_skips_lock_files_and_excluded_folders(sample_config, sample_excel_files):
+    """잠금 파일과 제외 패턴의 백업 폴더는 수집 대상에서 제외되는지 테스트"""
+    tmp_path = sample_excel_files['tmp_path']
+    backup_dir = os.path.join(tmp_path, 'backup_20240101')
+    os.makedirs(backup_dir)
+    shutil.copy(sample_excel_files['test_file'], os.path.join(backup_dir, 'test.xlsx'))
+    shutil.copy(sample_excel_files['test_file'], os.path.join(tmp_path, '~$test.xlsx'))
+    # 폴더 전용 패턴은 이름이 일치하는 파일은 제외하지 않음
+    shutil.copy(sample_excel_files['test_file'], os.path.join(tmp_path, 'test_backup.xlsx'))
+
+    dc = DataCollector(selected_folder_path=tmp_path, config=dict(sample_config, scan_exclude=['*backup*/']))
+    result = dc.collect_data()
+    assert list(result.summary_df['file_name'][:-1]) == ['test.xlsx', 'test_backup.xlsx']
@@ -0,0 +1,176 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zipfile
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Border, Side
+from delivery_helper import (
+    DeliveryHelper, process_workbook, apply_shared_style, fill_blank_cells, set_font_to_meiryo, align_cells_left_top,
+    DELIVERY_FONT, DELIVERY_ALIGNMENT
+)
+
+CONFIG = {'sheet_name': '試験表'}
+
+def _write_workbook(path, sheet_names=('試験表', 'Other')):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for sheet_name in sheet_names:
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append(['ID', 'Result', 'Note'])
+        sheet.append(['T1', None, 'memo'])
+        sheet.sheet_view.zoomScale = 85
+    workbook.save(path)
+
+def test_run_applies_all_transforms_in_one_pass(tmp_path):
+    """파일마다 한 번 열어 空白埋め, 整列, フォント, 拡大比率를 모두 적용하는지 테스트"""
+    _write_workbook(tmp_path / 'a.xlsx')
+    (tmp_path / 'broken.xlsx').write_bytes(b'not a zip')
+
+    results = DeliveryHelper(str(tmp_path), CONFIG).run()
+
+    assert [(os.path.basename(result.file_path), result.ok) for result in results] == [('a.xlsx', True), ('broken.xlsx', False)]
+    workbook = load_workbook(tmp_path / 'a.xlsx')
+    sheet = workbook['試験表']
+    assert sheet['B2'].value == '-'
+    assert (sheet['B2'].alignment.horizontal, sheet['B2'].alignment.vertical) == ('left', 'top')
+    # 空白埋め/整列은 試験表 시트만, フォント/拡大比率은 모든 시트
+    assert workbook['Other']['B2'].value is None
+    assert all(ws['A1'].font.name == 'メイリオ' and ws.sheet_view.zoomScale == 100 for ws in workbook.worksheets)
+
+def test_run_in_process_pool_reports_each_file(tmp_path):
+    """프로세스 풀 병렬 처리 시에도 파일별 결과를 하나씩 전달하고, 파일 순서대로 반환하는지 테스트"""
+    for name in ('a.xlsx', 'b.xlsx', 'c.xlsx'):
+        _write_workbook(tmp_path / name)
+    (tmp_path / 'broken.xlsx').write_bytes(b'not a zip')
+    reported = []
+
+    helper = DeliveryHelper(str(tmp_path), dict(CONFIG, delivery_workers=2))
+    results = helper.run(['zoom'], on_result=lambda result, done, total: reported.append((done, total)))
+
+    assert helper._get_worker_count(4) == 2
+    assert reported == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert [(os.path.basename(result.file_path), result.ok) for result in results] == [
+        ('a.xlsx', True), ('b.xlsx', True), ('broken.xlsx', False), ('c.xlsx', True)]
+    assert load_workbook(tmp_path / 'c.xlsx')['Other'].sheet_view.zoomScale == 100
+
+def test_process_workbook_reports_missing_sheet(tmp_path):
+    """대상 시트가 없으면 해당 작업만 건너뛰고 메시지를 남기는지 테스트"""
+    path = tmp_path / 'a.xlsx'
+    _write_workbook(path, sheet_names=('Other',))
+
+    result = process_workbook(str(path), '試験表', ['fill_blank', 'zoom'])
+
+    assert result.ok
+    assert '試験表' in result.message
+    assert load_workbook(path)['Other'].sheet_view.zoomScale == 100
+
+def test_apply_shared_style_registers_once_and_keeps_other_formats():
+    """폰트/정렬을 스타일 표에 한 번만 등록하고, 테두리와 표시 형식은 유지하는지 테스트"""
+    workbook = Workbook()
+    sheet = workbook.active
+    for row in range(1, 101):
+        sheet.cell(row=row, column=1, value=row)
+    sheet['A1'].border = Border(left=Side(style='thin'))
+    sheet['A2'].number_format = '0.00'
+    font_count = len(workbook._fonts)
+
+    assert apply_shared_style(workbook, sheet._cells.values(), font=DELIVERY_FONT, alignment=DELIVERY_ALIGNMENT) == 100
+
+    assert len(workbook._fonts) == font_count + 1
+    assert all(cell.font.name == 'メイリオ' and cell.alignment.vertical == 'top' for cell in sheet['A'])
+    assert sheet['A1'].border.left.style == 'thin'
+    assert sheet['A2'].number_format == '0.00'
+    # 빈 좌표에는 셀을 새로 만들지 않음
+    assert sheet.max_column == 1
+
+def test_apply_shared_style_falls_back_to_public_attributes(monkeypatch):
+    """확인하지 않은 openpyxl 버전에서는 공개 속성으로 같은 결과를 적용하는지 테스트"""
+    import delivery_transforms
+    monkeypatch.setattr(delivery_transforms.openpyxl, '__version__', '9.0.0')
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet['A1'] = 1
+    sheet['A1'].border = Border(left=Side(style='thin'))
+
+    assert apply_shared_style(workbook, [sheet['A1']], font=DELIVERY_FONT, alignment=DELIVERY_ALIGNMENT) == 1
+    assert sheet['A1'].font.name == 'メイリオ' and sheet['A1'].alignment.horizontal == 'left'
+    assert sheet['A1'].border.left.style == 'thin'
+
+def test_font_covers_used_range():
+    """폰트 변경이 사용 범위의 빈 셀까지 적용되고, 정렬은 값이 있는 셀에만 적용되는지 테스트"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet['A1'] = 'ID'
+    sheet['C3'] = 'memo'
+
+    set_font_to_meiryo(workbook)
+    align_cells_left_top(sheet)
+
+    assert all(cell.font.name == 'メイリオ' for row in sheet.iter_rows(min_row=1, max_row=3, max_col=3) for cell in row)
+    assert sheet['C3'].alignment.vertical == 'top'
+    assert sheet['B2'].alignment.vertical is None
+
+def test_fill_blank_cells_keeps_original_coordinates():
+    """앞쪽 빈 행/열이 있어도 원래 좌표의 빈 셀에만 '-'를 쓰는지 테스트 (값이 없는 행/열, 병합 셀의 나머지 영역은 제외)"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet['B2'], sheet['D2'] = 'ID', 'Note'
+    sheet['B3'] = 'T1'
+    sheet['B5'], sheet['C5'] = 'T2', 'NG'
+    sheet.merge_cells('C2:C3')
+
+    assert fill_blank_cells(sheet) == 3
+
+    assert [[cell.value for cell in row] for row in sheet.iter_rows(min_row=1, max_row=5, min_col=1, max_col=4)] == [
+        [None, None, None, None],
+        [None, 'ID', '-', 'Note'],
+        [None, 'T1', None, '-'],
+        [None, None, None, None],
+        [None, 'T2', 'NG', '-'],
+    ]
+
+def test_fill_blank_cells_falls_back_to_public_api(monkeypatch):
+    """확인하지 않은 openpyxl 버전에서는 셀 표를 직접 읽지 않고 공개 API로 같은 결과를 내는지 테스트"""
+    import delivery_transforms
+    monkeypatch.setattr(delivery_transforms.openpyxl, '__version__', '9.0.0')
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet['B2'], sheet['D2'] = 'ID', 'Note'
+    sheet['B3'] = 'T1'
+    sheet['B5'], sheet['C5'] = 'T2', 'NG'
+    sheet.merge_cells('C2:C3')
+    assert not delivery_transforms._supports_cell_table(sheet)
+
+    assert fill_blank_cells(sheet) == 3
+
+    assert [[cell.value for cell in row] for row in sheet.iter_rows(min_row=1, max_row=5, min_col=1, max_col=4)] == [
+        [None, None, None, None],
+        [None, 'ID', '-', 'Note'],
+        [None, 'T1', None, '-'],
+        [None, None, None, None],
+        [None, 'T2', 'NG', '-'],
+    ]
+    assert fill_blank_cells(workbook.create_sheet()) == 0
+
+def test_zoom_only_keeps_parts_unknown_to_openpyxl(tmp_path):
+    """拡大比率만 적용하는 작업은 워크북을 다시 저장하지 않아 openpyxl이 모르는 부분도 유지되는지 테스트"""
+    path = tmp_path / 'a.xlsx'
+    _write_workbook(path)
+    with zipfile.ZipFile(path, 'a') as archive:
+        archive.writestr('customXml/item1.xml', b'<custom/>')
+
+    result = process_workbook(str(path), '試験表', ['zoom'])
+
+    assert result.ok
+    with zipfile.ZipFile(path) as archive:
+        assert archive.read('customXml/item1.xml') == b'<custom/>'
+    assert all(sheet.sheet_view.zoomScale == 100 for sheet in load_workbook(path).worksheets)
+
+def test_transforms_module_does_not_import_streamlit():
+    """프로세스 풀의 워커가 읽는 변환 모듈이 Streamlit을 읽지 않고, 워커에 넘기는 함수가 그 모듈에 있는지 테스트"""
+    import subprocess
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = "import sys, delivery_transforms; sys.exit('streamlit' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code], cwd=root).returncode == 0
+    assert process_workbook.__module__ == 'delivery_transforms'
@@ -0,0 +1,116 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import logging
+import tracemalloc
+import pandas as pd
+from diagnostics import Diagnostics
+from data_collector import DataCollector
+
+def test_stage_timing_and_peak_memory():
+    """단계별 시간과 (trace_memory 사용 시) 피크 메모리가 기록되는지 테스트"""
+    diagnostics = Diagnostics("test", trace_memory=True)
+    with diagnostics.stage("allocate"):
+        data = [0] * 1_000_000
+    del data
+    with diagnostics.stage("idle"):
+        pass
+    diagnostics.finish()
+
+    assert [stage["stage"] for stage in diagnostics.stages] == ["allocate", "idle"]
+    assert diagnostics.stages[0]["peak_mb"] > diagnostics.stages[1]["peak_mb"]
+    assert not tracemalloc.is_tracing()
+
+def test_tracing_is_shared_between_sessions():
+    """여러 세션의 Diagnostics가 겹쳐도 마지막 세션이 끝날 때만 tracemalloc이 정지되는지 테스트"""
+    first = Diagnostics("first", trace_memory=True)
+    second = Diagnostics("second", trace_memory=True)
+    with first.stage("read"):
+        pass
+    with second.stage("read"):
+        data = [0] * 1_000_000
+        # 다른 세션의 단계가 시작/종료되어도 진행 중인 단계의 피크는 초기화되지 않는다
+        with first.stage("merge"):
+            pass
+    del data
+    first.finish()
+    assert tracemalloc.is_tracing()
+    assert second.stages[0]["peak_mb"] >= 7
+
+    # finish() 이후의 지연 계산 단계도 다른 세션의 추적을 정지하지 않는다
+    with first.stage("bug_table"):
+        pass
+    assert tracemalloc.is_tracing()
+    assert first.stages[-1]["peak_mb"] is not None
+    second.finish()
+    assert not tracemalloc.is_tracing()
+
+    # finish() 이후 단독으로 실행된 단계는 그 단계 동안만 추적
+    with first.stage("qa_table"):
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+def test_tracing_started_elsewhere_is_kept():
+    """외부에서 시작한 tracemalloc은 정지하지 않는지 테스트"""
+    tracemalloc.start()
+    try:
+        diagnostics = Diagnostics("test", trace_memory=True)
+        with diagnostics.stage("read"):
+            pass
+        diagnostics.finish()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+def test_finish_emits_json_log_lines(caplog):
+    """finish() 시 단계/파일/합계가 JSON 로그로 출력되는지 테스트"""
+    diagnostics = Diagnostics("test")
+    with diagnostics.stage("read"):
+        pass
+    diagnostics.record_file("/data/a.xlsx", 0.5, 10, "parse")
+    diagnostics.record_file("/data/b.xlsx", 1.5, 20, "cache")
+
+    with caplog.at_level(logging.INFO, logger="diagnostics"):
+        diagnostics.finish()
+
+    records = [json.loads(record.getMessage()) for record in caplog.records if record.name == "diagnostics"]
+    assert [record["event"] for record in records] == ["stage", "file", "file", "total"]
+    assert records[0]["pipeline"] == "test" and records[0]["peak_mb"] is None
+    assert diagnostics.slowest_file()["file"] == "/data/b.xlsx"
+    assert diagnostics.file_frame()['ファイル名'].tolist() == ['b.xlsx', 'a.xlsx']
+
+def test_collector_records_stages_and_files(tmp_path):
+    """수집 결과에 단계별/파일별 진단 정보가 포함되는지 테스트"""
+    for i in range(2):
+        pd.DataFrame({
+            'test_id': [f'T{i}01', f'T{i}02'],
+            'test_name': ['Test 1', 'Test 2'],
+            'date': ['2024-01-01', '2024-01-02'],
+            'result': ['OK', 'NG'],
+            'bug_no': [None, 'B001'],
+            'qa_no': [None, None]
+        }).to_excel(tmp_path / f'test_{i}.xlsx', sheet_name='Sheet1', index=False)
+    config = {
+        'date_column': 'date', 'result_column': 'result', 'bug_no_column': 'bug_no', 'qa_no_column': 'qa_no',
+        'test_id_column': 'test_id', 'test_name_column': 'test_name', 'bug_file_name': 'bug_list.xlsx',
+        'qa_file_name': 'qa_list.xlsx', 'sheet_name': 'Sheet1', 'bug_file_columns': ['description'],
+        'qa_file_columns': ['description'], 'bug_pattern_template': '내부버그#{Int}', 'qa_pattern_template': '내부QA#{Int}',
+        'bug_regex': '내부버그#(\\d+)', 'qa_regex': '내부QA#(\\d+)'
+    }
+
+    result = DataCollector(str(tmp_path), config).collect_data()
+
+    stages = [stage["stage"] for stage in result.diagnostics.stages]
+    assert stages == ["scan", "scan_external", "read", "merge", "compact", "validation"]
+    # 표는 처음 접근할 때 계산되어 단계가 추가된다
+    result.daily_ok_df
+    assert [stage["stage"] for stage in result.diagnostics.stages][6:] == ["result_cube", "ok_table", "daily_ok"]
+    assert [(os.path.basename(entry["file"]), entry["rows"], entry["source"]) for entry in result.diagnostics.files] == [
+        ('test_0.xlsx', 2, 'parse'), ('test_1.xlsx', 2, 'parse')
+    ]
+    # merged_df의 컬럼별 메모리 (compact_schema 기본값: 시험 결과는 category)
+    memory = result.diagnostics.memory_frame()
+    assert set(memory['データ']) == {'merged_df'}
+    assert memory.loc[memory['カラム'] == 'result', '型'].tolist() == ['category']
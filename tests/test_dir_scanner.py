@@ -0,0 +1,77 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dir_scanner
+from dir_scanner import DirectoryScanner, scan_directory
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'x')
+
+def _make_tree(tmp_path):
+    for rel in ['a.xlsx', '~$a.xlsx', 'note.txt', 'sub/b.XLSX', 'sub/bug_list.xlsx', 'bug_list.xlsx',
+                'Backup/c.xlsx', 'sub/old/d.xlsx']:
+        _touch(os.path.join(tmp_path, *rel.split('/')))
+
+def test_scan_directory_applies_include_exclude_and_skips_lock_files(tmp_path):
+    """대상 패턴, 제외 패턴(이름/상대 경로), 잠금 파일 제외와 stat 정보 수집 테스트"""
+    _make_tree(tmp_path)
+    result = scan_directory(str(tmp_path), exclude=['*backup*', 'sub/old'])
+
+    assert [scanned.relpath for scanned in result.files] == ['a.xlsx', 'bug_list.xlsx', 'sub/b.XLSX', 'sub/bug_list.xlsx']
+    assert result.paths()[0] == os.path.join(str(tmp_path), 'a.xlsx')
+    assert all(scanned.size == 1 and scanned.mtime_ns > 0 for scanned in result.files)
+    # 같은 이름이 여러 개면 가장 얕은 폴더의 파일
+    assert result.find('bug_list.xlsx').relpath == 'bug_list.xlsx'
+    assert result.find('missing.xlsx') is None
+
+def test_scanner_shares_scans_with_subfolders(tmp_path, monkeypatch):
+    """같은 폴더와 하위 폴더는 다시 검색하지 않고, clear 후에는 다시 검색하는지 테스트"""
+    _make_tree(tmp_path)
+    calls = []
+    original = dir_scanner.scan_directory
+    monkeypatch.setattr(dir_scanner, 'scan_directory', lambda *args: calls.append(args[0]) or original(*args))
+
+    scanner = DirectoryScanner(exclude=['*backup*'])
+    scanner.scan(str(tmp_path))
+    sub = scanner.scan(os.path.join(str(tmp_path), 'sub'))
+    assert [scanned.relpath for scanned in sub.files] == ['b.XLSX', 'bug_list.xlsx', 'old/d.xlsx']
+    assert sub.find('bug_list.xlsx').path == os.path.join(str(tmp_path), 'sub', 'bug_list.xlsx')
+    # 제외된 하위 폴더는 직접 검색
+    assert scanner.scan(os.path.join(str(tmp_path), 'Backup')).paths() == [os.path.join(str(tmp_path), 'Backup', 'c.xlsx')]
+    assert len(calls) == 2
+
+    scanner.clear()
+    scanner.scan(str(tmp_path))
+    assert len(calls) == 3
+
+def test_scanner_accepts_event_paths(tmp_path):
+    """감시 이벤트 경로가 검색 대상인지 판단하는 테스트"""
+    scanner = DirectoryScanner(exclude=['*backup*'])
+    root = str(tmp_path)
+    assert scanner.accepts(os.path.join(root, 'sub', 'a.xlsx'), [root])
+    assert not scanner.accepts(os.path.join(root, '~$a.xlsx'), [root])
+    assert not scanner.accepts(os.path.join(root, 'a.txt'), [root])
+    assert not scanner.accepts(os.path.join(root, 'Backup', 'a.xlsx'), [root])
+
+def test_folder_only_patterns_keep_matching_files(tmp_path, caplog):
+    """'/'로 끝나는 제외 패턴은 폴더에만 적용되고, 제외 패턴으로 건너뛴 파일은 로그에 남는지 테스트"""
+    for rel in ['backup_plan.xlsx', 'バックアップ手順.xlsx', 'Backup/c.xlsx', 'sub/old_backup/d.xlsx', 'skip.xlsx']:
+        _touch(os.path.join(tmp_path, *rel.split('/')))
+    root = str(tmp_path)
+
+    with caplog.at_level('INFO', logger='dir_scanner'):
+        result = scan_directory(root, exclude=['*backup*/', '*バックアップ*/', 'skip.xlsx'])
+
+    assert [scanned.relpath for scanned in result.files] == ['backup_plan.xlsx', 'バックアップ手順.xlsx']
+    assert [record.getMessage().endswith(os.path.join(root, 'skip.xlsx')) for record in caplog.records] == [True]
+
+    scanner = DirectoryScanner(exclude=['*backup*/'])
+    assert scanner.accepts(os.path.join(root, 'backup_plan.xlsx'), [root])
+    assert scanner.accepts(os.path.join(root, 'backup_plan.xlsx'))
+    assert not scanner.accepts(os.path.join(root, 'sub', 'old_backup', 'd.xlsx'), [root])
+    # 하위 폴더 검색도 상위 검색 결과와 같은 기준으로 제외
+    scanner.scan(root)
+    assert scanner.scan(os.path.join(root, 'sub')).paths() == []
@@ -0,0 +1,111 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import datetime
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from excel_reader import read_sheet, SheetNotFoundError
+
+@pytest.fixture
+def tricky_workbook(tmp_path):
+    """빈 헤더, 중복 헤더, 빈 행, 에러 값 등이 섞인 테스트용 엑셀 파일"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = '試験表'
+    sheet.append([' 試験項目ID', '試験名', '実施日', '試験結果', None, '試験名', 'extra'])
+    sheet.append(['001', 'a', datetime.datetime(2024, 1, 1), 'OK', 1.0, 'x', 2.5])
+    sheet.append([None] * 7)
+    sheet.append([3, 'NA', '2024-01-02', '#N/A', True, 'y', None])
+    sheet.append(['T4', None, datetime.datetime(2024, 1, 3), 'NG', None, None, '123'])
+    sheet.append([None] * 7)
+    file_path = tmp_path / 'tricky.xlsx'
+    workbook.save(file_path)
+    return str(file_path)
+
+def test_read_sheet_matches_read_excel(tricky_workbook):
+    """전체 컬럼 읽기 결과가 pd.read_excel과 같은지 테스트"""
+    expected = pd.read_excel(tricky_workbook, sheet_name='試験表', engine='openpyxl')
+    expected.columns = expected.columns.str.strip()
+
+    pd.testing.assert_frame_equal(read_sheet(tricky_workbook, '試験表'), expected)
+
+def test_read_sheet_projects_columns(tricky_workbook):
+    """지정한 컬럼만 읽고, 없는 컬럼은 무시하는지 테스트"""
+    expected = pd.read_excel(tricky_workbook, sheet_name='試験表', engine='openpyxl')
+    expected.columns = expected.columns.str.strip()
+
+    df = read_sheet(tricky_workbook, '試験表', usecols=['実施日', '試験項目ID', '試験名', 'missing'])
+
+    pd.testing.assert_frame_equal(df, expected[['試験項目ID', '試験名', '実施日']])
+
+def test_read_sheet_missing_sheet(tricky_workbook):
+    """시트가 없으면 SheetNotFoundError가 발생하는지 테스트"""
+    with pytest.raises(SheetNotFoundError):
+        read_sheet(tricky_workbook, '一覧')
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test_data')
+
+@pytest.mark.parametrize('file_name, sheet_name', [
+    ('試験表_1.xlsx', '試験表'),
+    ('試験表_2.xlsx', '試験表'),
+    ('内部バグリスト.xlsx', '一覧'),
+    ('内部QAリスト.xlsx', '一覧'),
+])
+def test_xml_engine_matches_openpyxl_on_test_data(file_name, sheet_name):
+    """xml 엔진의 결과가 openpyxl 엔진과 같은지 테스트 (샘플 데이터)"""
+    file_path = os.path.join(TEST_DATA_DIR, file_name)
+    expected = read_sheet(file_path, sheet_name, engine='openpyxl')
+
+    pd.testing.assert_frame_equal(read_sheet(file_path, sheet_name, engine='xml'), expected)
+
+def test_xml_engine_matches_openpyxl_on_tricky_workbook(tricky_workbook):
+    """날짜, 불리언, 에러 값, 빈 행이 섞인 시트에서 두 엔진 결과가 같은지 테스트"""
+    usecols = ['実施日', '試験項目ID', '試験名', '試験結果']
+    for columns in (None, usecols):
+        expected = read_sheet(tricky_workbook, '試験表', usecols=columns, engine='openpyxl')
+        pd.testing.assert_frame_equal(read_sheet(tricky_workbook, '試験表', usecols=columns, engine='xml'), expected)
+
+def test_xml_engine_shared_strings_and_dates(tmp_path):
+    """공유 문자열, 1904 날짜 체계, 시간 서식이 openpyxl과 같게 변환되는지 테스트"""
+    workbook = Workbook()
+    workbook.epoch = datetime.datetime(1904, 1, 1)
+    sheet = workbook.active
+    sheet.title = '試験表'
+    sheet.append(['試験項目ID', '実施日', '時間'])
+    for i in range(3):
+        sheet.append([f'ID_{i}', datetime.datetime(2024, 5, i + 1), datetime.time(10, i)])
+    sheet['A6'] = 'ID_3'
+    file_path = tmp_path / 'shared.xlsx'
+    workbook.save(file_path)
+
+    expected = read_sheet(str(file_path), '試験表', engine='openpyxl')
+    df = read_sheet(str(file_path), '試験表', engine='xml')
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert df['実施日'].iloc[0] == pd.Timestamp(2024, 5, 1)
+
+def test_xml_engine_missing_sheet(tricky_workbook):
+    """xml 엔진에서도 시트가 없으면 SheetNotFoundError가 발생하는지 테스트"""
+    with pytest.raises(SheetNotFoundError):
+        read_sheet(tricky_workbook, '一覧', engine='xml')
+
+@pytest.mark.parametrize('engine', ['openpyxl', 'xml'])
+def test_read_sheet_columns_starting_below_header(tmp_path, engine):
+    """헤더보다 넓은 행, 헤더만 있는 시트가 pd.read_excel과 같게 읽히는지 테스트"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = '試験表'
+    sheet.append(['試験項目ID', '試験結果'])
+    sheet.append(['T1', 'OK'])
+    sheet.append(['T2', None, None, 'memo'])
+    sheet.append([None, None])
+    header_only = workbook.create_sheet('一覧')
+    header_only.append(['試験項目ID', None, '試験名'])
+    file_path = str(tmp_path / 'wide.xlsx')
+    workbook.save(file_path)
+
+    for sheet_name in ('試験表', '一覧'):
+        expected = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
+        pd.testing.assert_frame_equal(read_sheet(file_path, sheet_name, engine=engine), expected)
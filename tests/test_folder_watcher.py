@@ -0,0 +1,43 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gc
+import folder_watcher
+from folder_watcher import FolderWatcher, active_observer_count
+
+def test_watchers_share_one_observer_per_folder_set(tmp_path):
+    """같은 폴더 목록의 감시는 Observer 하나를 공유하고, 변경 경로는 감시 객체별로 따로 모이는지 테스트"""
+    first, second = FolderWatcher([str(tmp_path)]), FolderWatcher([str(tmp_path)])
+    first.start()
+    second.start()
+    try:
+        assert active_observer_count() == 1
+        assert first.is_running() and second.is_running()
+
+        first._shared.dispatch(str(tmp_path / 'a.xlsx'))
+        assert first.drain_changes() == [str(tmp_path / 'a.xlsx')]
+        assert not first.has_changes()
+        assert second.drain_changes() == [str(tmp_path / 'a.xlsx')]
+
+        # 한쪽을 종료해도 다른 쪽의 감시는 유지
+        first.stop()
+        assert active_observer_count() == 1 and second.is_running()
+    finally:
+        first.stop()
+        second.stop()
+    assert active_observer_count() == 0
+
+def test_abandoned_watcher_releases_observer(tmp_path):
+    """stop()을 호출하지 않고 버려진 감시 객체(종료된 세션)가 회수되면 Observer 스레드가 종료되는지 테스트"""
+    watcher = FolderWatcher([str(tmp_path)])
+    watcher.start()
+    shared = watcher._shared
+    assert active_observer_count() == 1
+
+    del watcher
+    gc.collect()
+
+    assert active_observer_count() == 0
+    assert not shared.is_alive()
+    assert folder_watcher._shared_observers == {}
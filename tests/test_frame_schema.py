@@ -0,0 +1,44 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from frame_schema import compact_frame, column_memory, STRING_DTYPE
+
+CONFIG = {'result_column': 'result', 'file_name_column': 'ファイル名'}
+
+def test_compact_frame_dtypes():
+    """컬럼 특성에 따라 category / Arrow 문자열 / Int64로 변환되고, 혼합 타입은 그대로인지 테스트"""
+    df = pd.DataFrame({
+        'result': ['OK', 'NG', 'OK', 'XX'],
+        'ファイル名': ['a.xlsx', 'b.xlsx', 'c.xlsx', 'd.xlsx'],
+        'test_id': ['T1', 'T2', 'T3', None],
+        'bug_no': ['B1', None, 'B1', None],
+        'qa_no': [1.0, np.nan, 2.0, np.nan],
+        'mixed': ['QA1', 12, None, 'QA1'],
+        'ratio': [0.5, 1.0, np.nan, 2.0],
+    })
+
+    compact = compact_frame(df, CONFIG)
+
+    assert str(compact['result'].dtype) == 'category'
+    assert str(compact['ファイル名'].dtype) == 'category'
+    assert compact['test_id'].dtype == STRING_DTYPE
+    assert str(compact['bug_no'].dtype) == 'category'
+    assert str(compact['qa_no'].dtype) == 'Int64'
+    assert compact['mixed'].dtype == object
+    assert compact['ratio'].dtype == float
+    # 값은 변하지 않음
+    assert compact['result'].tolist() == ['OK', 'NG', 'OK', 'XX']
+    assert compact['qa_no'].tolist()[:3] == [1, pd.NA, 2]
+
+def test_column_memory_sorted_by_bytes():
+    """컬럼별 메모리가 큰 순서대로 반환되는지 테스트"""
+    df = pd.DataFrame({'small': np.zeros(10, dtype=np.int8), 'large': ['x' * 100] * 10})
+
+    usage = column_memory(df)
+
+    assert usage['column'].tolist()[0] == 'large'
+    assert set(usage['column']) == {'Index', 'small', 'large'}
+    assert usage['bytes'].sum() == df.memory_usage(index=True, deep=True).sum()
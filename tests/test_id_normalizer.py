@@ -0,0 +1,54 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from id_normalizer import IdNormalizer, get_normalizer
+from table_creator import BugTableCreator
+
+def test_extract_numbers():
+    """re.search와 같은 규칙으로 번호를 추출하고, 일치하지 않는 값은 NA인지 테스트"""
+    normalizer = IdNormalizer(r'内部バグ#(\d+)', '内部バグ#{Int}')
+    values = pd.Series(['内部バグ#12', '[内部バグ#007]', 'BUG-1', None, 3.0], index=[10, 10, 11, 12, 13])
+
+    numbers = normalizer.extract_numbers(values)
+
+    assert numbers.tolist() == [12, 7, pd.NA, pd.NA, pd.NA]
+    assert list(numbers.index) == [10, 10, 11, 12, 13]
+    assert normalizer.unmatched(values).tolist() == [False, False, True, False, True]
+
+def test_render_and_normalize():
+    """번호로 ID를 만들고, 숫자만 입력된 ID만 템플릿 형식으로 바꾸는지 테스트"""
+    normalizer = IdNormalizer(r'内部QA#(\d+)', '内部QA#{Int}')
+
+    assert normalizer.render(pd.Series([1, 2.9, None])).tolist()[:2] == ['内部QA#1', '内部QA#2']
+    normalized = normalizer.normalize(pd.Series(['内部QA#5', '12', 7.0, 'メモ', np.nan, '1.2.3']))
+    assert normalized.tolist()[:4] == ['内部QA#5', '内部QA#12', '内部QA#7', 'メモ']
+    assert pd.isna(normalized.iloc[4])
+    assert normalized.iloc[5] == '1.2.3'
+
+def test_get_normalizer_is_shared():
+    """같은 설정값이면 같은 IdNormalizer(컴파일된 정규식)를 재사용하는지 테스트"""
+    assert get_normalizer(r'#(\d+)', '#{Int}') is get_normalizer(r'#(\d+)', '#{Int}')
+
+def test_bug_table_reports_unmatched_ids():
+    """정규식과 일치하지 않는 버그 번호가 표로 보고되는지 테스트"""
+    config = {
+        'result_column': 'result', 'test_id_column': 'test_id', 'test_name_column': 'test_name',
+        'bug_no_column': 'bug_no', 'bug_regex': r'内部バグ#(\d+)', 'bug_pattern_template': '内部バグ#{Int}',
+        'bug_file_columns': ['概要'],
+    }
+    merged_df = pd.DataFrame({
+        'test_id': ['T1', 'T2', 'T3'],
+        'test_name': ['A', 'B', 'C'],
+        'result': ['NG', 'NG', 'BK'],
+        'bug_no': ['内部バグ#1', 'JIRA-9', '内部バグ#1'],
+    })
+    creator = BugTableCreator(config, merged_df, lambda name: None)
+    creator.bug_data = pd.DataFrame({'No': [1], 'No_original': [1], '概要': ['不具合']})
+
+    bug_table = creator.create_table()
+
+    assert bug_table[['bug_no', '件数']].values.tolist() == [['内部バグ#1', 2]]
+    assert creator.unmatched_ids.values.tolist() == [['JIRA-9', 1, 'B']]
@@ -0,0 +1,60 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+from ok_calculator import CumulativeOKCalculator, DailyOKCalculator, WeeklyBurnUpCalculator, MovingAverageVelocityCalculator
+
+CONFIG = {'date_column': 'date', 'ok_velocity_window': 3}
+
+def _ok_table(dates, counts):
+    return pd.DataFrame({'date': pd.to_datetime(dates), 'OK': counts})
+
+def test_weekly_burn_up_and_velocity():
+    """주별 번업(월요일 시작)과 이동 평균 속도 계산 테스트"""
+    ok_table = _ok_table(['2024-01-01', '2024-01-03', '2024-01-08', '2024-01-09'], [2, 4, 3, 6])
+
+    weekly = WeeklyBurnUpCalculator().calculate(ok_table, CONFIG)
+    assert weekly['date'].tolist() == list(pd.to_datetime(['2024-01-01', '2024-01-08']))
+    assert weekly['OK'].tolist() == [6, 9]
+    assert weekly['OK_cumulative'].tolist() == [6, 15]
+
+    # 3일 이동 평균 (시험하지 않은 날은 0건)
+    velocity = MovingAverageVelocityCalculator().calculate(ok_table, CONFIG)
+    assert velocity['OK_velocity'].tolist() == pytest.approx([2 / 3, 6 / 3, 3 / 3, 9 / 3])
+
+@pytest.mark.parametrize('calculator_class', [CumulativeOKCalculator, DailyOKCalculator, WeeklyBurnUpCalculator, MovingAverageVelocityCalculator])
+def test_incremental_update_matches_full_calculation(calculator_class):
+    """날짜 추가/변경/삭제를 증분 반영한 결과가 전체 계산과 같은지 테스트"""
+    before = _ok_table(['2024-01-01', '2024-01-02', '2024-01-04', '2024-01-10'], [1, 2, 3, 4])
+    after = _ok_table(['2024-01-01', '2024-01-04', '2024-01-10', '2024-01-11', '2024-01-15'], [1, 5, 4, 2, 7])
+
+    calculator = calculator_class()
+    calculator.calculate(before, CONFIG)
+    updated = calculator.sync(after, CONFIG)
+
+    pd.testing.assert_frame_equal(updated, calculator_class().calculate(after, CONFIG))
+
+def test_update_only_recomputes_changed_dates():
+    """뒤에 날짜가 추가되면 이전 누적 값을 이어서 계산하는지 테스트"""
+    calculator = CumulativeOKCalculator()
+    calculator.calculate(_ok_table(['2024-01-01', '2024-01-02'], [5, 3]), CONFIG)
+
+    result = calculator.update(_ok_table(['2024-01-03'], [7]), CONFIG)
+    assert result['OK_cumulative'].tolist() == [5, 8, 15]
+
+    # 반환된 결과를 변경해도 보관 중인 상태에는 영향이 없음
+    result.loc[0, 'OK_cumulative'] = 100
+    result = calculator.update(_ok_table(['2024-01-02'], [4]), CONFIG, removed=[pd.Timestamp('2024-01-03')])
+    assert result['OK_cumulative'].tolist() == [5, 9]
+
+def test_clone_keeps_state_independently():
+    """복제한 계산기가 상태를 이어받고, 이후 갱신은 서로 영향을 주지 않는지 테스트"""
+    calculator = CumulativeOKCalculator()
+    calculator.calculate(_ok_table(['2024-01-01', '2024-01-02'], [5, 3]), CONFIG)
+    cloned = calculator.clone()
+
+    assert cloned.update(_ok_table(['2024-01-03'], [7]), CONFIG)['OK_cumulative'].tolist() == [5, 8, 15]
+    assert calculator.update(_ok_table(['2024-01-02'], [1]), CONFIG)['OK_cumulative'].tolist() == [5, 6]
+    assert cloned.sync(_ok_table(['2024-01-01', '2024-01-02', '2024-01-03'], [5, 3, 7]), CONFIG)['OK_cumulative'].tolist() == [5, 8, 15]
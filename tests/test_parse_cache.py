@@ -0,0 +1,119 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+import data_collector
+from data_collector import DataCollector
+from parse_cache import ParseCache
+
+@pytest.fixture
+def cache_config(tmp_path):
+    """테스트용 설정 데이터 (캐시 폴더 포함)"""
+    return {
+        'date_column': 'date',
+        'result_column': 'result',
+        'bug_no_column': 'bug_no',
+        'qa_no_column': 'qa_no',
+        'test_id_column': 'test_id',
+        'test_name_column': 'test_name',
+        'bug_file_name': 'bug_list.xlsx',
+        'qa_file_name': 'qa_list.xlsx',
+        'sheet_name': 'Sheet1',
+        'bug_file_columns': ['description'],
+        'qa_file_columns': ['description'],
+        'parse_cache_dir': str(tmp_path / 'cache')
+    }
+
+def _write_test_sheet(path, results):
+    pd.DataFrame({
+        'test_id': [f'T{i:03d}' for i in range(len(results))],
+        'test_name': [f'Test {i}' for i in range(len(results))],
+        'date': ['2024-01-01'] * len(results),
+        'result': results,
+        'bug_no': [None] * len(results),
+        'qa_no': [None] * len(results)
+    }).to_excel(path, sheet_name='Sheet1', index=False)
+
+def test_parse_cache_invalidation(cache_config, tmp_path):
+    """파일 변경, 설정 변경, 삭제 시 캐시가 무효화되는지 테스트"""
+    file_path = tmp_path / 'a.xlsx'
+    file_path.write_bytes(b'dummy')
+
+    cache = ParseCache(cache_config['parse_cache_dir'], cache_config)
+    cache.put(str(file_path), pd.DataFrame({'value': [1]}))
+
+    # 새 인스턴스에서도 항목이 유지됨
+    pd.testing.assert_frame_equal(ParseCache(cache_config['parse_cache_dir'], cache_config).get(str(file_path)), pd.DataFrame({'value': [1]}))
+
+    # 관련 설정값 변경 시 무효
+    changed_config = dict(cache_config, result_column='other')
+    assert ParseCache(cache_config['parse_cache_dir'], changed_config).get(str(file_path)) is None
+
+    # 파일 내용(크기) 변경 시 무효
+    file_path.write_bytes(b'dummy-changed')
+    assert cache.get(str(file_path)) is None
+
+    # 삭제된 파일은 prune으로 제거
+    cache.put(str(file_path), pd.DataFrame({'value': [2]}))
+    cache.prune([], root=str(tmp_path))
+    assert cache.get(str(file_path)) is None
+
+def test_shared_cache_dir_keeps_entries_of_other_instances(cache_config, tmp_path):
+    """같은 캐시 폴더를 쓰는 여러 인스턴스(프로세스/세션)가 서로의 항목을 지우지 않고, pickle 없이 값을 복원하는지 테스트"""
+    paths = [tmp_path / 'a.xlsx', tmp_path / 'b.xlsx']
+    for path in paths:
+        path.write_bytes(b'dummy')
+    frame = pd.DataFrame({
+        'No': ['1', None, 'x'],
+        'mixed': [1, 'a', float('nan')],
+        'date': pd.to_datetime(['2024-01-01', None, '2024-01-03'])
+    }).set_index('No')
+
+    first = ParseCache(cache_config['parse_cache_dir'], cache_config)
+    second = ParseCache(cache_config['parse_cache_dir'], cache_config)
+    first.put(str(paths[0]), frame)
+    second.put(str(paths[1]), frame.iloc[:1])
+    first.put(str(paths[0]), frame)
+
+    reopened = ParseCache(cache_config['parse_cache_dir'], cache_config)
+    pd.testing.assert_frame_equal(reopened.get(str(paths[0])), frame)
+    pd.testing.assert_frame_equal(reopened.get(str(paths[1])), frame.iloc[:1])
+    assert [type(value) for value in reopened.get(str(paths[0]))['mixed']] == [int, str, float]
+    # 항목마다 메타데이터 + 데이터 파일 한 쌍 (덮어쓴 이전 데이터 파일은 삭제)
+    assert sorted(os.path.splitext(name)[1] for name in os.listdir(cache_config['parse_cache_dir'])) == ['.json', '.json', '.parquet', '.parquet']
+
+def test_collect_uses_parse_cache(cache_config, tmp_path, monkeypatch):
+    """두 번째 수집 시 변경된 파일만 다시 읽고, 캐시를 거친 결과의 검증 결과가 원래 수집과 같은지 테스트"""
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    _write_test_sheet(data_dir / 'test_1.xlsx', ['OK', 'NG', 'XX'])
+    _write_test_sheet(data_dir / 'test_2.xlsx', ['OK', 'OK'])
+
+    first = DataCollector(str(data_dir), cache_config)
+    first_result = first.collect_data()
+
+    parsed = []
+    original = data_collector._read_excel_isolated
+    def counting_reader(config, file_path, reporter=None):
+        parsed.append(os.path.basename(file_path))
+        return original(config, file_path, reporter)
+    monkeypatch.setattr(data_collector, '_read_excel_isolated', counting_reader)
+
+    # 변경 없음: 다시 읽지 않고 같은 결과
+    second = DataCollector(str(data_dir), cache_config)
+    second_result = second.collect_data()
+    assert parsed == []
+    pd.testing.assert_frame_equal(first_result.merged_df, second_result.merged_df)
+    assert first.summaries == second.summaries
+    pd.testing.assert_frame_equal(first_result.findings, second_result.findings)
+    assert [(row['test_id'], row['result']) for row in second.invalid_results] == [('T002', 'XX')]
+    assert first.invalid_results == second.invalid_results
+
+    # 한 파일만 변경: 그 파일만 다시 읽음
+    _write_test_sheet(data_dir / 'test_2.xlsx', ['OK', 'OK', 'QA'])
+    third = DataCollector(str(data_dir), cache_config)
+    third.collect_data()
+    assert parsed == ['test_2.xlsx']
+    assert third.summaries[1]['QA'] == 1
@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+import pytest
+from result_cache import ResultCache
+
+def test_lru_eviction_by_entries_and_bytes():
+    """항목 수와 메모리 예산을 넘으면 오래된 항목부터 제거되는지 테스트"""
+    cache = ResultCache(max_entries=2, max_bytes=100, sizeof=lambda value: value['size'])
+
+    cache.get_or_compute('a', lambda: {'size': 10})
+    cache.get_or_compute('b', lambda: {'size': 10})
+    cache.get_or_compute('a', lambda: pytest.fail('캐시된 값을 사용해야 함'))
+    cache.get_or_compute('c', lambda: {'size': 10})  # 가장 오래 사용 안 한 b 제거
+    assert len(cache) == 2
+
+    computed = []
+    cache.get_or_compute('b', lambda: computed.append('b') or {'size': 10})
+    assert computed == ['b']
+
+    # 메모리 예산 초과 시 제거, 예산보다 큰 항목은 저장하지 않음
+    cache.get_or_compute('big', lambda: {'size': 95})
+    assert len(cache) == 1 and cache.total_bytes == 95
+    cache.get_or_compute('huge', lambda: {'size': 500})
+    assert cache.total_bytes == 95
+
+def test_concurrent_requests_share_one_computation():
+    """같은 키를 동시에 요청하면 계산이 한 번만 실행되는지 테스트"""
+    cache = ResultCache(max_entries=4, max_bytes=0, sizeof=lambda value: 0)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return 'result'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('key', compute))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ['result'] * 5
+
+def test_failed_computation_is_retried():
+    """계산 실패 시 결과가 캐시되지 않고 다음 요청에서 다시 계산되는지 테스트"""
+    cache = ResultCache(max_entries=4, max_bytes=0, sizeof=lambda value: 0)
+
+    def failing():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute('key', failing)
+    assert cache.get_or_compute('key', lambda: 'ok') == 'ok'
+
+def test_shared_caches_are_registered_by_name():
+    """같은 이름은 같은 캐시, 다른 이름은 별도 캐시를 반환하는지 테스트"""
+    from result_cache import get_shared_cache
+    export_cache = get_shared_cache('test_export', 1, 100, len)
+    assert get_shared_cache('test_export', 1, 100, len) is export_cache
+    assert get_shared_cache('test_other', 1, 100, len) is not export_cache
+
+    # 설정이 바뀌면 같은 캐시의 한도만 변경
+    assert get_shared_cache('test_export', 2, 200, len) is export_cache
+    assert (export_cache.max_entries, export_cache.max_bytes) == (2, 200)
+
+def test_clear_shared_caches():
+    """공유 캐시를 모두 비우고, 같은 이름으로 다시 사용할 수 있는지 테스트"""
+    from result_cache import get_shared_cache, clear_shared_caches
+    list_cache = get_shared_cache('test_list', 2, 100, len)
+    list_cache.get_or_compute('a', lambda: 'x')
+    get_shared_cache('test_other', 2, 100, len).get_or_compute('b', lambda: 'y')
+
+    clear_shared_caches()
+
+    assert len(list_cache) == 0 and list_cache.total_bytes == 0
+    assert len(get_shared_cache('test_other', 2, 100, len)) == 0
+    assert get_shared_cache('test_list', 2, 100, len) is list_cache
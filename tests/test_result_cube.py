@@ -0,0 +1,43 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from result_cube import build_result_cube, ok_counts, date_summary_table
+
+def _merged_df():
+    return pd.DataFrame({
+        'date': pd.to_datetime(['2024-01-02', '2024-01-01', '2024-01-02', '2024-01-02', '2024-01-01']),
+        'result': pd.Categorical(['OK', 'NG', 'OK', 'NG', 'QA']),
+        'test_id': ['T1', 'T2', 'T3', None, 'T5'],
+    })
+
+def test_build_result_cube_matches_pivot_table():
+    """큐브가 기존 pivot_table(count) 결과와 같은지 테스트"""
+    df = _merged_df()
+
+    cube = build_result_cube(df, 'date', 'result', 'test_id')
+
+    expected = df.pivot_table(index='date', columns='result', values='test_id', aggfunc='count', fill_value=0, observed=True)
+    assert cube.columns.tolist() == ['NG', 'OK', 'QA']
+    assert cube.values.tolist() == expected.values.tolist() == [[1, 0, 1], [0, 2, 0]]
+
+def test_ok_counts_without_ok_results():
+    """OK 결과가 없는 날짜/데이터는 0건으로 채워지는지 테스트"""
+    cube = build_result_cube(_merged_df().iloc[[1, 4]], 'date', 'result', 'test_id')
+
+    ok_table = ok_counts(cube, 'date')
+
+    assert ok_table.columns.tolist() == ['date', 'OK']
+    assert ok_table['OK'].tolist() == [0]
+    assert ok_counts(build_result_cube(pd.DataFrame(), 'date', 'result', 'test_id'), 'date').empty
+
+def test_date_summary_table_adds_total_row_and_column():
+    """날짜별 일람에 累計 행과 消化項目数 컬럼이 추가되는지 테스트"""
+    cube = build_result_cube(_merged_df(), 'date', 'result', 'test_id')
+
+    summary = date_summary_table(cube, 'date')
+
+    assert summary['date'].tolist() == ['2024-01-01', '2024-01-02', '累計']
+    assert summary.iloc[-1][['NG', 'OK', 'QA']].tolist() == [1, 2, 1]
+    assert summary['消化項目数'].tolist() == [2, 2, 4]
@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+from types import SimpleNamespace
+import pandas as pd
+import pytest
+from result_exporter import write_result_workbook, write_frame_csv, write_frame_parquet, export_bytes
+
+def _test_result():
+    merged = pd.DataFrame({
+        'test_id': ['T1', 'T2', 'T3'],
+        'date': pd.to_datetime(['2024-01-01', '2024-01-02', None]),
+        'result': pd.Categorical(['OK', 'NG', 'OK']),
+        'count': pd.array([1, None, 3], dtype='Int64'),
+        'mixed': [1, 'a', None],
+    })
+    empty = pd.DataFrame()
+    return SimpleNamespace(
+        summary_df=pd.DataFrame({'file': ['a.xlsx'], 'OK': [2]}),
+        merged_df=merged,
+        daily_ok_df=pd.DataFrame({'date': ['2024-01-01'], 'OK': [1]}),
+        cumulative_ok_df=pd.DataFrame({'date': ['2024-01-01'], 'OK': [1]}),
+        bug_table=empty, qa_table=empty, findings=empty,
+    )
+
+def test_workbook_matches_pandas_output():
+    """행 단위로 기록한 엑셀이 pandas.to_excel과 같은 내용인지 테스트"""
+    test_result = _test_result()
+    output = io.BytesIO()
+    write_result_workbook(test_result, output)
+
+    expected = io.BytesIO()
+    with pd.ExcelWriter(expected, engine='xlsxwriter') as writer:
+        test_result.merged_df.to_excel(writer, sheet_name='統合シート', index=False)
+
+    sheets = pd.read_excel(output, sheet_name=None)
+    assert list(sheets) == ['試験表別結果一覧', '統合シート', '日々のOK数グラフ', 'OK累計グラフ']
+    pd.testing.assert_frame_equal(sheets['統合シート'], pd.read_excel(expected, sheet_name='統合シート'))
+
+@pytest.mark.parametrize('chunk_rows', [1, 2, 100])
+def test_chunked_csv_and_parquet_round_trip(chunk_rows):
+    """청크 크기와 관계없이 CSV/Parquet 출력 내용이 같은지 테스트"""
+    df = _test_result().merged_df
+
+    csv = io.BytesIO()
+    write_frame_csv(df, csv, chunk_rows=chunk_rows)
+    assert csv.getvalue().startswith('﻿'.encode('utf-8'))
+    read_csv = pd.read_csv(io.BytesIO(csv.getvalue()), encoding='utf-8-sig')
+    assert read_csv['test_id'].tolist() == ['T1', 'T2', 'T3']
+    assert read_csv['mixed'].fillna('').astype(str).tolist() == ['1', 'a', '']
+
+    parquet = io.BytesIO()
+    write_frame_parquet(df, parquet, chunk_rows=chunk_rows)
+    read_parquet = pd.read_parquet(io.BytesIO(parquet.getvalue()))
+    assert read_parquet['count'].tolist() == [1, pd.NA, 3]
+    # 숫자와 문자열이 섞인 컬럼은 문자열로 출력
+    assert read_parquet['mixed'].tolist() == ['1', 'a', None]
+
+def test_export_bytes_rejects_unknown_format():
+    """지원하지 않는 출력 형식은 ValueError인지 테스트"""
+    with pytest.raises(ValueError):
+        export_bytes(_test_result(), 'pdf')
@@ -0,0 +1,43 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+from frame_schema import compact_frame
+from result_index import ResultIndex, INDEX_BUG, INDEX_QA, INDEX_RESULT, INDEX_FILE
+
+CONFIG = {'result_column': 'result', 'bug_no_column': 'bug_no', 'qa_no_column': 'qa_no', 'file_name_column': 'ファイル名'}
+
+def _merged_df():
+    return pd.DataFrame({
+        'test_id': ['T1', 'T2', 'T3', 'T4', 'T5', 'T6'],
+        'result': ['NG', 'QA', 'OK', 'BK', 'NG', 'QA'],
+        'bug_no': ['B1', None, 'B1', 'B1', 'B2', None],
+        'qa_no': [None, 'Q1', None, None, None, 'Q1'],
+        'ファイル名': ['a.xlsx', 'a.xlsx', 'b.xlsx', 'b.xlsx', 'b.xlsx', 'c.xlsx'],
+    })
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_select_matches_boolean_mask(compact):
+    """인덱스로 잘라낸 행이 기존 마스크 검색 결과와 같은지 테스트 (category 타입 포함)"""
+    df = _merged_df()
+    if compact:
+        df = compact_frame(df, CONFIG)
+    row_index = ResultIndex(df, CONFIG)
+
+    bug_mask = (df['bug_no'] == 'B1') & df['result'].isin(['NG', 'BK'])
+    pd.testing.assert_frame_equal(row_index.select(df, INDEX_BUG, 'B1'), df[bug_mask])
+    pd.testing.assert_frame_equal(row_index.select(df, INDEX_QA, 'Q1'), df[(df['qa_no'] == 'Q1') & (df['result'] == 'QA')])
+    pd.testing.assert_frame_equal(row_index.select(df, INDEX_RESULT, 'NG'), df[df['result'] == 'NG'])
+    assert row_index.select(df, INDEX_FILE, 'b.xlsx')['test_id'].tolist() == ['T3', 'T4', 'T5']
+    assert sorted(row_index.keys(INDEX_RESULT)) == ['BK', 'NG', 'OK', 'QA']
+    assert row_index.select(df, INDEX_BUG, '存在しない').empty
+
+def test_select_rejects_changed_frame():
+    """인덱스 생성 후 행 수가 바뀐 DataFrame에는 사용할 수 없는지 테스트"""
+    df = _merged_df()
+    row_index = ResultIndex(df, CONFIG)
+
+    with pytest.raises(ValueError):
+        row_index.select(df.iloc[:3], INDEX_RESULT, 'NG')
@@ -0,0 +1,74 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import pytest
+from validation import Validator, build_rules, FINDING_COLUMNS
+
+CATEGORIES = ['OK', 'NG', 'BK', 'NY', 'TS', 'QA', 'NT']
+
+@pytest.fixture
+def validation_config():
+    """테스트용 설정 데이터"""
+    return {
+        'result_column': 'result',
+        'test_id_column': 'test_id',
+        'bug_no_column': 'bug_no',
+        'qa_no_column': 'qa_no',
+        'file_name_column': 'file',
+    }
+
+@pytest.fixture
+def merged_df():
+    """두 파일을 병합한 형태의 시험 데이터"""
+    return pd.DataFrame({
+        'test_id': ['T001', 'T002', 'T003', 'T101', 'T102'],
+        'result': ['OK', 'XX', 'NG', 'QA', 'BK'],
+        'bug_no': [None, None, '', None, '内部バグ#1'],
+        'qa_no': [None, None, None, '', None],
+        'file': ['a.xlsx', 'a.xlsx', 'a.xlsx', 'b.xlsx', 'b.xlsx'],
+    })
+
+def test_default_rules(validation_config, merged_df):
+    """기본 규칙(부적절한 결과, QA/버그 번호 미입력)의 검증 결과 테스트"""
+    validator = Validator(build_rules(validation_config, CATEGORIES))
+
+    findings = validator.validate(merged_df, 'file', 'test_id', row_numbers=[2, 3, 5, 2, 3])
+
+    assert list(findings.columns) == FINDING_COLUMNS
+    assert findings.values.tolist() == [
+        ['a.xlsx', 3, 'T002', '不正な試験結果', 'XX'],
+        ['a.xlsx', 5, 'T003', 'バグ番号未入力', 'NG'],
+        ['b.xlsx', 2, 'T101', 'QA番号未入力', 'QA'],
+    ]
+
+def test_config_rules_are_added(validation_config, merged_df):
+    """설정(validation_rules)으로 추가한 규칙이 적용되는지 테스트"""
+    validation_config['validation_rules'] = [
+        {'type': 'pattern', 'name': 'バグ番号形式', 'column': 'bug_no', 'pattern': r'内部バグ#\d+'},
+        {'type': 'allowed_values', 'name': 'ファイル', 'column': 'file', 'values': ['a.xlsx']},
+    ]
+    merged_df.loc[0, 'bug_no'] = 'BUG-1'
+    validator = Validator(build_rules(validation_config, CATEGORIES))
+
+    findings = validator.validate(merged_df, 'file', 'test_id')
+
+    pattern_findings = findings[findings['ルール'] == 'バグ番号形式']
+    assert pattern_findings[['行番号', '値']].values.tolist() == [[2, 'BUG-1']]
+    assert (findings['ルール'] == 'ファイル').sum() == 2
+
+def test_invalid_rule_config_is_ignored(validation_config):
+    """잘못된 규칙 설정은 무시되고 기본 규칙만 남는지 테스트"""
+    validation_config['validation_rules'] = [{'type': 'unknown', 'name': 'x'}, {'type': 'pattern', 'name': 'y'}]
+
+    rules = build_rules(validation_config, CATEGORIES)
+
+    assert [rule.name for rule in rules] == ['不正な試験結果', 'QA番号未入力', 'バグ番号未入力']
+
+def test_empty_frame_returns_empty_findings(validation_config):
+    """데이터가 없으면 빈 검증 결과를 반환하는지 테스트"""
+    findings = Validator(build_rules(validation_config, CATEGORIES)).validate(pd.DataFrame(), 'file', 'test_id')
+
+    assert findings.empty
+    assert list(findings.columns) == FINDING_COLUMNS
@@ -0,0 +1,74 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zipfile
+from openpyxl import Workbook, load_workbook
+from xlsx_patcher import AttributePatch, patch_xlsx, ZOOM_100, WORKSHEET_CONTENT_TYPE
+
+def _write_workbook(path):
+    workbook = Workbook()
+    workbook.active.sheet_view.zoomScale = 85
+    workbook.active['A1'] = 'ID'
+    workbook.create_sheet('Other')
+    workbook.save(path)
+
+def test_attribute_patch_replaces_or_adds_attribute():
+    """속성이 있으면 값을 바꾸고, 없으면 추가하며, 비슷한 이름의 요소(sheetViews)는 건드리지 않는지 테스트"""
+    xml = b'<x:sheetViews><x:sheetView tabSelected="1" zoomScale="85"/><x:sheetView workbookViewId="1"></x:sheetView></x:sheetViews>'
+    assert ZOOM_100.apply(xml) == (
+        b'<x:sheetViews><x:sheetView tabSelected="1" zoomScale="100"/>'
+        b'<x:sheetView workbookViewId="1" zoomScale="100"></x:sheetView></x:sheetViews>'
+    )
+
+def test_attribute_patch_handles_single_quotes_and_gt_in_values():
+    """작은따옴표 속성, 값 안의 '>'와 속성 이름 문자열이 있어도 해당 속성만 바꾸는지 테스트"""
+    xml = b"<sheetView note='a > b zoomScale=\"5\"' zoomScale='85' view=\"normal\"><selection/></sheetView>"
+    assert ZOOM_100.apply(xml) == b"<sheetView note='a > b zoomScale=\"5\"' zoomScale=\"100\" view=\"normal\"><selection/></sheetView>"
+
+    # 속성이 없으면 태그 끝(값 안의 '>'가 아닌)에 추가
+    xml = b"<sheetView note='x>y'/>"
+    assert ZOOM_100.apply(xml) == b"<sheetView note='x>y' zoomScale=\"100\"/>"
+
+def test_attribute_patch_replaces_existing_attributes_and_escapes_values():
+    """여러 속성 중 기존 속성은 자리에서 바꾸고, 없는 속성은 추가하며, 값은 XML 문자로 이스케이프되는지 테스트"""
+    patch = AttributePatch(WORKSHEET_CONTENT_TYPE, 'pageSetup', {'orientation': 'landscape', 'paperSize': '9', 'note': 'a<"b">'})
+    xml = b'<pageSetup orientation = "portrait" scale="80"/>'
+    assert patch.apply(xml) == b'<pageSetup orientation = "landscape" scale="80" paperSize="9" note="a&lt;&quot;b&quot;&gt;"/>'
+
+def test_patch_xlsx_reads_single_quoted_content_types(tmp_path):
+    """[Content_Types].xml이 작은따옴표와 문자 참조를 사용해도 대상 부분을 찾는지 테스트"""
+    path = tmp_path / 'a.xlsx'
+    _write_workbook(path)
+    with zipfile.ZipFile(path) as archive:
+        parts = {info.filename: archive.read(info) for info in archive.infolist()}
+    content_types = parts['[Content_Types].xml'].replace(b'"', b"'")
+    parts['[Content_Types].xml'] = content_types.replace(b'spreadsheetml.worksheet+xml', b'spreadsheetml.worksheet&#43;xml')
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+    assert patch_xlsx(str(path), [ZOOM_100]) == 2
+    assert [sheet.sheet_view.zoomScale for sheet in load_workbook(path).worksheets] == [100, 100]
+
+def test_patch_xlsx_rewrites_only_target_parts(tmp_path):
+    """대상 워크시트 XML만 바뀌고 다른 부분은 내용이 그대로 복사되는지 테스트"""
+    path = tmp_path / 'a.xlsx'
+    _write_workbook(path)
+    with zipfile.ZipFile(path) as archive:
+        before = {info.filename: archive.read(info) for info in archive.infolist()}
+
+    assert patch_xlsx(str(path), [ZOOM_100]) == 2
+
+    with zipfile.ZipFile(path) as archive:
+        after = {info.filename: archive.read(info) for info in archive.infolist()}
+    assert list(after) == list(before)
+    changed = [name for name in before if before[name] != after[name]]
+    assert sorted(changed) == ['xl/worksheets/sheet1.xml', 'xl/worksheets/sheet2.xml']
+    workbook = load_workbook(path)
+    assert [sheet.sheet_view.zoomScale for sheet in workbook.worksheets] == [100, 100]
+    assert workbook.active['A1'].value == 'ID'
+    # 바뀔 내용이 없으면 파일을 다시 쓰지 않음
+    assert patch_xlsx(str(path), [ZOOM_100]) == 0
+    assert patch_xlsx(str(path), [AttributePatch(WORKSHEET_CONTENT_TYPE, 'missingElement', {'a': '1'})]) == 0
+    assert sorted(os.listdir(tmp_path)) == ['a.xlsx']
@@ -1,8 +1,16 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import io
 import os
+import json
+from result_exporter import export_bytes, EXPORT_FORMATS, EXCEL_MAX_ROWS
+from result_cache import get_shared_cache
+from diagnostics import Diagnostics
+from result_index import ResultIndex, INDEX_BUG, INDEX_QA, INDEX_RESULT
+from result_cube import date_summary_table
+
+# 진행 관리 화면의 섹션 (설정 display_sections의 기본값)
+DISPLAY_SECTIONS = ["summary", "detail", "bug_table", "qa_table", "charts", "export"]
 
 class UIManager:
     """UI 관련 로직을 담당하는 클래스"""
@@ -31,13 +39,37 @@ class UIManager:
             for key, default_value in DEFAULT_CONFIG.items():
                 current_value = user_config.get(key, default_value)
                 
-                if isinstance(default_value, list):
+                if self._is_json_setting(default_value, current_value):
+                    # 규칙 목록 등 구조가 있는 설정값 (예: validation_rules)은 JSON으로 편집
+                    value = st.text_area(
+                        f"{key} (JSON)",
+                        value=json.dumps(current_value, ensure_ascii=False, indent=2),
+                        key=f"settings_{key}"
+                    )
+                    try:
+                        updated_config[key] = json.loads(value) if value.strip() else default_value
+                    except ValueError as e:
+                        st.error(f"{key} のJSON形式が正しくありません。変更前の値を保持します: {str(e)}")
+                        updated_config[key] = current_value
+                elif isinstance(default_value, list):
                     value = st.text_area(
                         f"{key} (カンマ区切り)", 
                         value=", ".join(current_value) if isinstance(current_value, list) else str(current_value),
                         key=f"settings_{key}"
                     )
                     updated_config[key] = [v.strip() for v in value.split(",") if v.strip()]
+                elif isinstance(default_value, bool):
+                    # 켜기/끄기 설정값 (예: projected_read)
+                    if isinstance(current_value, str):
+                        current_value = current_value.strip().lower() in ("true", "1", "yes")
+                    updated_config[key] = st.checkbox(key, value=bool(current_value), key=f"settings_{key}")
+                elif isinstance(default_value, int):
+                    # 정수 설정값 (예: ingest_workers)은 숫자로 저장
+                    try:
+                        current_value = int(current_value)
+                    except (TypeError, ValueError):
+                        current_value = default_value
+                    updated_config[key] = int(st.number_input(key, value=current_value, step=1, key=f"settings_{key}"))
                 else:
                     updated_config[key] = st.text_input(key, value=str(current_value), key=f"settings_{key}")
             
@@ -49,6 +81,14 @@ class UIManager:
         
         return False, full_config
     
+    @staticmethod
+    def _is_json_setting(default_value, current_value):
+        """문자열 목록이 아닌 목록(빈 목록 기본값 포함)은 JSON으로 편집"""
+        if not isinstance(default_value, list):
+            return False
+        values = current_value if isinstance(current_value, list) else default_value
+        return not default_value or any(not isinstance(v, str) for v in values)
+    
     def show_progress_management(self, test_result, config):
         """진도 관리 화면 표시"""
         st.title("試験管理Tool 1.0.1")
@@ -98,6 +138,19 @@ class UIManager:
         
         return False
     
+    def show_watch_toggle(self):
+        """폴더 감시 모드 토글 표시"""
+        return st.toggle("フォルダー監視（保存されたファイルを自動で再集計）", key="watch_mode")
+    
+    def poll_folder_watcher(self, watcher, interval_seconds):
+        """감시 중 변경이 감지되면 화면 전체를 다시 실행"""
+        @st.fragment(run_every=interval_seconds)
+        def _poll():
+            if watcher.has_changes():
+                st.rerun()
+            st.caption(f"監視中: {', '.join(watcher.folders)} (最終確認 {datetime.now().strftime('%H:%M:%S')})")
+        _poll()
+    
     def show_delivery_work(self):
         """납품 작업 화면 표시"""
         st.title("納品作業Helper 1.0.0")
@@ -121,19 +174,83 @@ class UIManager:
         
         return False
     
+    def create_delivery_progress(self):
+        """
+        납품 작업의 진행 표시(진행률 바 + 파일별 결과 표)를 만들고, 파일 하나가 끝날 때마다 호출할 함수를 반환.
+        병렬 처리 시에는 끝난 순서대로 표에 추가된다.
+        """
+        progress_bar = st.progress(0.0, text="納品作業を開始します...")
+        table = st.empty()
+        rows = []
+        
+        def _on_result(result, done, total):
+            rows.append({
+                "ファイル": os.path.basename(result.file_path),
+                "結果": "OK" if result.ok else "エラー",
+                "処理時間(秒)": round(result.elapsed, 2),
+                "メッセージ": result.message,
+                "パス": result.file_path
+            })
+            progress_bar.progress(done / total, text=f"処理中: {done}/{total} ファイル")
+            table.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+            if done == total:
+                failed = sum(1 for row in rows if row["結果"] != "OK")
+                progress_bar.progress(1.0, text=f"完了: {total} ファイル（エラー {failed} 件）")
+        
+        return _on_result
+    
     def display_test_results(self, test_result, config):
         """테스트 결과 표시"""
         if test_result is None:
             return
         
+        # 화면 표시 단계별 소요 시간 측정
+        diagnostics = Diagnostics("display", trace_memory=bool(config.get("diagnostics_trace_memory", False)))
+        
+        # 설정(display_sections)에 포함된 섹션만 표시 (표시하지 않는 섹션의 표는 계산되지 않음)
+        sections = set(config.get("display_sections") or DISPLAY_SECTIONS)
+        
         # 요약 데이터 표시
-        st.markdown("<h4 style='color: #567ace; font-weight: bold;'>試験表別結果一覧</h4>", unsafe_allow_html=True)
-        st.dataframe(test_result.summary_df, use_container_width=True, hide_index=True)
+        if "summary" in sections:
+            with diagnostics.stage("summary"):
+                st.markdown("<h4 style='color: #567ace; font-weight: bold;'>試験表別結果一覧</h4>", unsafe_allow_html=True)
+                st.dataframe(test_result.summary_df, use_container_width=True, hide_index=True)
+                
+                # 검증 결과 표시 (문제가 있을 때만)
+                if not test_result.findings.empty:
+                    with st.expander(f"検証結果 ({len(test_result.findings)}件)"):
+                        st.dataframe(test_result.findings, use_container_width=True, hide_index=True)
         
         # 시험표 상세 데이터 표시
-        self._display_detail_results(test_result, config)
+        if "detail" in sections:
+            with diagnostics.stage("detail"):
+                self._display_detail_results(test_result, config)
         
         # 버그 테이블 표시
+        if "bug_table" in sections:
+            with diagnostics.stage("bug_table"):
+                self._display_bug_table(test_result, config)
+        
+        # QA 테이블 표시
+        if "qa_table" in sections:
+            with diagnostics.stage("qa_table"):
+                self._display_qa_table(test_result, config)
+        
+        # 그래프 표시
+        if "charts" in sections:
+            with diagnostics.stage("charts"):
+                self._display_charts(test_result, config)
+        
+        # 엑셀 다운로드 버튼
+        if "export" in sections:
+            with diagnostics.stage("export"):
+                self._create_export_download(test_result, config)
+        
+        # 진단 정보 (수집 + 화면 표시)
+        self._display_diagnostics(test_result.diagnostics, diagnostics.finish())
+    
+    def _display_bug_table(self, test_result, config):
+        """버그 테이블 및 버그 상세 표시"""
         st.markdown("<h4 style='color: #567ace; font-weight: bold;'>内部バグ一覧</h4>", unsafe_allow_html=True)
         if not test_result.bug_table.empty:
             st.dataframe(test_result.bug_table, use_container_width=True, hide_index=True)
@@ -145,18 +262,17 @@ class UIManager:
                     selected_bug = st.selectbox("表示したいバグ番号を選択してください", bug_numbers, key="bug_select")
                     show_bug = st.button("バグ詳細表示", key="show_bug_detail_btn")
                 if show_bug:
-                    bug_detail = test_result.merged_df[
-                        (test_result.merged_df[config["bug_no_column"]] == selected_bug) &
-                        (test_result.merged_df[config["result_column"]].isin(['NG', 'BK']))
-                    ]
+                    bug_detail = self._row_index(test_result, config).select(test_result.merged_df, INDEX_BUG, selected_bug)
                     if not bug_detail.empty:
                         st.dataframe(bug_detail, use_container_width=True, hide_index=True)
                     else:
                         st.warning("選択したバグ番号のデータがありません")
         else:
             st.write("内部バグデータがありません")
-        
-        # QA 테이블 표시
+        self._display_unmatched_ids(test_result, 'バグ')
+    
+    def _display_qa_table(self, test_result, config):
+        """QA 테이블 및 QA 상세 표시"""
         st.markdown("<h4 style='color: #567ace; font-weight: bold;'>内部QA一覧</h4>", unsafe_allow_html=True)
         if not test_result.qa_table.empty:
             st.dataframe(test_result.qa_table, use_container_width=True, hide_index=True)
@@ -168,34 +284,64 @@ class UIManager:
                     selected_qa = st.selectbox("表示したいQA番号を選択してください", qa_numbers, key="qa_select")
                     show_qa = st.button("QA詳細表示", key="show_qa_detail_btn")
                 if show_qa:
-                    qa_detail = test_result.merged_df[
-                        (test_result.merged_df[config["qa_no_column"]] == selected_qa) &
-                        (test_result.merged_df[config["result_column"]] == 'QA')
-                    ]
+                    qa_detail = self._row_index(test_result, config).select(test_result.merged_df, INDEX_QA, selected_qa)
                     if not qa_detail.empty:
                         st.dataframe(qa_detail, use_container_width=True, hide_index=True)
                     else:
                         st.warning("選択したQA番号のデータがありません")
         else:
             st.write("内部QAデータがありません")
-        
-        # 그래프 표시
-        self._display_charts(test_result, config)
-        
-        # 엑셀 다운로드 버튼
-        self._create_excel_download(test_result)
+        self._display_unmatched_ids(test_result, 'QA')
+    
+    def _row_index(self, test_result, config):
+        """상세 보기용 행 인덱스 (인덱스가 없거나 merged_df와 맞지 않으면 여기서 한 번 생성)"""
+        row_index = test_result.row_index
+        if row_index is None or row_index.num_rows != len(test_result.merged_df):
+            row_index = ResultIndex(test_result.merged_df, config)
+            test_result.row_index = row_index
+        return row_index
+    
+    def _display_unmatched_ids(self, test_result, kind):
+        """형식(정규식)이 일치하지 않아 목록과 연결하지 못한 ID 표시"""
+        if test_result.unmatched_ids.empty:
+            return
+        unmatched = test_result.unmatched_ids[test_result.unmatched_ids['種別'] == kind]
+        if not unmatched.empty:
+            with st.expander(f"形式が一致しない{kind}番号 ({len(unmatched)}件)"):
+                st.dataframe(unmatched.drop(columns=['種別']), use_container_width=True, hide_index=True)
+    
+    def _display_diagnostics(self, collect_diagnostics, display_diagnostics):
+        """진단 정보 패널 (단계별/파일별 소요 시간, 피크 메모리)"""
+        with st.expander("診断情報（処理時間・メモリ）", expanded=False):
+            if collect_diagnostics is not None:
+                st.markdown(f"**集計処理** ({collect_diagnostics.pipeline}): 合計 {collect_diagnostics.total_seconds:.2f}秒")
+                st.dataframe(collect_diagnostics.stage_frame(), use_container_width=True, hide_index=True)
+                slowest = collect_diagnostics.slowest_file()
+                if slowest is not None:
+                    st.caption(f"最も時間がかかったファイル: {os.path.basename(slowest['file'])} ({slowest['seconds']:.2f}秒, {slowest['rows']}行)")
+                    st.dataframe(collect_diagnostics.file_frame(), use_container_width=True, hide_index=True)
+                if collect_diagnostics.memory:
+                    st.caption("カラム別メモリ使用量")
+                    st.dataframe(collect_diagnostics.memory_frame(), use_container_width=True, hide_index=True)
+            st.markdown(f"**画面表示**: 合計 {display_diagnostics.total_seconds:.2f}秒")
+            st.dataframe(display_diagnostics.stage_frame(), use_container_width=True, hide_index=True)
+            if not display_diagnostics.trace_memory:
+                st.caption("ピークメモリを計測するには、設定で diagnostics_trace_memory を有効にしてください。")
+            else:
+                st.caption("ピークメモリはプロセス全体の値です。他のセッションの処理と重なった場合は、その分も含まれます。")
     
     def _display_detail_results(self, test_result, config):
         """상세 결과 표시"""
         col1, col2 = st.columns([1, 4]) # 드롭다운의 폭을 조절하기 위해서 두 개의 컬럼을 사용
         
         with col1:
-            result_categories = sorted(test_result.merged_df[config["result_column"]].dropna().unique().tolist())
+            # 선택지는 날짜×결과 큐브의 컬럼 (행 인덱스는 상세 표시 버튼을 눌렀을 때만 생성)
+            result_categories = sorted(test_result.result_cube.columns.tolist())
             selected_category = st.selectbox("表示したい試験結果を選択してください", result_categories, key="result_category")
             show_detail = st.button("項目詳細表示", key="show_detail_btn")
         
         if show_detail:
-            detail_df = test_result.merged_df[test_result.merged_df[config["result_column"]] == selected_category]
+            detail_df = self._row_index(test_result, config).select(test_result.merged_df, INDEX_RESULT, selected_category)
             if not detail_df.empty:
                 st.dataframe(detail_df, use_container_width=True, hide_index=True)
             else:
@@ -205,35 +351,10 @@ class UIManager:
         """차트 표시"""
         # 날짜별 시험 결과 일람 (전체 카테고리)
         st.markdown("<h4 style='color: #567ace; font-weight: bold;'>日付別試験結果一覧</h4>", unsafe_allow_html=True)
-        if not test_result.merged_df.empty and config["date_column"] in test_result.merged_df.columns:
-            # 날짜별로 그룹화하여 각 결과 카테고리별 개수 계산
-            date_summary = test_result.merged_df.pivot_table(
-                index=config["date_column"],
-                columns=config["result_column"],
-                values=config["test_id_column"],
-                aggfunc='count',
-                fill_value=0
-            ).reset_index()
-            
-            # 날짜 형식 조정
-            date_summary[config["date_column"]] = date_summary[config["date_column"]].dt.strftime('%Y-%m-%d')
-            
-            # 누계 행 추가
-            total_row = {}
-            total_row[config["date_column"]] = "累計"
-            
-            # 각 결과 카테고리별 합계 계산
-            for col in date_summary.columns:
-                if col != config["date_column"]:
-                    total_row[col] = date_summary[col].sum()
-            
-            # 누계 행을 데이터프레임으로 변환하고 기존 데이터프레임에 추가
-            total_df = pd.DataFrame([total_row])
-            date_summary_with_total = pd.concat([date_summary, total_df], ignore_index=True)
-            
-            # 각 날짜별 합계 열 추가
-            result_columns = [col for col in date_summary_with_total.columns if col != config["date_column"]]
-            date_summary_with_total['消化項目数'] = date_summary_with_total[result_columns].sum(axis=1)
+        if not test_result.result_cube.empty:
+            # 수집 시 계산된 날짜×결과 큐브로 일람 생성 (merged_df 전체를 다시 집계하지 않음)
+            date_summary_with_total = date_summary_table(test_result.result_cube, config["date_column"])
+            result_columns = list(test_result.result_cube.columns)
             
             # 누계 행을 위한 스타일링 인덱스 확인 (마지막 행)
             last_row_idx = len(date_summary_with_total) - 1
@@ -284,6 +405,23 @@ class UIManager:
             st.line_chart(data=plot_cumulative_ok_df.set_index(config["date_column"])['OK_cumulative'])
         else:
             st.write("OK 累積データがありません")
+        
+        # 주별 번업 그래프 (주별 OK 건수와 누적)
+        st.markdown("<h4 style='color: #567ace; font-weight: bold;'>週別 OKバーンアップ</h4>", unsafe_allow_html=True)
+        if not test_result.weekly_ok_df.empty:
+            plot_weekly_ok_df = self._prepare_date_data(test_result.weekly_ok_df, config)
+            st.line_chart(data=plot_weekly_ok_df.set_index(config["date_column"])[['OK', 'OK_cumulative']])
+        else:
+            st.write("週別 OK データがありません")
+        
+        # 이동 평균 속도 그래프
+        window = int(config.get("ok_velocity_window", 7))
+        st.markdown(f"<h4 style='color: #567ace; font-weight: bold;'>OK消化速度（{window}日移動平均）</h4>", unsafe_allow_html=True)
+        if not test_result.ok_velocity_df.empty:
+            plot_velocity_df = self._prepare_date_data(test_result.ok_velocity_df, config)
+            st.line_chart(data=plot_velocity_df.set_index(config["date_column"])['OK_velocity'])
+        else:
+            st.write("OK 消化速度データがありません")
     
     def _prepare_date_data(self, df, config):
         """날짜 데이터 전처리"""
@@ -294,29 +432,48 @@ class UIManager:
         plot_df[config["date_column"]] = plot_df[config["date_column"]].dt.strftime('%Y-%m-%d')
         return plot_df
     
-    def _create_excel_download(self, test_result):
-        """엑셀 다운로드 생성"""
-        todayhhmm = datetime.today().strftime('%Y%m%d_%H%M')
-        result_filename = f'result_{todayhhmm}.xlsx'
-        output = io.BytesIO()
-        
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            test_result.summary_df.to_excel(writer, index=False, sheet_name='試験表別結果一覧')
-            test_result.merged_df.to_excel(writer, index=False, sheet_name='統合シート')
-            test_result.daily_ok_df.to_excel(writer, index=False, sheet_name='日々のOK数グラフ')
-            test_result.cumulative_ok_df.to_excel(writer, index=False, sheet_name='OK累計グラフ')
-            if not test_result.bug_table.empty:
-                test_result.bug_table.to_excel(writer, index=False, sheet_name='内部バグ一覧')
-            if not test_result.qa_table.empty:
-                test_result.qa_table.to_excel(writer, index=False, sheet_name='内部QA一覧')
-        
-        writer.close()
-        data = output.getvalue()
+    def _create_export_download(self, test_result, config):
+        """
+        결과 출력 다운로드.
+        출력 데이터는 '出力データ作成' 버튼을 눌렀을 때만 만들고, 결과 지문(fingerprint)별로 캐시한다.
+        """
+        col1, col2 = st.columns([1, 4])
+        with col1:
+            export_format = st.selectbox(
+                "出力形式を選択してください", list(EXPORT_FORMATS),
+                format_func=lambda key: EXPORT_FORMATS[key][0], key="export_format"
+            )
+            if st.button("出力データ作成", key="export_create_btn"):
+                st.session_state.export_request = (self._export_key(test_result), export_format)
+        with col2:
+            if len(test_result.merged_df) >= EXCEL_MAX_ROWS:
+                st.caption("統合シートが Excel の最大行数を超えています。CSV または Parquet で出力してください。")
+        
+        # 버튼을 누른 결과/형식과 현재 결과/형식이 같을 때만 다운로드 버튼 표시
+        if st.session_state.get("export_request") != (self._export_key(test_result), export_format):
+            return
+        label, extension, mime = EXPORT_FORMATS[export_format]
+        export_cache = get_shared_cache(
+            "export",
+            max_entries=int(config.get("export_cache_max_entries", 4)),
+            max_bytes=int(config.get("export_cache_max_mb", 256)) * 1024 ** 2,
+            sizeof=len
+        )
+        with st.spinner("出力データを作成しています..."):
+            data = export_cache.get_or_compute(
+                (self._export_key(test_result), export_format),
+                lambda: export_bytes(test_result, export_format)
+            )
         
+        todayhhmm = datetime.today().strftime('%Y%m%d_%H%M')
         st.download_button(
-            label="Excelファイルダウンロード",
+            label=f"{label}ダウンロード",
             data=data,
-            file_name=result_filename,
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            key="excel_download_btn"
-        ) 
\ No newline at end of file
+            file_name=f'result_{todayhhmm}{extension}',
+            mime=mime,
+            key="export_download_btn"
+        )
+    
+    def _export_key(self, test_result):
+        """출력 캐시 키 (지문이 없는 결과는 객체 단위)"""
+        return test_result.fingerprint or f"id:{id(test_result)}"
@@ -0,0 +1,194 @@
+# 시험표 데이터 검증 규칙 관련
+
+import re
+import logging
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+# 검증 결과(findings) DataFrame 컬럼
+FINDING_FILE = 'ファイル名'
+FINDING_ROW = '行番号'
+FINDING_TEST_ID = 'テストID'
+FINDING_RULE = 'ルール'
+FINDING_VALUE = '値'
+FINDING_COLUMNS = [FINDING_FILE, FINDING_ROW, FINDING_TEST_ID, FINDING_RULE, FINDING_VALUE]
+
+# 기본 규칙 이름 (CLI 출력, 기존 목록(invalid_results 등) 호환용)
+RULE_INVALID_RESULT = '不正な試験結果'
+RULE_QA_NO_MISSING = 'QA番号未入力'
+RULE_BUG_NO_MISSING = 'バグ番号未入力'
+
+
+def _is_blank(series: pd.Series) -> pd.Series:
+    return series.isna() | (series == '')
+
+
+class ValidationRule(Protocol):
+    """검증 규칙 인터페이스"""
+    name: str
+
+    def columns(self) -> list:
+        """규칙에 필요한 컬럼 목록"""
+        pass
+
+    def value_column(self) -> str:
+        """검증 결과의 '値'로 표시할 컬럼"""
+        pass
+
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        """위반 행이 True인 불리언 마스크"""
+        pass
+
+
+@dataclass
+class AllowedValuesRule:
+    """column 값이 values 중 하나여야 함 (빈 값은 검사하지 않음)"""
+    name: str
+    column: str
+    values: list
+
+    def columns(self):
+        return [self.column]
+
+    def value_column(self):
+        return self.column
+
+    def mask(self, df):
+        return df[self.column].notna() & ~df[self.column].isin(self.values)
+
+
+@dataclass
+class RequiredWhenRule:
+    """when_column 값이 when_values 중 하나이면 column은 필수"""
+    name: str
+    column: str
+    when_column: str
+    when_values: list
+
+    def columns(self):
+        return [self.column, self.when_column]
+
+    def value_column(self):
+        return self.when_column
+
+    def mask(self, df):
+        return df[self.when_column].isin(self.when_values) & _is_blank(df[self.column])
+
+
+@dataclass
+class PatternRule:
+    """column 값이 정규식 pattern과 완전히 일치해야 함 (빈 값은 검사하지 않음)"""
+    name: str
+    column: str
+    pattern: str
+    _compiled: Optional[re.Pattern] = field(default=None, init=False, repr=False)
+
+    def columns(self):
+        return [self.column]
+
+    def value_column(self):
+        return self.column
+
+    def mask(self, df):
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern)
+        values = df[self.column]
+        matched = values.astype(str).str.fullmatch(self._compiled)
+        return ~_is_blank(values) & ~matched.fillna(False).astype(bool)
+
+
+# 설정(validation_rules)에서 사용할 수 있는 규칙 종류
+RULE_TYPES = {
+    "allowed_values": AllowedValuesRule,
+    "required_when": RequiredWhenRule,
+    "pattern": PatternRule,
+}
+
+
+def rule_from_config(spec: dict) -> ValidationRule:
+    """
+    설정값 하나로 규칙 생성.
+    예: {"type": "pattern", "name": "バグ番号形式", "column": "バグ_DB_No", "pattern": "内部バグ#\\d+"}
+    """
+    spec = dict(spec)
+    rule_type = spec.pop("type", None)
+    if rule_type not in RULE_TYPES:
+        raise ValueError(f"未対応の検証ルールです: {rule_type}")
+    return RULE_TYPES[rule_type](**spec)
+
+
+def default_rules(config, categories) -> list:
+    """기존에 하드코딩되어 있던 3가지 검증 (부적절한 시험 결과, QA/버그 번호 미입력)"""
+    result_col = config["result_column"]
+    return [
+        AllowedValuesRule(RULE_INVALID_RESULT, result_col, list(categories)),
+        RequiredWhenRule(RULE_QA_NO_MISSING, config["qa_no_column"], result_col, ['QA']),
+        RequiredWhenRule(RULE_BUG_NO_MISSING, config["bug_no_column"], result_col, ['NG', 'BK']),
+    ]
+
+
+def build_rules(config, categories) -> list:
+    """기본 규칙 + 설정(validation_rules)에 추가된 규칙. 잘못된 설정은 경고 후 무시"""
+    rules = default_rules(config, categories)
+    for spec in config.get("validation_rules") or []:
+        try:
+            rules.append(rule_from_config(spec))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"検証ルールの設定が不正なため無視します: {spec} ({str(e)})")
+    return rules
+
+
+def empty_findings() -> pd.DataFrame:
+    return pd.DataFrame(columns=FINDING_COLUMNS)
+
+
+class Validator:
+    """병합된 시험표 데이터 전체에 규칙을 벡터 연산(마스크)으로 적용"""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+
+    def validate(self, df, file_column, test_id_column, row_numbers=None) -> pd.DataFrame:
+        """
+        규칙 위반 행을 하나의 DataFrame(ファイル名, 行番号, テストID, ルール, 値)으로 반환.
+        row_numbers는 df 각 행의 원본 엑셀 행 번호 (생략 시 index + 2).
+        결과는 병합 데이터의 행 순서, 같은 행은 규칙 순서로 정렬.
+        """
+        if df.empty or not self.rules:
+            return empty_findings()
+        if row_numbers is None:
+            row_numbers = df.index.to_numpy() + 2
+        row_numbers = np.asarray(row_numbers)
+        file_names = df[file_column].to_numpy() if file_column in df.columns else np.full(len(df), '')
+        test_ids = df[test_id_column].to_numpy() if test_id_column in df.columns else np.full(len(df), None)
+
+        positions, rule_orders, rule_names, values = [], [], [], []
+        for rule_order, rule in enumerate(self.rules):
+            missing = [col for col in rule.columns() if col not in df.columns]
+            if missing:
+                logger.warning(f"検証ルール '{rule.name}' に必要な列がないためスキップします: {', '.join(missing)}")
+                continue
+            hit = np.flatnonzero(rule.mask(df).to_numpy(dtype=bool))
+            if hit.size == 0:
+                continue
+            positions.append(hit)
+            rule_orders.append(np.full(hit.size, rule_order))
+            rule_names.append(np.full(hit.size, rule.name, dtype=object))
+            values.append(df[rule.value_column()].to_numpy(dtype=object)[hit])
+
+        if not positions:
+            return empty_findings()
+        positions = np.concatenate(positions)
+        order = np.lexsort((np.concatenate(rule_orders), positions))
+        positions = positions[order]
+        return pd.DataFrame({
+            FINDING_FILE: file_names[positions],
+            FINDING_ROW: row_numbers[positions],
+            FINDING_TEST_ID: test_ids[positions],
+            FINDING_RULE: np.concatenate(rule_names)[order],
+            FINDING_VALUE: np.concatenate(values)[order],
+        })
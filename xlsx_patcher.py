@@ -0,0 +1,124 @@
+# xlsx 파일의 XML 패치 (zip 안의 해당 부분만 다시 쓰기) 관련
+
+import os
+import re
+import shutil
+import html
+import zipfile
+import tempfile
+import logging
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+# 워크시트 XML의 content type
+WORKSHEET_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+# 시작 태그의 속성 부분 (따옴표 안의 '>'는 태그의 끝으로 보지 않는다)
+_TAG_BODY = rb'''(?:[^>"']|"[^"]*"|'[^']*')*'''
+# 속성 하나 (이름 = "값" 또는 '값'). 태그 이름 뒤부터 차례로 찾으므로 값 안의 문자열과는 일치하지 않는다
+_ATTRIBUTE_PATTERN = re.compile(rb'''(\s+)([\w:.-]+)(\s*=\s*)("[^"]*"|'[^']*')''')
+
+
+@dataclass(frozen=True)
+class AttributePatch:
+    """
+    content_type 부분(XML)의 element 요소 시작 태그에 attributes 값을 설정하는 패치.
+    속성이 있으면 값을 바꾸고, 없으면 추가한다. 요소는 네임스페이스 접두사와 관계없이 이름으로 찾는다
+    """
+    content_type: str
+    element: str
+    attributes: dict = field(default_factory=dict)
+
+    def apply(self, data: bytes) -> bytes:
+        """XML 바이트에 패치를 적용 (해당 요소가 없으면 그대로 반환)"""
+        return _tag_pattern(self.element).sub(self._patch_tag, data)
+
+    def _patch_tag(self, match) -> bytes:
+        tag, body_start = match.group(0), match.end(1) - match.start(0)
+        for name, value in self.attributes.items():
+            name = name.encode()
+            value = html.escape(str(value), quote=True).encode()
+            existing = _attributes(tag, body_start).get(name)
+            if existing is not None:
+                start, end = existing.span(4)
+                tag = tag[:start] + b'"%s"' % value + tag[end:]
+            else:
+                end = len(tag) - (2 if tag.endswith(b'/>') else 1)
+                tag = tag[:end].rstrip() + b' %s="%s"' % (name, value) + tag[end:]
+        return tag
+
+
+def _tag_pattern(element):
+    """element 요소의 시작 태그 (네임스페이스 접두사 허용, 같은 이름으로 시작하는 다른 요소는 제외)"""
+    return re.compile(rb'<((?:[\w.-]+:)?%s)(?=[\s/>])%s>' % (re.escape(element.encode()), _TAG_BODY))
+
+
+def _attributes(tag, body_start):
+    """시작 태그의 속성 이름 → 일치 결과 (body_start: 태그 이름 바로 뒤 위치)"""
+    return {match.group(2): match for match in _ATTRIBUTE_PATTERN.finditer(tag, body_start)}
+
+
+def _attribute_value(match):
+    """속성 일치 결과의 값 (따옴표 제거, 문자 참조 해석)"""
+    return html.unescape(match.group(4)[1:-1].decode())
+
+
+# 모든 워크시트의 확대 비율을 100%로
+ZOOM_100 = AttributePatch(WORKSHEET_CONTENT_TYPE, "sheetView", {"zoomScale": "100"})
+
+
+def parts_by_content_type(archive: zipfile.ZipFile) -> dict:
+    """[Content_Types].xml의 Override 항목에서 content type → 부분 경로 목록"""
+    parts = {}
+    for match in _tag_pattern("Override").finditer(archive.read(CONTENT_TYPES_PART)):
+        attributes = _attributes(match.group(0), match.end(1) - match.start(0))
+        part_name, content_type = attributes.get(b'PartName'), attributes.get(b'ContentType')
+        if part_name and content_type:
+            parts.setdefault(_attribute_value(content_type), []).append(_attribute_value(part_name).lstrip('/'))
+    return parts
+
+
+def patch_xlsx(file_path, patches) -> int:
+    """
+    xlsx(zip) 안에서 patches 대상 XML 부분만 다시 쓰고, 나머지 부분은 내용을 그대로 복사.
+    워크북을 열어 다시 저장하지 않으므로 openpyxl이 지원하지 않는 기능도 유지된다.
+    같은 폴더의 임시 파일에 쓴 뒤 교체하며, 변경된 부분이 없으면 파일을 건드리지 않는다. 변경된 부분 수를 반환
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        parts = parts_by_content_type(archive)
+        targets = {}
+        for patch in patches:
+            for part_name in parts.get(patch.content_type, []):
+                targets.setdefault(part_name, []).append(patch)
+
+        patched = {}
+        for part_name, part_patches in targets.items():
+            try:
+                original = archive.read(part_name)
+            except KeyError:
+                logger.warning(f"Content Typesに登録された部品が見つかりません: {file_path} ({part_name})")
+                continue
+            data = original
+            for patch in part_patches:
+                data = patch.apply(data)
+            if data != original:
+                patched[part_name] = data
+        if not patched:
+            return 0
+
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(file_path)))
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(temp_path, "w") as output:
+                output.comment = archive.comment
+                for info in archive.infolist():
+                    data = patched[info.filename] if info.filename in patched else archive.read(info)
+                    output.writestr(info, data)
+            shutil.copymode(file_path, temp_path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+    os.replace(temp_path, file_path)
+    return len(patched)